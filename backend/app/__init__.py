@@ -1 +1,3 @@
+import time
 
+IMPORT_STARTED = time.perf_counter()
@@ -0,0 +1,59 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.api.cards import parse_if_match
+from app.config import settings
+from app.database import DbSession, get_db, get_read_db, run_db
+from app.responses import OrjsonResponse
+from app.schemas.archive import ArchiveResponse, ArchivedCardResponse
+from app.services.archive_service import ArchiveService
+from app.services.board_service import InvalidCursor
+
+router = APIRouter(tags=["archive"])
+
+
+@router.post("/cards/{card_id}/archive", status_code=204)
+async def archive_card(
+    card_id: str,
+    expected_version: Optional[int] = Depends(parse_if_match),
+    db: DbSession = Depends(get_db),
+):
+    if not await run_db(db, lambda session: ArchiveService(session).archive_card(card_id, expected_version)):
+        raise HTTPException(status_code=404, detail="Card not found")
+
+
+@router.post("/boards/{board_id}/columns/{column_id}/archive", response_model=ArchiveResponse)
+async def archive_column(
+    board_id: str,
+    column_id: str,
+    older_than_days: Optional[int] = Query(default=None, ge=0),
+    db: DbSession = Depends(get_db),
+):
+    archived = await run_db(
+        db,
+        lambda session: ArchiveService(session).archive_column(
+            board_id, column_id, older_than_days, settings.delete_chunk_size
+        ),
+    )
+    if archived is None:
+        raise HTTPException(status_code=404, detail="Column not found")
+    return ArchiveResponse(archived=archived)
+
+
+@router.get("/boards/{board_id}/archive", response_model=list[ArchivedCardResponse])
+async def list_archived_cards(
+    board_id: str,
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    db: DbSession = Depends(get_read_db),
+):
+    try:
+        result = await run_db(db, lambda session: ArchiveService(session).list_archived(board_id, limit, cursor))
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if result is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    cards, next_cursor = result
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return OrjsonResponse(cards, headers=headers)
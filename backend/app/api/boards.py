@@ -1,29 +1,147 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Optional
 
-from app.database import get_db
-from app.schemas.board import BoardCreate, BoardResponse, BoardDetailResponse
-from app.services.board_service import BoardService
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.compression import choose_encoding
+from app.config import settings
+from app.database import DbSession, get_db, get_read_db, run_db, run_in_new_session
+from app.responses import OrjsonResponse
+from app.schemas.board import (
+    BoardChangesResponse, BoardCreate, BoardResponse, BoardDetailResponse, BoardListItem,
+)
+from app.schemas.transfer import BoardImportResponse
+from app.services.board_service import BoardService, InvalidCursor
+from app.services.board_transfer_service import (
+    BoardImporter, BoardTransferService, InvalidImport, export_board_ndjson, iter_ndjson_lines,
+)
 
 router = APIRouter(prefix="/boards", tags=["boards"])
 
 
+def board_etag(version: int) -> str:
+    return f'W/"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in candidates)
+
+
 @router.post("", response_model=BoardResponse)
-def create_board(data: BoardCreate, db: Session = Depends(get_db)):
-    service = BoardService(db)
-    return service.create_board(data)
+async def create_board(data: BoardCreate, db: DbSession = Depends(get_db)):
+    return await run_db(db, lambda session: BoardService(session).create_board(data))
 
 
-@router.get("", response_model=list[BoardResponse])
-def list_boards(db: Session = Depends(get_db)):
-    service = BoardService(db)
-    return service.list_boards()
+@router.get("", response_model=list[BoardListItem], response_model_exclude_none=True)
+async def list_boards(
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    name_prefix: Optional[str] = Query(default=None, min_length=1),
+    include_counts: bool = False,
+    db: DbSession = Depends(get_read_db),
+):
+    try:
+        boards, next_cursor = await run_db(
+            db,
+            lambda session: BoardService(session).list_boards(limit, cursor, name_prefix, include_counts),
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return OrjsonResponse(boards, headers=headers)
 
 
 @router.get("/{board_id}", response_model=BoardDetailResponse)
-def get_board(board_id: str, db: Session = Depends(get_db)):
-    service = BoardService(db)
-    board = service.get_board(board_id)
-    if not board:
+async def get_board(
+    board_id: str,
+    cards_limit: Optional[int] = Query(default=None, ge=0, le=1000),
+    if_none_match: Optional[str] = Header(default=None),
+    accept_encoding: Optional[str] = Header(default=None),
+    db: DbSession = Depends(get_read_db),
+):
+    version = await run_db(db, lambda session: BoardService(session).get_board_version(board_id))
+    if version is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    etag = board_etag(version)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    snapshot = await run_db(
+        db, lambda session: BoardService(session).get_board_snapshot(board_id, version, cards_limit)
+    )
+    if not snapshot:
+        raise HTTPException(status_code=404, detail="Board not found")
+    headers["ETag"] = board_etag(snapshot.version)
+    body = snapshot.body
+    encoding = choose_encoding(accept_encoding) if settings.compression_enabled else None
+    if encoding and len(body) >= settings.compression_minimum_size:
+        # Compressed once per cached snapshot; the middleware passes encoded responses through.
+        body = snapshot.encoded.get(encoding) or await run_in_threadpool(snapshot.encode, encoding)
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/{board_id}/changes", response_model=BoardChangesResponse)
+async def get_board_changes(
+    board_id: str,
+    since: int = Query(ge=0),
+    limit: int = Query(default=500, ge=1, le=1000),
+    # A lagging replica would answer "reset" to a client that is merely ahead of it.
+    db: DbSession = Depends(get_db),
+):
+    changes = await run_db(db, lambda session: BoardService(session).get_changes(board_id, since, limit))
+    if changes is None:
         raise HTTPException(status_code=404, detail="Board not found")
-    return board
+    return OrjsonResponse(changes)
+
+
+@router.delete("/{board_id}", status_code=204)
+async def delete_board(
+    board_id: str,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    db: DbSession = Depends(get_db),
+):
+    if background:
+        if await run_db(db, lambda session: BoardService(session).get_board_version(board_id)) is None:
+            raise HTTPException(status_code=404, detail="Board not found")
+        background_tasks.add_task(
+            run_in_new_session,
+            lambda session: BoardService(session).purge_board(board_id, settings.delete_chunk_size),
+        )
+        return Response(status_code=202)
+    if not await run_db(db, lambda session: BoardService(session).delete_board(board_id)):
+        raise HTTPException(status_code=404, detail="Board not found")
+
+
+@router.get("/{board_id}/export")
+async def export_board(board_id: str, db: DbSession = Depends(get_read_db)):
+    header = await run_db(db, lambda session: BoardTransferService(session).get_export_header(board_id))
+    if not header:
+        raise HTTPException(status_code=404, detail="Board not found")
+    return StreamingResponse(
+        export_board_ndjson(db, board_id, header),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="board-{board_id}.ndjson"'},
+    )
+
+
+@router.post("/import", response_model=BoardImportResponse)
+async def import_board(request: Request, db: DbSession = Depends(get_db)):
+    importer = BoardImporter()
+    try:
+        async for line in iter_ndjson_lines(request.stream()):
+            if importer.add_line(line):
+                await run_db(db, importer.flush)
+        return await run_db(db, importer.finish)
+    except InvalidImport as e:
+        await run_db(db, lambda session: session.rollback())
+        raise HTTPException(status_code=400, detail=str(e))
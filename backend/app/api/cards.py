@@ -1,42 +1,142 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Optional
 
-from app.database import get_db
-from app.schemas.card import CardCreate, CardUpdate, CardResponse, CardMove
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
+
+from app.database import DbSession, get_db, get_read_db, run_db
+from app.responses import OrjsonResponse
+from app.schemas.card import (
+    CardCreate, CardUpdate, CardResponse, CardMove, CardSearchResult,
+    CardBatchRequest, CardBatchResponse,
+)
+from app.services.board_service import InvalidCursor
 from app.services.card_service import CardService
 
 router = APIRouter(tags=["cards"])
 
 
+def parse_if_match(if_match: Optional[str] = Header(default=None)) -> Optional[int]:
+    if if_match is None or if_match.strip() == "*":
+        return None
+    value = if_match.strip().removeprefix("W/").strip('"')
+    if not value.isdigit():
+        raise HTTPException(status_code=400, detail="If-Match must be a card version")
+    return int(value)
+
+
+def version_etag(version: int) -> str:
+    return f'W/"{version}"'
+
+
+async def search_cards(
+    db: DbSession, q: str, board_id: Optional[str], limit: int, offset: int
+) -> OrjsonResponse:
+    result = await run_db(db, lambda session: CardService(session).search_cards(q, board_id, limit, offset))
+    if result is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    cards, next_offset = result
+    headers = {"X-Next-Offset": str(next_offset)} if next_offset is not None else None
+    return OrjsonResponse(cards, headers=headers)
+
+
+@router.get("/cards/search", response_model=list[CardSearchResult])
+async def search_all_cards(
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    db: DbSession = Depends(get_read_db),
+):
+    return await search_cards(db, q, None, limit, offset)
+
+
+@router.get("/boards/{board_id}/cards/search", response_model=list[CardSearchResult])
+async def search_board_cards(
+    board_id: str,
+    q: str = Query(min_length=1, max_length=200),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    db: DbSession = Depends(get_read_db),
+):
+    return await search_cards(db, q, board_id, limit, offset)
+
+
 @router.post("/columns/{column_id}/cards", response_model=CardResponse)
-def create_card(column_id: str, data: CardCreate, db: Session = Depends(get_db)):
-    service = CardService(db)
-    card = service.create_card(column_id, data)
+async def create_card(column_id: str, data: CardCreate, db: DbSession = Depends(get_db)):
+    card = await run_db(db, lambda session: CardService(session).create_card(column_id, data))
     if not card:
         raise HTTPException(status_code=404, detail="Column not found")
     return card
 
 
+@router.get("/columns/{column_id}/cards", response_model=list[CardResponse])
+async def list_column_cards(
+    column_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
+    db: DbSession = Depends(get_read_db),
+):
+    try:
+        result = await run_db(
+            db, lambda session: CardService(session).list_column_cards(column_id, limit, cursor)
+        )
+    except InvalidCursor:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if result is None:
+        raise HTTPException(status_code=404, detail="Column not found")
+    cards, next_cursor = result
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return OrjsonResponse(cards, headers=headers)
+
+
 @router.put("/cards/{card_id}", response_model=CardResponse)
-def update_card(card_id: str, data: CardUpdate, db: Session = Depends(get_db)):
-    service = CardService(db)
-    card = service.update_card(card_id, data)
+async def update_card(
+    card_id: str,
+    data: CardUpdate,
+    response: Response,
+    expected_version: Optional[int] = Depends(parse_if_match),
+    db: DbSession = Depends(get_db),
+):
+    card = await run_db(
+        db, lambda session: CardService(session).update_card(card_id, data, expected_version)
+    )
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
+    response.headers["ETag"] = version_etag(card.version)
     return card
 
 
 @router.delete("/cards/{card_id}", status_code=204)
-def delete_card(card_id: str, db: Session = Depends(get_db)):
-    service = CardService(db)
-    if not service.delete_card(card_id):
+async def delete_card(
+    card_id: str,
+    expected_version: Optional[int] = Depends(parse_if_match),
+    db: DbSession = Depends(get_db),
+):
+    if not await run_db(db, lambda session: CardService(session).delete_card(card_id, expected_version)):
         raise HTTPException(status_code=404, detail="Card not found")
 
 
 @router.patch("/cards/{card_id}/move", response_model=CardResponse)
-def move_card(card_id: str, data: CardMove, db: Session = Depends(get_db)):
-    service = CardService(db)
-    card = service.move_card(card_id, data)
+async def move_card(
+    card_id: str,
+    data: CardMove,
+    response: Response,
+    expected_version: Optional[int] = Depends(parse_if_match),
+    db: DbSession = Depends(get_db),
+):
+    card = await run_db(
+        db, lambda session: CardService(session).move_card(card_id, data, expected_version)
+    )
     if not card:
         raise HTTPException(status_code=404, detail="Card or column not found, or invalid move")
+    response.headers["ETag"] = version_etag(card.version)
     return card
+
+
+@router.post("/boards/{board_id}/cards:batch", response_model=CardBatchResponse)
+async def batch_cards(board_id: str, data: CardBatchRequest, db: DbSession = Depends(get_db)):
+    result = await run_db(db, lambda session: CardService(session).apply_batch(board_id, data))
+    if not result:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if not result.applied:
+        return JSONResponse(status_code=422, content=result.model_dump(mode="json"))
+    return result
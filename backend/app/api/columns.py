@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response
 
-from app.database import get_db
+from app.config import settings
+from app.database import DbSession, get_db, run_db, run_in_new_session
 from app.schemas.column import ColumnCreate, ColumnResponse
 from app.services.column_service import ColumnService
 
@@ -9,9 +9,28 @@ router = APIRouter(prefix="/boards/{board_id}/columns", tags=["columns"])
 
 
 @router.post("", response_model=ColumnResponse)
-def create_column(board_id: str, data: ColumnCreate, db: Session = Depends(get_db)):
-    service = ColumnService(db)
-    column = service.create_column(board_id, data)
+async def create_column(board_id: str, data: ColumnCreate, db: DbSession = Depends(get_db)):
+    column = await run_db(db, lambda session: ColumnService(session).create_column(board_id, data))
     if not column:
         raise HTTPException(status_code=404, detail="Board not found")
     return column
+
+
+@router.delete("/{column_id}", status_code=204)
+async def delete_column(
+    board_id: str,
+    column_id: str,
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+    db: DbSession = Depends(get_db),
+):
+    if background:
+        if not await run_db(db, lambda session: ColumnService(session).column_exists(board_id, column_id)):
+            raise HTTPException(status_code=404, detail="Column not found")
+        background_tasks.add_task(
+            run_in_new_session,
+            lambda session: ColumnService(session).purge_column(board_id, column_id, settings.delete_chunk_size),
+        )
+        return Response(status_code=202)
+    if not await run_db(db, lambda session: ColumnService(session).delete_column(board_id, column_id)):
+        raise HTTPException(status_code=404, detail="Column not found")
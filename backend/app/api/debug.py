@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Request
+
+from app.cache import board_cache
+from app.database import async_engine, engine, pool_status, replica_engines
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/cache")
+def cache_stats():
+    return board_cache.stats()
+
+
+@router.get("/startup")
+def startup_report(request: Request):
+    return request.app.state.startup_report.as_dict()
+
+
+@router.get("/pool")
+def pool_stats():
+    pools = {"sync": pool_status(engine)}
+    if async_engine is not None:
+        pools["async"] = pool_status(async_engine.sync_engine)
+    if replica_engines:
+        pools["replicas"] = [pool_status(getattr(e, "sync_engine", e)) for e in replica_engines]
+    return pools
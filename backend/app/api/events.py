@@ -0,0 +1,58 @@
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+from app.config import settings
+from app.database import DbSession, close_db, get_db, run_db
+from app.events import EventBroker, Subscription, event_broker, format_sse
+from app.services.board_service import BoardService
+
+router = APIRouter(tags=["events"])
+
+
+async def board_event_stream(
+    request: Request,
+    broker: EventBroker,
+    subscription: Subscription,
+    ready: dict,
+    heartbeat: float,
+) -> AsyncIterator[str]:
+    try:
+        yield format_sse(ready)
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield format_sse(event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get("/boards/{board_id}/events")
+async def board_events(board_id: str, request: Request, db: DbSession = Depends(get_db)):
+    # Subscribe before reading the version so no write can fall between the two. The version comes
+    # from the primary: a lagging replica could report one older than events the client already has.
+    subscription = event_broker.subscribe(board_id)
+    version = await run_db(db, lambda session: BoardService(session).get_board_version(board_id))
+    # The stream outlives the request; hand the connection back to the pool now, not when it ends.
+    await close_db(db)
+    if version is None:
+        event_broker.unsubscribe(subscription)
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    stream = board_event_stream(
+        request,
+        event_broker,
+        subscription,
+        ready={"type": "ready", "version": version},
+        heartbeat=settings.events_heartbeat_seconds,
+    )
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,154 @@
+from __future__ import annotations
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from app.compression import compress
+from app.config import settings
+
+
+@dataclass(frozen=True)
+class CachedBoard:
+    version: int
+    body: bytes
+    encoded: dict[str, bytes] = field(default_factory=dict, compare=False, repr=False)
+
+    def encode(self, encoding: str) -> bytes:
+        body = self.encoded.get(encoding)
+        if body is None:
+            body = compress(self.body, encoding)
+            self.encoded[encoding] = body
+        return body
+
+
+class BoardCache(ABC):
+    @abstractmethod
+    def get(self, board_id: str, version: int, variant: str = "") -> CachedBoard | None:
+        ...
+
+    @abstractmethod
+    def set(self, board_id: str, entry: CachedBoard, variant: str = "") -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, board_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def stats(self) -> dict:
+        ...
+
+
+class NullBoardCache(BoardCache):
+    def get(self, board_id: str, version: int, variant: str = "") -> CachedBoard | None:
+        return None
+
+    def set(self, board_id: str, entry: CachedBoard, variant: str = "") -> None:
+        pass
+
+    def invalidate(self, board_id: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> dict:
+        return {"backend": "null"}
+
+
+class LRUBoardCache(BoardCache):
+    def __init__(self, max_entries: int, ttl_seconds: float | None = None, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], tuple[float, CachedBoard]] = OrderedDict()
+        self._variants: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, board_id: str, version: int, variant: str = "") -> CachedBoard | None:
+        key = (board_id, variant)
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            stored_at, entry = item
+            expired = self.ttl_seconds is not None and self._clock() - stored_at > self.ttl_seconds
+            if expired or entry.version != version:
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, board_id: str, entry: CachedBoard, variant: str = "") -> None:
+        key = (board_id, variant)
+        with self._lock:
+            self._entries[key] = (self._clock(), entry)
+            self._entries.move_to_end(key)
+            self._variants.setdefault(board_id, set()).add(variant)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, board_id: str) -> None:
+        with self._lock:
+            variants = self._variants.get(board_id)
+            if not variants:
+                return
+            for variant in list(variants):
+                self._remove((board_id, variant))
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._variants.clear()
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        board_id, variant = key
+        self._entries.pop(key, None)
+        variants = self._variants.get(board_id)
+        if variants is not None:
+            variants.discard(variant)
+            if not variants:
+                del self._variants[board_id]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "backend": "lru",
+                "entries": len(self._entries),
+                "boards": len(self._variants),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "bytes": sum(len(entry.body) for _, entry in self._entries.values()),
+                "encoded_bytes": sum(
+                    len(body) for _, entry in self._entries.values() for body in entry.encoded.values()
+                ),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+def build_board_cache() -> BoardCache:
+    if not settings.board_cache_enabled or settings.board_cache_max_entries <= 0:
+        return NullBoardCache()
+    return LRUBoardCache(settings.board_cache_max_entries, settings.board_cache_ttl_seconds)
+
+
+board_cache = build_board_cache()
@@ -1,16 +1,282 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import sqlite3
+import threading
+import time
+from typing import AsyncIterator, Callable, Sequence, TypeVar, Union
+
+from sqlalchemy import Executable, Row, create_engine, event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from fastapi import Depends, Request
+from starlette.concurrency import run_in_threadpool
 
 from app.config import settings
+from app.metrics import RequestStats, record_query
+from app.replicas import ReplicaSet, is_sticky, replica_urls
+
+T = TypeVar("T")
+DbSession = Union[Session, AsyncSession]
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+class PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_checkout(self, waited: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+
+
+class TimedPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.stats.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record_checkout(time.perf_counter() - start)
+        return connection
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+class RowCountingCursor:
+    def __init__(self, cursor, stats: RequestStats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._stats.rows += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._stats.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._stats.rows += len(rows)
+        return rows
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def record_query_timing(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    elapsed = time.perf_counter() - started
+    if cursor.description is None:
+        record_query(elapsed, max(cursor.rowcount, 0))
+        return
+    # rowcount is -1 for SELECT on most drivers, so count rows as the result fetches them.
+    stats = record_query(elapsed)
+    if stats is not None and context is not None:
+        context.cursor = RowCountingCursor(context.cursor, stats)
+
+
+@event.listens_for(Engine, "handle_error")
+def discard_query_timer(context):
+    started = context.connection.info.get("query_started") if context.connection is not None else None
+    if started:
+        started.pop()
+
+
+@event.listens_for(Engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores FOREIGN KEY constraints unless asked per connection; writes rely on them.
+    if isinstance(dbapi_connection, sqlite3.Connection) or type(dbapi_connection).__module__.startswith(
+        "sqlalchemy.dialects.sqlite"
+    ):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver known for {parsed.get_backend_name()!r}; set DATABASE_ASYNC_URL")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
 
-engine = create_engine(settings.database_url)
+
+def engine_options(url: str, use_async: bool = False) -> dict:
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+
+    options = {
+        "poolclass": TimedAsyncAdaptedQueuePool if use_async else TimedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    timeout = settings.db_statement_timeout_ms
+    if timeout and parsed.get_backend_name() == "postgresql":
+        if parsed.get_driver_name() == "asyncpg":
+            options["connect_args"] = {"server_settings": {"statement_timeout": str(timeout)}}
+        else:
+            options["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return options
+
+
+def pool_status(engine: Engine) -> dict:
+    pool = engine.pool
+    status = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    if isinstance(pool, TimedPoolMixin):
+        status.update(pool.stats.snapshot())
+    return status
+
+
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+async_engine = None
+AsyncSessionLocal = None
+if settings.database_async:
+    async_url = settings.database_async_url or async_database_url(settings.database_url)
+    async_engine = create_async_engine(async_url, **engine_options(async_url, use_async=True))
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
 
-def get_db():
+
+def get_sync_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+get_db = get_async_db if settings.database_async else get_sync_db
+
+if settings.database_async:
+    replica_engines = [
+        create_async_engine(url, **engine_options(url, use_async=True))
+        for url in map(async_database_url, replica_urls(settings.database_replica_urls))
+    ]
+    read_replicas = ReplicaSet([async_sessionmaker(e, autoflush=False) for e in replica_engines])
+else:
+    replica_engines = [
+        create_engine(url, **engine_options(url)) for url in replica_urls(settings.database_replica_urls)
+    ]
+    read_replicas = ReplicaSet([sessionmaker(autoflush=False, bind=e) for e in replica_engines])
+
+
+async def get_read_db(request: Request, db: DbSession = Depends(get_db)):
+    # Clients that wrote recently carry a cookie that keeps their reads on the primary.
+    if not read_replicas or is_sticky(request):
+        yield db
+        return
+    replica = read_replicas.next_factory()()
+    if isinstance(replica, AsyncSession):
+        async with replica:
+            yield replica
+        return
+    try:
+        yield replica
+    finally:
+        replica.close()
+
+
+def run_in_new_session(fn: Callable[[Session], T]) -> T:
+    with SessionLocal() as db:
+        return fn(db)
+
+
+def begin_snapshot(db: Session) -> None:
+    # Must run before anything else in the transaction; every later read then sees the same snapshot.
+    if db.get_bind().dialect.name == "sqlite":
+        # pysqlite only opens transactions for writes, so reads would each see the latest commit.
+        db.connection().exec_driver_sql("BEGIN")
+    else:
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+
+async def close_db(db: DbSession) -> None:
+    if isinstance(db, AsyncSession):
+        await db.close()
+    else:
+        await run_in_threadpool(db.close)
+
+
+async def run_db(db: DbSession, fn: Callable[[Session], T]) -> T:
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn)
+    return await run_in_threadpool(fn, db)
+
+
+async def stream_db(db: DbSession, stmt: Executable, chunk_size: int = 1000) -> AsyncIterator[Sequence[Row]]:
+    stmt = stmt.execution_options(yield_per=chunk_size)
+    if isinstance(db, AsyncSession):
+        result = await db.stream(stmt)
+        try:
+            async for rows in result.partitions():
+                yield rows
+        finally:
+            await result.close()
+        return
+    result = await run_in_threadpool(db.execute, stmt)
+    try:
+        while rows := await run_in_threadpool(result.fetchmany, chunk_size):
+            yield rows
+    finally:
+        result.close()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+import asyncio
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from app.config import settings
+
+
+@dataclass(eq=False)
+class Subscription:
+    board_id: str
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+
+
+class EventBroker(ABC):
+    @abstractmethod
+    def subscribe(self, board_id: str) -> Subscription:
+        ...
+
+    @abstractmethod
+    def unsubscribe(self, subscription: Subscription) -> None:
+        ...
+
+    @abstractmethod
+    def publish(self, board_id: str, event: dict) -> None:
+        ...
+
+
+class InProcessEventBroker(EventBroker):
+    def __init__(self, queue_size: int = 256):
+        self.queue_size = queue_size
+        self._subscriptions: dict[str, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, board_id: str) -> Subscription:
+        subscription = Subscription(
+            board_id=board_id,
+            loop=asyncio.get_running_loop(),
+            queue=asyncio.Queue(maxsize=self.queue_size),
+        )
+        with self._lock:
+            self._subscriptions[board_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.board_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[subscription.board_id]
+
+    def subscriber_count(self, board_id: str) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(board_id, ()))
+
+    def publish(self, board_id: str, event: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscriptions.get(board_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(self._deliver, subscription, event)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+    @staticmethod
+    def _deliver(subscription: Subscription, event: dict) -> None:
+        try:
+            subscription.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A slow client lost events; drop its backlog and tell it to reload the board.
+            while not subscription.queue.empty():
+                subscription.queue.get_nowait()
+            subscription.queue.put_nowait({"type": "resync"})
+
+
+def format_sse(event: dict) -> str:
+    lines = []
+    if "version" in event:
+        lines.append(f"id: {event['version']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+event_broker = InProcessEventBroker(settings.events_queue_size)
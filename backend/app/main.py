@@ -1,37 +1,111 @@
+import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from app.database import engine, Base, get_db
-from app.api import boards, columns, cards
+from app import IMPORT_STARTED
+from app.compression import CompressionMiddleware
+from app.config import settings
+from app.database import async_engine, engine, read_replicas
+from app.metrics import MetricsMiddleware
+from app.replicas import ReadYourWritesMiddleware
+from app.services.base import PositionConflict, VersionConflict
+from app.startup import StartupReport
+from app.api import archive, boards, columns, cards, debug, events, metrics
 
+IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
-    yield
 
+def migrate_database() -> None:
+    # Alembic is only needed when this process owns the schema; serving workers never import it.
+    from app.migrations import upgrade_database
 
-app = FastAPI(
-    title="Mini-Kanban API",
-    description="API para gerenciamento de tarefas no estilo Kanban",
-    lifespan=lifespan,
-)
+    upgrade_database(engine)
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-app.include_router(boards.router)
-app.include_router(columns.router)
-app.include_router(cards.router)
+async def connect_database() -> None:
+    if async_engine is None:
+        await run_in_threadpool(lambda: engine.connect().close())
+        return
+    async with async_engine.connect():
+        pass
+
+
+async def version_conflict_handler(request: Request, exc: VersionConflict):
+    return JSONResponse(
+        status_code=409,
+        content={"detail": str(exc), "current_version": exc.current_version},
+        headers={"ETag": f'W/"{exc.current_version}"'},
+    )
+
+
+async def position_conflict_handler(request: Request, exc: PositionConflict):
+    return JSONResponse(status_code=409, content={"detail": str(exc)})
 
 
-@app.get("/")
 def root():
     return {"message": "Mini-Kanban API", "docs": "/docs"}
+
+
+def create_app(migrate_on_startup: bool | None = None) -> FastAPI:
+    if migrate_on_startup is None:
+        migrate_on_startup = settings.migrate_on_startup
+    report = StartupReport({"imports": IMPORT_SECONDS})
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if migrate_on_startup:
+            with report.phase("migrations"):
+                await run_in_threadpool(migrate_database)
+        with report.phase("db_connect"):
+            await connect_database()
+        report.log()
+        yield
+
+    with report.phase("app"):
+        app = FastAPI(
+            title="Mini-Kanban API",
+            description="API para gerenciamento de tarefas no estilo Kanban",
+            lifespan=lifespan,
+        )
+        app.state.startup_report = report
+
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["http://localhost:5173", "http://localhost:3000"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+            expose_headers=["X-Next-Cursor", "X-Next-Offset", "ETag"],
+        )
+
+        if settings.compression_enabled:
+            app.add_middleware(
+                CompressionMiddleware,
+                minimum_size=settings.compression_minimum_size,
+                gzip_level=settings.compression_gzip_level,
+                brotli_quality=settings.compression_brotli_quality,
+            )
+
+        if read_replicas:
+            app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.read_your_writes_seconds)
+
+        app.add_middleware(MetricsMiddleware)
+        app.add_exception_handler(VersionConflict, version_conflict_handler)
+        app.add_exception_handler(PositionConflict, position_conflict_handler)
+
+        app.include_router(boards.router)
+        app.include_router(columns.router)
+        app.include_router(cards.router)
+        app.include_router(archive.router)
+        app.include_router(events.router)
+        app.include_router(debug.router)
+        app.include_router(metrics.router)
+        app.add_api_route("/", root, methods=["GET"])
+    return app
+
+
+app = create_app()
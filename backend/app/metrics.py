@@ -0,0 +1,175 @@
+from __future__ import annotations
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    rows: int = 0
+
+
+current_request: ContextVar[RequestStats | None] = ContextVar("current_request", default=None)
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(str(value))}"' for name, value in labels.items()) + "}"
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, label_names: tuple[str, ...], buckets: tuple[float, ...]):
+        self.name = name
+        self.help = help
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        with self._lock:
+            counts, total = self._series.setdefault(labels, ([0] * (len(self.buckets) + 1), [0.0]))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-1] += 1
+            total[0] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (counts, total) in sorted(self._series.items()):
+                base = dict(zip(self.label_names, labels))
+                for bound, count in zip((*self.buckets, "+Inf"), counts):
+                    lines.append(f"{self.name}_bucket{format_labels({**base, 'le': str(bound)})} {count}")
+                lines.append(f"{self.name}_sum{format_labels(base)} {total[0]}")
+                lines.append(f"{self.name}_count{format_labels(base)} {counts[-1]}")
+        return lines
+
+
+class Counter:
+    def __init__(self, name: str, help: str, label_names: tuple[str, ...]):
+        self.name = name
+        self.help = help
+        self.label_names = label_names
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{format_labels(dict(zip(self.label_names, labels)))} {value}")
+        return lines
+
+
+class RequestMetrics:
+    def __init__(self, query_budget: int | None = None):
+        self.query_budget = query_budget
+        self.request_duration = Histogram(
+            "http_request_duration_seconds",
+            "Time until response headers are sent.",
+            ("method", "route", "status"),
+            LATENCY_BUCKETS,
+        )
+        self.db_duration = Histogram(
+            "db_time_per_request_seconds", "Time spent in SQL per request.", ("method", "route"), LATENCY_BUCKETS
+        )
+        self.db_queries = Histogram(
+            "db_queries_per_request", "SQL statements per request.", ("method", "route"), QUERY_BUCKETS
+        )
+        self.db_rows = Counter(
+            "db_rows_total", "Rows fetched or modified by SQL statements.", ("method", "route")
+        )
+        self.budget_exceeded = Counter(
+            "db_query_budget_exceeded_total", "Requests over the query budget.", ("method", "route")
+        )
+
+    def record(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        self.request_duration.observe(seconds, method, route, str(status))
+        self.db_duration.observe(stats.db_seconds, method, route)
+        self.db_queries.observe(stats.queries, method, route)
+        self.db_rows.inc(stats.rows, method, route)
+        if self.query_budget is not None and stats.queries > self.query_budget:
+            self.budget_exceeded.inc(1, method, route)
+            logger.warning(
+                "%s %s ran %d SQL statements (budget %d)", method, route, stats.queries, self.query_budget
+            )
+
+    def render(self) -> str:
+        metrics = (self.request_duration, self.db_duration, self.db_queries, self.db_rows, self.budget_exceeded)
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+
+request_metrics = RequestMetrics(query_budget=settings.request_query_budget)
+
+
+def record_query(seconds: float, rows: int = 0) -> RequestStats | None:
+    stats = current_request.get()
+    if stats is None:
+        return None
+    stats.queries += 1
+    stats.db_seconds += seconds
+    stats.rows += rows
+    return stats
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        status = 500
+        headers_sent: float | None = None
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status, headers_sent
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                headers_sent = time.perf_counter()
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            current_request.reset(token)
+            route = scope.get("route")
+            # Streaming responses (export, SSE) stay open long after the headers; their body time is not latency.
+            finished = headers_sent if headers_sent is not None else time.perf_counter()
+            self.metrics.record(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status,
+                finished - start,
+                stats,
+            )
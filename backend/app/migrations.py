@@ -0,0 +1,48 @@
+from __future__ import annotations
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+import app.models  # noqa: F401
+from app.database import Base
+from app.models.card_search import is_search_object
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+BASELINE_REVISION = "0001"
+
+
+def alembic_config() -> Config:
+    return Config(str(ALEMBIC_INI))
+
+
+def include_name(name: str | None, type_: str, parent_names: dict) -> bool:
+    # The full-text index and the FTS5 shadow tables are dialect-specific DDL, not model metadata.
+    return not is_search_object(name)
+
+
+def upgrade_database(engine: Engine, revision: str = "head") -> None:
+    config = alembic_config()
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        tables = set(inspect(connection).get_table_names())
+        if "alembic_version" not in tables and "boards" in tables:
+            # Databases created by Base.metadata.create_all before migrations existed.
+            command.stamp(config, BASELINE_REVISION)
+        command.upgrade(config, revision)
+
+
+def create_schema(engine: Engine) -> None:
+    config = alembic_config()
+    with engine.begin() as connection:
+        Base.metadata.create_all(bind=connection)
+        config.attributes["connection"] = connection
+        command.stamp(config, "head")
+
+
+def drop_schema(engine: Engine) -> None:
+    with engine.begin() as connection:
+        Base.metadata.drop_all(bind=connection)
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
@@ -1,3 +1,6 @@
 from app.models.board import Board
 from app.models.column import Column
 from app.models.card import Card
+from app.models.board_change import BoardChange
+from app.models.archived_card import ArchivedCard
+import app.models.card_search  # noqa: F401
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, DateTime, String, Text, Integer, ForeignKey, Index
+
+from app.database import Base
+
+
+class ArchivedCard(Base):
+    __tablename__ = "archived_cards"
+    __table_args__ = (
+        Index("ix_archived_cards_board_id_archived_at", "board_id", "archived_at", "id"),
+        Index("ix_archived_cards_column_id", "column_id"),
+    )
+
+    id = Column(String(36), primary_key=True)
+    board_id = Column(String(36), ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    column_id = Column(String(36), ForeignKey("columns.id", ondelete="CASCADE"), nullable=False)
+    title = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    position = Column(Integer, nullable=False)
+    version = Column(Integer, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Integer, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -7,8 +7,14 @@ from app.database import Base
 
 class Board(Base):
     __tablename__ = "boards"
+    __table_args__ = (
+        Index("ix_boards_name_id", "name", "id"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(255), nullable=False)
+    version = Column(Integer, nullable=False, default=0)
 
-    columns = relationship("Column", back_populates="board", order_by="Column.position", cascade="all, delete-orphan")
+    columns = relationship(
+        "Column", back_populates="board", order_by="Column.position", cascade="all, delete-orphan", passive_deletes=True
+    )
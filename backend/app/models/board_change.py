@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, Integer, Text, ForeignKey
+
+from app.database import Base
+
+
+class BoardChange(Base):
+    __tablename__ = "board_changes"
+
+    board_id = Column(String(36), ForeignKey("boards.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    event = Column(Text, nullable=False)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Text, Integer, ForeignKey
+from sqlalchemy import Column, DateTime, String, Text, Integer, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -7,11 +7,16 @@ from app.database import Base
 
 class Card(Base):
     __tablename__ = "cards"
+    __table_args__ = (
+        Index("ix_cards_column_id_position", "column_id", "position", unique=True),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     position = Column(Integer, nullable=False, default=0)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=True, default=func.now(), onupdate=func.now())
     column_id = Column(String(36), ForeignKey("columns.id", ondelete="CASCADE"), nullable=False)
 
     column = relationship("Column", back_populates="cards")
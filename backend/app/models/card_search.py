@@ -0,0 +1,44 @@
+from sqlalchemy import DDL, event
+
+from app.models.card import Card
+
+SEARCH_CONFIG = "simple"
+SEARCH_VECTOR = f"to_tsvector('{SEARCH_CONFIG}', coalesce(title, '') || ' ' || coalesce(description, ''))"
+SEARCH_INDEX = "ix_cards_search"
+FTS_TABLE = "cards_fts"
+# Only title and description are searchable; card_id is indexed just to find a card's row.
+FTS_SEARCH_COLUMNS = "{title description}"
+# The rowid of `cards` is not stable (VACUUM may renumber it), so FTS rows are keyed by card_id. The
+# MATCH narrows the lookup through the full-text index and the equality makes it exact.
+FTS_ROW_FOR = "{table} MATCH 'card_id:\"' || replace({card}.id, '\"', '\"\"') || '\"' AND card_id = {card}.id"
+
+SEARCH_DDL = {
+    "postgresql": [
+        f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX} ON cards USING gin ({SEARCH_VECTOR})",
+    ],
+    "sqlite": [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(card_id, title, description)",
+        f"""CREATE TRIGGER IF NOT EXISTS cards_fts_insert AFTER INSERT ON cards BEGIN
+            INSERT INTO {FTS_TABLE} (card_id, title, description) VALUES (new.id, new.title, new.description);
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS cards_fts_delete AFTER DELETE ON cards BEGIN
+            DELETE FROM {FTS_TABLE} WHERE {FTS_ROW_FOR.format(table=FTS_TABLE, card="old")};
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS cards_fts_update AFTER UPDATE OF title, description ON cards BEGIN
+            UPDATE {FTS_TABLE} SET title = new.title, description = new.description
+            WHERE {FTS_ROW_FOR.format(table=FTS_TABLE, card="new")};
+        END""",
+    ],
+}
+
+
+def is_search_object(name: str | None) -> bool:
+    return bool(name) and (name == SEARCH_INDEX or name.startswith(FTS_TABLE))
+
+
+for dialect, statements in SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(Card.__table__, "after_create", DDL(statement).execute_if(dialect=dialect))
+event.listen(
+    Card.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite")
+)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, ForeignKey
+from sqlalchemy import Column, String, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -7,6 +7,9 @@ from app.database import Base
 
 class Column(Base):
     __tablename__ = "columns"
+    __table_args__ = (
+        Index("ix_columns_board_id_position", "board_id", "position"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(255), nullable=False)
@@ -14,4 +17,6 @@ class Column(Base):
     board_id = Column(String(36), ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
 
     board = relationship("Board", back_populates="columns")
-    cards = relationship("Card", back_populates="column", order_by="Card.position")
+    cards = relationship(
+        "Card", back_populates="column", order_by="Card.position", cascade="all, delete-orphan", passive_deletes=True
+    )
@@ -0,0 +1,65 @@
+from __future__ import annotations
+import itertools
+import threading
+import time
+from http.cookies import SimpleCookie
+from typing import Callable, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+PRIMARY_COOKIE = "kanban_primary_until"
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def replica_urls(value: str) -> list[str]:
+    return [url.strip() for url in value.split(",") if url.strip()]
+
+
+def is_sticky(connection: HTTPConnection, now: float | None = None) -> bool:
+    try:
+        until = float(connection.cookies.get(PRIMARY_COOKIE, 0))
+    except ValueError:
+        return False
+    return until > (time.time() if now is None else now)
+
+
+class ReplicaSet:
+    def __init__(self, session_factories: Sequence[Callable] = ()):
+        self.session_factories = list(session_factories)
+        self._cycle = itertools.cycle(self.session_factories)
+        self._lock = threading.Lock()
+
+    def __bool__(self) -> bool:
+        return bool(self.session_factories)
+
+    def next_factory(self) -> Callable:
+        with self._lock:
+            return next(self._cycle)
+
+
+class ReadYourWritesMiddleware:
+    def __init__(self, app: ASGIApp, window_seconds: float):
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in READ_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = SimpleCookie()
+                cookie[PRIMARY_COOKIE] = f"{time.time() + self.window_seconds:.3f}"
+                cookie[PRIMARY_COOKIE].update({
+                    "max-age": str(int(self.window_seconds) + 1),
+                    "path": "/",
+                    "httponly": True,
+                    "samesite": "lax",
+                })
+                MutableHeaders(scope=message).append("Set-Cookie", cookie.output(header="").strip())
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Row, delete, func, insert, literal, select, tuple_
+from sqlalchemy.orm import Session, aliased
+
+from app.models import ArchivedCard, Card, Column
+from app.repositories.board_repository import BoardRepository
+
+ARCHIVE_ATTEMPTS = 3
+ARCHIVED_CARD_COLUMNS = (
+    ArchivedCard.id,
+    ArchivedCard.title,
+    ArchivedCard.description,
+    ArchivedCard.column_id,
+    ArchivedCard.board_id,
+    ArchivedCard.position,
+    ArchivedCard.version,
+    ArchivedCard.updated_at,
+    ArchivedCard.archived_at,
+)
+
+
+class ArchiveRepository:
+    def __init__(self):
+        self.board_repository = BoardRepository()
+
+    def archive_card(self, db: Session, card_id: str, expected_version: int | None = None) -> str | None:
+        criteria = [Card.id == card_id]
+        if expected_version is not None:
+            criteria.append(Card.version == expected_version)
+        board_id = db.execute(
+            select(Column.board_id).join(Card, Card.column_id == Column.id).where(*criteria)
+        ).scalar()
+        if board_id is None or not self._archive(db, board_id, criteria):
+            return None
+        return board_id
+
+    def archive_column_chunk(
+        self, db: Session, board_id: str, column_id: str, updated_before: datetime | None, limit: int
+    ) -> list[str]:
+        criteria = [Card.column_id == column_id]
+        if updated_before is not None:
+            criteria.append(Card.updated_at < updated_before)
+        return self._archive(db, board_id, criteria, limit)
+
+    def _archive(self, db: Session, board_id: str, criteria: list, limit: int | None = None) -> list[str]:
+        for _ in range(ARCHIVE_ATTEMPTS):
+            card_ids = list(db.scalars(
+                select(Card.id)
+                .join(Column, Card.column_id == Column.id)
+                .where(Column.board_id == board_id, *criteria)
+                .limit(limit)
+            ))
+            if not card_ids:
+                db.rollback()
+                return []
+            # The criteria are checked again on write: a card changed since the SELECT stays on the board.
+            archived = [Card.id.in_(card_ids), *criteria]
+            archived_at = literal(datetime.now(timezone.utc), DateTime(timezone=True))
+            rows = select(
+                Card.id, Card.title, Card.description, Card.column_id, literal(board_id),
+                Card.position, Card.version, Card.updated_at, archived_at,
+            ).where(*archived)
+            inserted = db.execute(
+                insert(ArchivedCard).from_select([c.key for c in ARCHIVED_CARD_COLUMNS], rows)
+            ).rowcount
+            deleted = db.execute(
+                delete(Card).where(*archived).execution_options(synchronize_session=False)
+            ).rowcount
+            if deleted != inserted or not inserted:
+                # Cards changed after the SELECT; start over from a clean transaction.
+                db.rollback()
+                continue
+            if inserted < len(card_ids):
+                card_ids = list(db.scalars(select(ArchivedCard.id).where(ArchivedCard.id.in_(card_ids))))
+            self.board_repository.bump_version(db, board_id)
+            return card_ids
+        return []
+
+    def get_stale_last_columns(self, db: Session, updated_before: datetime) -> list[Row]:
+        # By convention the rightmost column of a board holds its finished cards.
+        other = aliased(Column)
+        last_position = select(func.max(other.position)).where(other.board_id == Column.board_id).scalar_subquery()
+        stale = select(Card.id).where(Card.column_id == Column.id, Card.updated_at < updated_before).exists()
+        return db.execute(
+            select(Column.board_id, Column.id).where(Column.position == last_position, stale)
+        ).all()
+
+    def get_page(
+        self, db: Session, board_id: str, limit: int, after: tuple[datetime, str] | None = None
+    ) -> list[Row]:
+        stmt = select(*ARCHIVED_CARD_COLUMNS).where(ArchivedCard.board_id == board_id)
+        if after:
+            stmt = stmt.where(tuple_(ArchivedCard.archived_at, ArchivedCard.id) < tuple_(*after))
+        stmt = stmt.order_by(ArchivedCard.archived_at.desc(), ArchivedCard.id.desc()).limit(limit)
+        return db.execute(stmt).all()
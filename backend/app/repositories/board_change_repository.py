@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from sqlalchemy import Row, delete, insert, select
+from sqlalchemy.orm import Session
+
+from app.models import BoardChange
+
+PRUNE_INTERVAL = 100
+
+
+class BoardChangeRepository:
+    def __init__(self, retention: int):
+        self.retention = retention
+
+    def append(self, db: Session, board_id: str, version: int, event: str) -> None:
+        db.execute(insert(BoardChange).values(board_id=board_id, version=version, event=event))
+        if version % PRUNE_INTERVAL == 0:
+            db.execute(
+                delete(BoardChange)
+                .where(BoardChange.board_id == board_id, BoardChange.version <= version - self.retention)
+            )
+
+    def get_since(self, db: Session, board_id: str, since: int, limit: int) -> list[Row]:
+        return db.execute(
+            select(BoardChange.version, BoardChange.event)
+            .where(BoardChange.board_id == board_id, BoardChange.version > since)
+            .order_by(BoardChange.version)
+            .limit(limit)
+        ).all()
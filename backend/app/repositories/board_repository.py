@@ -1,29 +1,182 @@
 from __future__ import annotations
-from sqlalchemy.orm import Session, joinedload
+import uuid
+
+from sqlalchemy import Row, Select, delete, distinct, func, insert, select, tuple_, union_all, update
+from sqlalchemy.orm import Session, selectinload
 
 from app.models import Board, Column, Card
+from app.repositories.returning import execute_returning
+
+DETAIL_CARD_COLUMNS = (Card.id, Card.title, Card.description, Card.column_id, Card.position, Card.version)
+# Rows selected from a UNION subquery carry label objects as keys, which orjson rejects; key cards by plain names.
+DETAIL_CARD_KEYS = tuple(column.key for column in DETAIL_CARD_COLUMNS)
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    # Smallest string above every string starting with prefix, or None if there is none.
+    prefix = prefix.rstrip(chr(0x10FFFF))
+    if not prefix:
+        return None
+    code = ord(prefix[-1]) + 1
+    if 0xD800 <= code <= 0xDFFF:
+        # Surrogates cannot be encoded; the next character is the first one after them.
+        code = 0xE000
+    return prefix[:-1] + chr(code)
 
 
 class BoardRepository:
-    def create(self, db: Session, name: str) -> Board:
-        board = Board(name=name)
-        db.add(board)
+    def create(self, db: Session, name: str) -> Row:
+        board = self.insert(db, name)
         db.commit()
-        db.refresh(board)
         return board
 
-    def get_all(self, db: Session) -> list[Board]:
-        return db.query(Board).all()
+    def insert(self, db: Session, name: str) -> Row:
+        board_id = str(uuid.uuid4())
+        stmt = insert(Board).values(id=board_id, name=name, version=0)
+        return execute_returning(db, stmt, (Board.id, Board.name, Board.version), Board.id == board_id)
+
+    def get_page(
+        self,
+        db: Session,
+        limit: int,
+        after: tuple[str, str] | None = None,
+        name_prefix: str | None = None,
+        include_counts: bool = False,
+    ) -> list[Row]:
+        page = select(Board.id, Board.name)
+        if after:
+            page = page.where(tuple_(Board.name, Board.id) > tuple_(*after))
+        if name_prefix:
+            # The range keeps the lookup on ix_boards_name_id; startswith keeps it exact under any collation.
+            page = page.where(Board.name >= name_prefix, Board.name.startswith(name_prefix, autoescape=True))
+            upper = prefix_upper_bound(name_prefix)
+            if upper is not None:
+                page = page.where(Board.name < upper)
+        page = page.order_by(Board.name, Board.id).limit(limit)
+        if not include_counts:
+            return db.execute(page).all()
+
+        page = page.subquery()
+        stmt = (
+            select(
+                page.c.id,
+                page.c.name,
+                func.count(distinct(Column.id)).label("column_count"),
+                func.count(Card.id).label("card_count"),
+            )
+            .select_from(page)
+            .outerjoin(Column, Column.board_id == page.c.id)
+            .outerjoin(Card, Card.column_id == Column.id)
+            .group_by(page.c.id, page.c.name)
+            .order_by(page.c.name, page.c.id)
+        )
+        return db.execute(stmt).all()
 
     def get_by_id(self, db: Session, board_id: str) -> Board | None:
         return db.query(Board).filter(Board.id == board_id).first()
 
+    def get_version(self, db: Session, board_id: str) -> int | None:
+        return db.query(Board.version).filter(Board.id == board_id).scalar()
+
+    def delete(self, db: Session, board_id: str) -> bool:
+        deleted = db.execute(delete(Board).where(Board.id == board_id)).rowcount
+        db.commit()
+        return bool(deleted)
+
+    def bump_version(self, db: Session, board_id: str) -> str | None:
+        stmt = update(Board).where(Board.id == board_id).values(version=Board.version + 1)
+        row = execute_returning(db, stmt, (Board.id, Board.version), Board.id == board_id)
+        if not row:
+            return None
+        db.info.setdefault("changed_boards", {})[row.id] = row.version
+        return row.id
+
+    def bump_version_for_column(self, db: Session, column_id: str) -> str | None:
+        board_id = select(Column.board_id).where(Column.id == column_id).scalar_subquery()
+        return self.bump_version(db, board_id)
+
+    def pop_changed(self, db: Session) -> dict[str, int]:
+        return db.info.pop("changed_boards", {})
+
     def get_by_id_with_columns_and_cards(self, db: Session, board_id: str) -> Board | None:
         return (
             db.query(Board)
             .options(
-                joinedload(Board.columns).joinedload(Column.cards)
+                selectinload(Board.columns).selectinload(Column.cards)
             )
             .filter(Board.id == board_id)
             .first()
         )
+
+    def get_detail(self, db: Session, board_id: str, cards_limit: int | None = None) -> dict | None:
+        board = db.execute(
+            select(Board.id, Board.name, Board.version).where(Board.id == board_id)
+        ).first()
+        if not board:
+            return None
+
+        columns = db.execute(
+            select(Column.id, Column.name, Column.board_id)
+            .where(Column.board_id == board_id)
+            .order_by(Column.position)
+        ).all()
+        columns_by_id = {column.id: {**column._asdict(), "cards": []} for column in columns}
+
+        if cards_limit is None:
+            cards = db.execute(
+                select(*DETAIL_CARD_COLUMNS)
+                .join(Column, Card.column_id == Column.id)
+                .where(Column.board_id == board_id)
+                .order_by(Card.position)
+            ).all()
+        else:
+            cards = self._first_cards_per_column(db, list(columns_by_id), cards_limit)
+            counts = db.execute(
+                select(Card.column_id, func.count())
+                .join(Column, Card.column_id == Column.id)
+                .where(Column.board_id == board_id)
+                .group_by(Card.column_id)
+            ).all()
+            for column in columns_by_id.values():
+                column["card_count"] = 0
+            for column_id, count in counts:
+                columns_by_id[column_id]["card_count"] = count
+
+        for card in cards:
+            columns_by_id[card.column_id]["cards"].append(dict(zip(DETAIL_CARD_KEYS, card)))
+        return {**board._asdict(), "columns": list(columns_by_id.values())}
+
+    def get_export_header(self, db: Session, board_id: str) -> dict | None:
+        board = db.execute(select(Board.id, Board.name).where(Board.id == board_id)).first()
+        if not board:
+            return None
+        columns = db.execute(
+            select(Column.id, Column.name, Column.position)
+            .where(Column.board_id == board_id)
+            .order_by(Column.position)
+        ).all()
+        return {"board": board._asdict(), "columns": [column._asdict() for column in columns]}
+
+    def export_cards_query(self, board_id: str) -> Select:
+        return (
+            select(*DETAIL_CARD_COLUMNS)
+            .join(Column, Card.column_id == Column.id)
+            .where(Column.board_id == board_id)
+            .order_by(Card.column_id, Card.position)
+        )
+
+    def _first_cards_per_column(self, db: Session, column_ids: list[str], limit: int) -> list[Row]:
+        if not column_ids or limit == 0:
+            return []
+        # One index range scan per column; a window function would still read every card of the board.
+        per_column = [
+            select(*DETAIL_CARD_COLUMNS)
+            .where(Card.column_id == column_id)
+            .order_by(Card.position)
+            .limit(limit)
+            .subquery()
+            .select()
+            for column_id in column_ids
+        ]
+        rows = db.execute(union_all(*per_column) if len(per_column) > 1 else per_column[0]).all()
+        return sorted(rows, key=lambda row: row.position)
@@ -1,42 +1,347 @@
 from __future__ import annotations
-from sqlalchemy.orm import Session
+import re
+import uuid
+
+from sqlalchemy import (
+    Row, Select, bindparam, column, delete, func, insert, literal, literal_column, or_, select, table, tuple_,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
 
 from app.models import Card, Column
+from app.models.card_search import FTS_SEARCH_COLUMNS, FTS_TABLE, SEARCH_CONFIG, SEARCH_VECTOR
+from app.repositories.board_repository import BoardRepository
+from app.repositories.returning import execute_returning
+
+POSITION_GAP = 1024
+POSITION_INDEX = "ix_cards_column_id_position"
+cards_fts = table(FTS_TABLE, column("card_id"), column("rank"))
+CARDS = Card.__table__
+CARD_COLUMNS = (Card.id, Card.title, Card.description, Card.column_id, Card.position, Card.version)
+
+
+def is_position_conflict(error: IntegrityError) -> bool:
+    # PostgreSQL names the violated index; SQLite lists its columns.
+    message = str(error.orig)
+    return POSITION_INDEX in message or "cards.column_id, cards.position" in message
 
 
 class CardRepository:
-    def create(self, db: Session, column_id: str, title: str, description=None) -> Card | None:
-        column = db.query(Column).filter(Column.id == column_id).first()
-        if not column:
+    def __init__(self):
+        self.board_repository = BoardRepository()
+
+    def create(self, db: Session, column_id: str, title: str, description=None) -> Row | None:
+        card_id = str(uuid.uuid4())
+        last_position = select(func.max(Card.position)).where(Card.column_id == column_id).scalar_subquery()
+        stmt = insert(Card).values(
+            id=card_id,
+            column_id=column_id,
+            title=title,
+            description=description,
+            position=func.coalesce(last_position + POSITION_GAP, 0),
+        )
+        try:
+            card = execute_returning(db, stmt, CARD_COLUMNS, Card.id == card_id)
+        except IntegrityError as error:
+            if is_position_conflict(error):
+                raise
+            db.rollback()
             return None
+        self.board_repository.bump_version_for_column(db, column_id)
+        return card
+
+    def insert_many(self, db: Session, rows: list[dict]) -> None:
+        if rows:
+            db.execute(insert(Card), rows)
+
+    def get_page_for_column(
+        self, db: Session, column_id: str, limit: int, after: tuple[int, str] | None = None
+    ) -> list[Row]:
+        stmt = select(*CARD_COLUMNS).where(Card.column_id == column_id)
+        if after is not None:
+            stmt = stmt.where(tuple_(Card.position, Card.id) > tuple_(*after))
+        return db.execute(stmt.order_by(Card.position, Card.id).limit(limit)).all()
+
+    def search(
+        self, db: Session, query: str, board_id: str | None, limit: int, offset: int = 0
+    ) -> list[Row]:
+        dialect = db.get_bind().dialect.name
+        terms = re.findall(r"\w+", query)
+        if dialect == "postgresql":
+            stmt = self._search_tsvector(query)
+        elif not terms:
+            return []
+        elif dialect == "sqlite":
+            stmt = self._search_fts5(" ".join(f'"{term}"' for term in terms))
+        else:
+            stmt = self._search_like(terms)
+        if board_id is not None:
+            stmt = stmt.where(Column.board_id == board_id)
+        return db.execute(stmt.limit(limit).offset(offset)).all()
+
+    def _search_tsvector(self, query: str) -> Select:
+        # Must match the expression of the GIN index for the planner to use it.
+        vector = literal_column(SEARCH_VECTOR)
+        ts_query = func.websearch_to_tsquery(literal_column(f"'{SEARCH_CONFIG}'"), query)
+        rank = func.ts_rank(vector, ts_query)
+        return (
+            select(*CARD_COLUMNS, Column.board_id, rank.label("rank"))
+            .join(Column, Card.column_id == Column.id)
+            .where(vector.op("@@")(ts_query))
+            .order_by(rank.desc(), Card.id)
+        )
+
+    def _search_fts5(self, match: str) -> Select:
+        # bm25 scores are negative, lower is better.
+        return (
+            select(*CARD_COLUMNS, Column.board_id, (-cards_fts.c.rank).label("rank"))
+            .select_from(cards_fts)
+            .join(Card, Card.id == cards_fts.c.card_id)
+            .join(Column, Card.column_id == Column.id)
+            .where(literal_column(FTS_TABLE).op("MATCH")(f"{FTS_SEARCH_COLUMNS}: ({match})"))
+            .order_by(cards_fts.c.rank, Card.id)
+        )
+
+    def _search_like(self, terms: list[str]) -> Select:
+        # Dialects without a full-text index scan the cards; every term must appear somewhere.
+        matches = [
+            or_(Card.title.icontains(term, autoescape=True), Card.description.icontains(term, autoescape=True))
+            for term in terms
+        ]
+        return (
+            select(*CARD_COLUMNS, Column.board_id, literal(0.0).label("rank"))
+            .join(Column, Card.column_id == Column.id)
+            .where(*matches)
+            .order_by(Card.id)
+        )
+
+    def get_many_in_board(self, db: Session, board_id: str, card_ids: set[str]) -> list:
+        if not card_ids:
+            return []
+        return db.execute(
+            select(*CARD_COLUMNS)
+            .join(Column, Card.column_id == Column.id)
+            .where(Column.board_id == board_id, Card.id.in_(card_ids))
+        ).all()
+
+    def last_positions(self, db: Session, column_ids: set[str]) -> dict[str, int]:
+        if not column_ids:
+            return {}
+        rows = db.execute(
+            select(Card.column_id, func.max(Card.position))
+            .where(Card.column_id.in_(column_ids))
+            .group_by(Card.column_id)
+        ).all()
+        return {column_id: position for column_id, position in rows}
+
+    def bulk_write(
+        self,
+        db: Session,
+        board_id: str,
+        inserts: list[dict],
+        updates: list[dict],
+        delete_ids: set[str],
+        read_versions: dict[str, int],
+    ) -> set[str]:
+        # Only cards still at the version the batch read are written. Returns the ids that
+        # changed underneath it, in which case the whole batch is rolled back.
+        if inserts:
+            db.execute(insert(Card), inserts)
+        written = 0
+        if updates:
+            # Column names are reserved as bind names on UPDATE, hence the prefix.
+            stmt = (
+                update(CARDS)
+                .where(CARDS.c.id == bindparam("b_id"), CARDS.c.version == bindparam("b_read_version"))
+                .values(
+                    title=bindparam("b_title"),
+                    description=bindparam("b_description"),
+                    column_id=bindparam("b_column_id"),
+                    position=bindparam("b_position"),
+                    version=CARDS.c.version + bindparam("b_bump"),
+                )
+            )
+            params = [
+                {
+                    "b_id": card["id"],
+                    "b_read_version": read_versions[card["id"]],
+                    "b_title": card["title"],
+                    "b_description": card["description"],
+                    "b_column_id": card["column_id"],
+                    "b_position": card["position"],
+                    "b_bump": card["version"] - read_versions[card["id"]],
+                }
+                for card in updates
+            ]
+            if db.get_bind().dialect.supports_sane_multi_rowcount:
+                written += db.execute(stmt, params).rowcount
+            else:
+                written += sum(db.execute(stmt, row).rowcount for row in params)
+        if delete_ids:
+            written += db.execute(
+                delete(CARDS).where(
+                    tuple_(CARDS.c.id, CARDS.c.version).in_(
+                        [(card_id, read_versions[card_id]) for card_id in delete_ids]
+                    )
+                )
+            ).rowcount
+        if written != len(updates) + len(delete_ids):
+            db.rollback()
+            expected = {card["id"] for card in updates} | delete_ids
+            current = dict(db.execute(select(Card.id, Card.version).where(Card.id.in_(expected))).all())
+            return {card_id for card_id in expected if current.get(card_id) != read_versions[card_id]}
+        self.board_repository.bump_version(db, board_id)
+        return set()
+
+    def delete_chunk_for_board(self, db: Session, board_id: str, limit: int) -> int:
+        column_ids = select(Column.id).where(Column.board_id == board_id)
+        return self._delete_chunk(db, board_id, Card.column_id.in_(column_ids), limit)
+
+    def delete_chunk_for_column(self, db: Session, board_id: str, column_id: str, limit: int) -> int:
+        return self._delete_chunk(db, board_id, Card.column_id == column_id, limit)
 
-        max_position = db.query(Card).filter(Card.column_id == column_id).count()
-        card = Card(column_id=column_id, title=title, description=description, position=max_position)
-        db.add(card)
+    def _delete_chunk(self, db: Session, board_id: str, criterion, limit: int) -> int:
+        chunk = select(Card.id).where(criterion).limit(limit)
+        stmt = delete(Card).where(Card.id.in_(chunk)).execution_options(synchronize_session=False)
+        deleted = db.execute(stmt).rowcount
+        if deleted:
+            self.board_repository.bump_version(db, board_id)
         db.commit()
-        db.refresh(card)
-        return card
+        return deleted
 
-    def get_by_id(self, db: Session, card_id: str) -> Card | None:
-        return db.query(Card).filter(Card.id == card_id).first()
+    def get_version(self, db: Session, card_id: str) -> int | None:
+        return db.execute(select(Card.version).where(Card.id == card_id)).scalar()
 
-    def update(self, db: Session, card: Card, title=None, description=None) -> Card:
+    def update(
+        self, db: Session, card_id: str, title=None, description=None, expected_version: int | None = None
+    ) -> Row | None:
+        changes = {}
         if title is not None:
-            card.title = title
+            changes["title"] = title
         if description is not None:
-            card.description = description
-        db.commit()
-        db.refresh(card)
+            changes["description"] = description
+        criteria = [Card.id == card_id]
+        if expected_version is not None:
+            criteria.append(Card.version == expected_version)
+        if not changes:
+            return db.execute(select(*CARD_COLUMNS).where(*criteria)).first()
+
+        stmt = update(Card).where(*criteria).values(**changes, version=Card.version + 1)
+        card = execute_returning(db, stmt, CARD_COLUMNS, Card.id == card_id)
+        if not card:
+            return None
+        self.board_repository.bump_version_for_column(db, card.column_id)
         return card
 
-    def delete(self, db: Session, card: Card) -> None:
-        db.delete(card)
-        db.commit()
+    def delete(self, db: Session, card_id: str, expected_version: int | None = None) -> bool:
+        stmt = delete(Card).where(Card.id == card_id)
+        if expected_version is not None:
+            stmt = stmt.where(Card.version == expected_version)
+        card = execute_returning(db, stmt, (Card.column_id,), Card.id == card_id)
+        if not card:
+            return False
+        self.board_repository.bump_version_for_column(db, card.column_id)
+        return True
 
-    def move(self, db: Session, card: Card, new_column_id: str) -> Card:
-        card.column_id = new_column_id
-        max_position = db.query(Card).filter(Card.column_id == new_column_id).count()
-        card.position = max_position
-        db.commit()
-        db.refresh(card)
-        return card
+    def move(
+        self,
+        db: Session,
+        card_id: str,
+        new_column_id: str,
+        after_card_id: str | None = None,
+        before_card_id: str | None = None,
+        expected_version: int | None = None,
+    ) -> Row | None:
+        if after_card_id or before_card_id:
+            position = self.position_between(db, card_id, new_column_id, after_card_id, before_card_id)
+            if position is None:
+                db.rollback()
+                return None
+        else:
+            last_position = (
+                select(func.max(Card.position)).where(Card.column_id == new_column_id).scalar_subquery()
+            )
+            position = func.coalesce(last_position + POSITION_GAP, 0)
+
+        # The card moves only if the target column exists on the board of its current column.
+        source = aliased(Column)
+        same_board = (
+            select(Column.id)
+            .join(source, source.board_id == Column.board_id)
+            .where(Column.id == new_column_id, source.id == Card.column_id)
+            .exists()
+        )
+        criteria = [Card.id == card_id, same_board]
+        if expected_version is not None:
+            criteria.append(Card.version == expected_version)
+        stmt = (
+            update(Card)
+            .where(*criteria)
+            .values(column_id=new_column_id, position=position, version=Card.version + 1)
+        )
+        moved = execute_returning(db, stmt, CARD_COLUMNS, Card.id == card_id)
+        if not moved:
+            db.rollback()
+            return None
+        self.board_repository.bump_version_for_column(db, new_column_id)
+        return moved
+
+    def position_between(
+        self,
+        db: Session,
+        card_id: str,
+        column_id: str,
+        after_card_id: str | None,
+        before_card_id: str | None,
+        rebalanced: bool = False,
+    ) -> int | None:
+        anchor_id = after_card_id or before_card_id
+        if anchor_id == card_id:
+            return None
+        anchor = (
+            db.query(Card.position)
+            .filter(Card.id == anchor_id, Card.column_id == column_id)
+            .scalar()
+        )
+        if anchor is None:
+            return None
+
+        others = db.query(Card.position).filter(Card.column_id == column_id, Card.id != card_id)
+        if after_card_id:
+            lower = anchor
+            upper = others.filter(Card.position > anchor).order_by(Card.position).limit(1).scalar()
+            if upper is None:
+                return lower + POSITION_GAP
+        else:
+            upper = anchor
+            lower = others.filter(Card.position < anchor).order_by(Card.position.desc()).limit(1).scalar()
+            if lower is None:
+                return upper - POSITION_GAP
+
+        if upper - lower > 1:
+            return (lower + upper) // 2
+        if rebalanced:
+            return None
+        self.rebalance_column(db, column_id)
+        return self.position_between(db, card_id, column_id, after_card_id, before_card_id, rebalanced=True)
+
+    def rebalance_column(self, db: Session, column_id: str) -> None:
+        card_ids = (
+            db.query(Card.id)
+            .filter(Card.column_id == column_id)
+            .order_by(Card.position, Card.id)
+            .all()
+        )
+        if not card_ids:
+            return
+        # Positions are unique per column, so park the cards below every old and new position first.
+        lowest = min(db.query(func.min(Card.position)).filter(Card.column_id == column_id).scalar(), 0)
+        db.execute(
+            update(Card),
+            [{"id": row.id, "position": lowest - 1 - index} for index, row in enumerate(card_ids)],
+        )
+        db.execute(
+            update(Card),
+            [{"id": row.id, "position": index * POSITION_GAP} for index, row in enumerate(card_ids)],
+        )
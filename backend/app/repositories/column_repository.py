@@ -1,21 +1,56 @@
 from __future__ import annotations
+import uuid
+
+from sqlalchemy import Row, delete, func, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.models import Column, Board
+from app.models import Column
+from app.repositories.board_repository import BoardRepository
+from app.repositories.returning import execute_returning
+
+COLUMN_COLUMNS = (Column.id, Column.name, Column.board_id, Column.position)
 
 
 class ColumnRepository:
-    def create(self, db: Session, board_id: str, name: str) -> Column | None:
-        board = db.query(Board).filter(Board.id == board_id).first()
-        if not board:
-            return None
+    def __init__(self):
+        self.board_repository = BoardRepository()
 
-        max_position = db.query(Column).filter(Column.board_id == board_id).count()
-        column = Column(board_id=board_id, name=name, position=max_position)
-        db.add(column)
-        db.commit()
-        db.refresh(column)
+    def create(self, db: Session, board_id: str, name: str) -> Row | None:
+        column_id = str(uuid.uuid4())
+        last_position = select(func.max(Column.position)).where(Column.board_id == board_id).scalar_subquery()
+        stmt = insert(Column).values(
+            id=column_id,
+            board_id=board_id,
+            name=name,
+            position=func.coalesce(last_position + 1, 0),
+        )
+        try:
+            column = execute_returning(db, stmt, COLUMN_COLUMNS, Column.id == column_id)
+        except IntegrityError:
+            db.rollback()
+            return None
+        self.board_repository.bump_version(db, board_id)
         return column
 
+    def insert_many(self, db: Session, rows: list[dict]) -> None:
+        if rows:
+            db.execute(insert(Column), rows)
+
+    def delete(self, db: Session, board_id: str, column_id: str) -> bool:
+        stmt = delete(Column).where(Column.id == column_id, Column.board_id == board_id)
+        if not db.execute(stmt).rowcount:
+            db.rollback()
+            return False
+        self.board_repository.bump_version(db, board_id)
+        return True
+
+    def exists(self, db: Session, board_id: str, column_id: str) -> bool:
+        stmt = select(Column.id).where(Column.id == column_id, Column.board_id == board_id)
+        return db.execute(stmt).first() is not None
+
     def get_by_id(self, db: Session, column_id: str) -> Column | None:
         return db.query(Column).filter(Column.id == column_id).first()
+
+    def get_ids_for_board(self, db: Session, board_id: str) -> set[str]:
+        return set(db.scalars(select(Column.id).where(Column.board_id == board_id)))
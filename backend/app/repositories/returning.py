@@ -0,0 +1,27 @@
+from __future__ import annotations
+from sqlalchemy import Row, select
+from sqlalchemy.orm import Session
+
+
+def execute_returning(db: Session, stmt, columns: tuple, where) -> Row | None:
+    stmt = stmt.execution_options(synchronize_session=False)
+    dialect = db.get_bind().dialect
+    if stmt.is_insert:
+        supported = dialect.insert_returning
+    elif stmt.is_update:
+        supported = dialect.update_returning
+    else:
+        supported = dialect.delete_returning
+
+    if supported:
+        return db.execute(stmt.returning(*columns)).first()
+
+    if stmt.is_delete:
+        row = db.execute(select(*columns).where(where)).first()
+        if row:
+            db.execute(stmt)
+        return row
+    result = db.execute(stmt)
+    if stmt.is_update and result.rowcount == 0:
+        return None
+    return db.execute(select(*columns).where(where)).first()
@@ -0,0 +1,17 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dump_json(content: Any) -> bytes:
+    return orjson.dumps(content)
+
+
+def load_json(content: bytes | str) -> Any:
+    return orjson.loads(content)
+
+
+class OrjsonResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
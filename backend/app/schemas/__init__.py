@@ -1,3 +1,7 @@
-from app.schemas.board import BoardCreate, BoardResponse, BoardDetailResponse
+from app.schemas.board import BoardCreate, BoardResponse, BoardDetailResponse, BoardListItem
 from app.schemas.column import ColumnCreate, ColumnResponse
-from app.schemas.card import CardCreate, CardUpdate, CardResponse, CardMove
+from app.schemas.card import (
+    CardCreate, CardUpdate, CardResponse, CardMove, CardSearchResult,
+    CardBatchRequest, CardBatchResponse, CardOperationResult,
+)
+from app.schemas.transfer import BoardRecord, ColumnRecord, CardRecord, BoardImportResponse
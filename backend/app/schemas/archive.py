@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class ArchivedCardResponse(BaseModel):
+    id: str
+    title: str
+    description: Optional[str]
+    column_id: str
+    board_id: str
+    position: int
+    version: int
+    updated_at: Optional[datetime]
+    archived_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ArchiveResponse(BaseModel):
+    archived: int
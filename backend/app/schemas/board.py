@@ -14,6 +14,23 @@ class BoardResponse(BaseModel):
         from_attributes = True
 
 
+class BoardChangesResponse(BaseModel):
+    version: int
+    reset: bool
+    has_more: bool
+    changes: list[dict]
+
+
+class BoardListItem(BaseModel):
+    id: str
+    name: str
+    column_count: Optional[int] = None
+    card_count: Optional[int] = None
+
+    class Config:
+        from_attributes = True
+
+
 class ColumnInBoard(BaseModel):
     id: str
     name: str
@@ -28,6 +45,8 @@ class CardInColumn(BaseModel):
     title: str
     description: Optional[str]
     column_id: str
+    position: int
+    version: int
 
     class Config:
         from_attributes = True
@@ -38,6 +57,7 @@ class ColumnWithCards(BaseModel):
     name: str
     board_id: str
     cards: list[CardInColumn] = []
+    card_count: Optional[int] = None
 
     class Config:
         from_attributes = True
@@ -46,6 +66,7 @@ class ColumnWithCards(BaseModel):
 class BoardDetailResponse(BaseModel):
     id: str
     name: str
+    version: int
     columns: list[ColumnWithCards] = []
 
     class Config:
@@ -1,5 +1,5 @@
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional, Union
+from pydantic import BaseModel, Field, model_validator
 from pydantic.fields import AliasChoices
 
 
@@ -15,6 +15,18 @@ class CardUpdate(BaseModel):
 
 class CardMove(BaseModel):
     new_column_id: str = Field(validation_alias=AliasChoices("newColumnId", "new_column_id"))
+    after_card_id: Optional[str] = Field(
+        default=None, validation_alias=AliasChoices("afterCardId", "after_card_id")
+    )
+    before_card_id: Optional[str] = Field(
+        default=None, validation_alias=AliasChoices("beforeCardId", "before_card_id")
+    )
+
+    @model_validator(mode="after")
+    def check_single_anchor(self):
+        if self.after_card_id and self.before_card_id:
+            raise ValueError("Provide either after_card_id or before_card_id, not both")
+        return self
 
 
 class CardResponse(BaseModel):
@@ -22,6 +34,78 @@ class CardResponse(BaseModel):
     title: str
     description: Optional[str]
     column_id: str
+    position: int
+    version: int
+
+    class Config:
+        from_attributes = True
+
+
+class CardSearchResult(BaseModel):
+    id: str
+    title: str
+    description: Optional[str]
+    column_id: str
+    board_id: str
+    position: int
+    rank: float
 
     class Config:
         from_attributes = True
+
+
+class CardCreateOperation(BaseModel):
+    op: Literal["create"]
+    column_id: str = Field(validation_alias=AliasChoices("columnId", "column_id"))
+    title: str = Field(min_length=1)
+    description: Optional[str] = None
+
+
+class CardUpdateOperation(BaseModel):
+    op: Literal["update"]
+    card_id: str = Field(validation_alias=AliasChoices("cardId", "card_id"))
+    expected_version: Optional[int] = Field(
+        default=None, validation_alias=AliasChoices("expectedVersion", "expected_version")
+    )
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+class CardMoveOperation(BaseModel):
+    op: Literal["move"]
+    card_id: str = Field(validation_alias=AliasChoices("cardId", "card_id"))
+    new_column_id: str = Field(validation_alias=AliasChoices("newColumnId", "new_column_id"))
+    expected_version: Optional[int] = Field(
+        default=None, validation_alias=AliasChoices("expectedVersion", "expected_version")
+    )
+
+
+class CardDeleteOperation(BaseModel):
+    op: Literal["delete"]
+    card_id: str = Field(validation_alias=AliasChoices("cardId", "card_id"))
+    expected_version: Optional[int] = Field(
+        default=None, validation_alias=AliasChoices("expectedVersion", "expected_version")
+    )
+
+
+CardOperation = Annotated[
+    Union[CardCreateOperation, CardUpdateOperation, CardMoveOperation, CardDeleteOperation],
+    Field(discriminator="op"),
+]
+
+
+class CardBatchRequest(BaseModel):
+    operations: list[CardOperation] = Field(min_length=1, max_length=1000)
+
+
+class CardOperationResult(BaseModel):
+    index: int
+    op: str
+    status: Literal["ok", "error", "skipped"]
+    card: Optional[CardResponse] = None
+    error: Optional[str] = None
+
+
+class CardBatchResponse(BaseModel):
+    applied: bool
+    results: list[CardOperationResult]
@@ -0,0 +1,34 @@
+from typing import Annotated, Literal, Optional, Union
+from pydantic import BaseModel, Field
+
+
+class BoardRecord(BaseModel):
+    type: Literal["board"]
+    id: Optional[str] = None
+    name: str = Field(min_length=1)
+
+
+class ColumnRecord(BaseModel):
+    type: Literal["column"]
+    id: str
+    name: str = Field(min_length=1)
+    position: int
+
+
+class CardRecord(BaseModel):
+    type: Literal["card"]
+    id: Optional[str] = None
+    column_id: str
+    title: str = Field(min_length=1)
+    description: Optional[str] = None
+    position: int
+
+
+TransferRecord = Annotated[Union[BoardRecord, ColumnRecord, CardRecord], Field(discriminator="type")]
+
+
+class BoardImportResponse(BaseModel):
+    id: str
+    name: str
+    column_count: int
+    card_count: int
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from app.repositories.archive_repository import ArchiveRepository
+from app.repositories.card_repository import CardRepository
+from app.repositories.column_repository import ColumnRepository
+from app.services.base import BoardWriteService, VersionConflict
+from app.services.board_service import InvalidCursor, decode_cursor, encode_cursor
+
+
+def updated_before(older_than_days: int | None) -> datetime | None:
+    if older_than_days is None:
+        return None
+    return datetime.now(timezone.utc) - timedelta(days=older_than_days)
+
+
+class ArchiveService(BoardWriteService):
+    def __init__(self, db: Session, **kwargs):
+        super().__init__(db, **kwargs)
+        self.repository = ArchiveRepository()
+        self.card_repository = CardRepository()
+        self.column_repository = ColumnRepository()
+
+    def archive_card(self, card_id: str, expected_version: int | None = None) -> bool:
+        if self.repository.archive_card(self.db, card_id, expected_version) is None:
+            current = self.card_repository.get_version(self.db, card_id)
+            if expected_version is not None and current is not None and current != expected_version:
+                raise VersionConflict("Card", card_id, current)
+            return False
+        self._publish_changes("cards.archived", {"card_ids": [card_id]})
+        return True
+
+    def archive_column(
+        self, board_id: str, column_id: str, older_than_days: int | None, chunk_size: int
+    ) -> int | None:
+        if not self.column_repository.exists(self.db, board_id, column_id):
+            return None
+        return self._archive_column(board_id, column_id, updated_before(older_than_days), chunk_size)
+
+    def archive_stale(self, older_than_days: int, chunk_size: int) -> int:
+        cutoff = updated_before(older_than_days)
+        columns = self.repository.get_stale_last_columns(self.db, cutoff)
+        return sum(self._archive_column(board_id, column_id, cutoff, chunk_size) for board_id, column_id in columns)
+
+    def list_archived(
+        self, board_id: str, limit: int, cursor: str | None = None
+    ) -> tuple[list[dict], str | None] | None:
+        after = None
+        if cursor:
+            archived_at, card_id = decode_cursor(cursor)
+            try:
+                after = (datetime.fromisoformat(archived_at), card_id)
+            except ValueError as e:
+                raise InvalidCursor("Invalid cursor") from e
+        rows = self.repository.get_page(self.db, board_id, limit + 1, after)
+        if not rows and self.board_repository.get_version(self.db, board_id) is None:
+            return None
+        cards = [row._asdict() for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(cards[-1]["archived_at"].isoformat(), cards[-1]["id"])
+        return cards, next_cursor
+
+    def _archive_column(
+        self, board_id: str, column_id: str, cutoff: datetime | None, chunk_size: int
+    ) -> int:
+        archived = 0
+        while card_ids := self.repository.archive_column_chunk(self.db, board_id, column_id, cutoff, chunk_size):
+            archived += len(card_ids)
+            self._publish_changes("cards.archived", {"card_ids": card_ids})
+            if len(card_ids) < chunk_size:
+                break
+        return archived
@@ -0,0 +1,62 @@
+from __future__ import annotations
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.cache import BoardCache, board_cache
+from app.config import settings
+from app.events import EventBroker, event_broker
+from app.repositories.board_change_repository import BoardChangeRepository
+from app.repositories.board_repository import BoardRepository
+from app.repositories.card_repository import is_position_conflict
+from app.responses import dump_json
+
+POSITION_RETRIES = 3
+
+
+class VersionConflict(Exception):
+    def __init__(self, resource: str, resource_id: str, current_version: int):
+        super().__init__(f"{resource} was modified concurrently")
+        self.resource_id = resource_id
+        self.current_version = current_version
+
+
+class PositionConflict(Exception):
+    def __init__(self, attempts: int):
+        super().__init__(f"Card position was taken concurrently {attempts} times; retry the request")
+
+
+class BoardWriteService:
+    def __init__(self, db: Session, cache: BoardCache = board_cache, events: EventBroker = event_broker):
+        self.db = db
+        self.cache = cache
+        self.events = events
+        self.board_repository = BoardRepository()
+        self.change_repository = BoardChangeRepository(settings.change_log_retention)
+
+    def _publish_changes(self, event_type: str, payload: dict) -> None:
+        events = {
+            board_id: {"type": event_type, "version": version, **payload}
+            for board_id, version in self.board_repository.pop_changed(self.db).items()
+        }
+        # Repositories leave the write uncommitted so its log entry lands in the same transaction.
+        for board_id, event in events.items():
+            self.change_repository.append(self.db, board_id, event["version"], dump_json(event).decode())
+        self.db.commit()
+        for board_id, event in events.items():
+            self.cache.invalidate(board_id)
+            self.events.publish(board_id, event)
+
+    def _retry_positions(self, write):
+        # Card positions are unique per column; a write that lost the race for a slot recomputes it.
+        for _ in range(POSITION_RETRIES):
+            try:
+                return write()
+            except IntegrityError as error:
+                self.db.rollback()
+                if not is_position_conflict(error):
+                    raise
+        raise PositionConflict(POSITION_RETRIES)
+
+    def _invalidate_changes(self) -> None:
+        for board_id in self.board_repository.pop_changed(self.db):
+            self.cache.invalidate(board_id)
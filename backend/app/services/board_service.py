@@ -1,25 +1,105 @@
 from __future__ import annotations
+import base64
+import binascii
+import json
+
 from sqlalchemy.orm import Session
 
+from app.cache import CachedBoard
 from app.repositories.board_repository import BoardRepository
-from app.schemas.board import BoardCreate, BoardDetailResponse, BoardResponse
+from app.repositories.card_repository import CardRepository
+from app.responses import dump_json, load_json
+from app.schemas.board import BoardCreate, BoardResponse
+from app.services.base import BoardWriteService
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(name: str, board_id: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([name, board_id]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        name, board_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+    if not isinstance(name, str) or not isinstance(board_id, str):
+        raise InvalidCursor("Invalid cursor")
+    return name, board_id
 
 
-class BoardService:
-    def __init__(self, db: Session):
-        self.db = db
+class BoardService(BoardWriteService):
+    def __init__(self, db: Session, **kwargs):
+        super().__init__(db, **kwargs)
         self.repository = BoardRepository()
+        self.card_repository = CardRepository()
 
     def create_board(self, data: BoardCreate) -> BoardResponse:
         board = self.repository.create(self.db, data.name)
         return BoardResponse.model_validate(board)
 
-    def list_boards(self) -> list[BoardResponse]:
-        boards = self.repository.get_all(self.db)
-        return [BoardResponse.model_validate(b) for b in boards]
+    def list_boards(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        name_prefix: str | None = None,
+        include_counts: bool = False,
+    ) -> tuple[list[dict], str | None]:
+        after = decode_cursor(cursor) if cursor else None
+        rows = self.repository.get_page(self.db, limit + 1, after, name_prefix, include_counts)
+        boards = [row._asdict() for row in rows[:limit]]
+        next_cursor = encode_cursor(boards[-1]["name"], boards[-1]["id"]) if len(rows) > limit else None
+        return boards, next_cursor
 
-    def get_board(self, board_id: str) -> BoardDetailResponse | None:
-        board = self.repository.get_by_id_with_columns_and_cards(self.db, board_id)
+    def get_board_version(self, board_id: str) -> int | None:
+        return self.repository.get_version(self.db, board_id)
+
+    def get_board_snapshot(
+        self, board_id: str, version: int, cards_limit: int | None = None
+    ) -> CachedBoard | None:
+        variant = "" if cards_limit is None else f"cards_limit={cards_limit}"
+        cached = self.cache.get(board_id, version, variant)
+        if cached:
+            return cached
+        board = self.repository.get_detail(self.db, board_id, cards_limit)
         if not board:
             return None
-        return BoardDetailResponse.model_validate(board)
+        body = dump_json(board)
+        snapshot = CachedBoard(version=board["version"], body=body)
+        self.cache.set(board_id, snapshot, variant)
+        return snapshot
+
+    def get_changes(self, board_id: str, since: int, limit: int) -> dict | None:
+        version = self.repository.get_version(self.db, board_id)
+        if version is None:
+            return None
+        rows = self.change_repository.get_since(self.db, board_id, since, limit) if since < version else []
+        last = rows[-1].version if rows else since
+        contiguous = [row.version for row in rows] == list(range(since + 1, last + 1))
+        has_more = len(rows) == limit and last < version
+        if since > version or not contiguous or (last < version and not has_more):
+            return {"version": version, "reset": True, "has_more": False, "changes": []}
+        return {
+            "version": last,
+            "reset": False,
+            "has_more": has_more,
+            "changes": [load_json(row.event) for row in rows],
+        }
+
+    def delete_board(self, board_id: str) -> bool:
+        if not self.repository.delete(self.db, board_id):
+            return False
+        self._publish_deleted(board_id)
+        return True
+
+    def purge_board(self, board_id: str, chunk_size: int) -> bool:
+        while self.card_repository.delete_chunk_for_board(self.db, board_id, chunk_size):
+            self._invalidate_changes()
+        return self.delete_board(board_id)
+
+    def _publish_deleted(self, board_id: str) -> None:
+        self.cache.invalidate(board_id)
+        self.events.publish(board_id, {"type": "board.deleted", "board_id": board_id})
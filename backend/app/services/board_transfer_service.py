@@ -0,0 +1,152 @@
+from __future__ import annotations
+import uuid
+from typing import AsyncIterator
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.orm import Session
+
+from app.database import DbSession, begin_snapshot, stream_db
+from app.repositories.board_repository import BoardRepository
+from app.repositories.card_repository import CardRepository
+from app.repositories.column_repository import ColumnRepository
+from app.responses import dump_json
+from app.schemas.transfer import BoardImportResponse, BoardRecord, ColumnRecord, TransferRecord
+
+EXPORT_CHUNK_SIZE = 1000
+IMPORT_CHUNK_SIZE = 1000
+IMPORT_MAX_LINE_BYTES = 1 << 20
+
+record_adapter = TypeAdapter(TransferRecord)
+
+
+class InvalidImport(ValueError):
+    def __init__(self, line_number: int, message: str):
+        super().__init__(f"Line {line_number}: {message}")
+        self.line_number = line_number
+
+
+def ndjson_line(record: dict) -> bytes:
+    return dump_json(record) + b"\n"
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes], max_line_bytes: int | None = None
+) -> AsyncIterator[bytes]:
+    max_line_bytes = max_line_bytes or IMPORT_MAX_LINE_BYTES
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if len(line) > max_line_bytes:
+                raise InvalidImport(line_number, f"Line exceeds {max_line_bytes} bytes")
+            yield line
+        # Without this a body with no newlines would be buffered whole.
+        if len(buffer) > max_line_bytes:
+            raise InvalidImport(line_number + 1, f"Line exceeds {max_line_bytes} bytes")
+    if buffer:
+        yield buffer
+
+
+class BoardTransferService:
+    def __init__(self, db: Session):
+        self.db = db
+        self.repository = BoardRepository()
+
+    def get_export_header(self, board_id: str) -> dict | None:
+        # The cards are streamed afterwards in this same transaction, so both come from one snapshot.
+        begin_snapshot(self.db)
+        return self.repository.get_export_header(self.db, board_id)
+
+
+async def export_board_ndjson(db: DbSession, board_id: str, header: dict) -> AsyncIterator[bytes]:
+    yield ndjson_line({"type": "board", **header["board"]})
+    if header["columns"]:
+        yield b"".join(ndjson_line({"type": "column", **column}) for column in header["columns"])
+    query = BoardRepository().export_cards_query(board_id)
+    async for rows in stream_db(db, query, EXPORT_CHUNK_SIZE):
+        yield b"".join(ndjson_line({"type": "card", **row._asdict()}) for row in rows)
+
+
+class BoardImporter:
+    def __init__(self, chunk_size: int | None = None):
+        self.chunk_size = chunk_size or IMPORT_CHUNK_SIZE
+        self.board_repository = BoardRepository()
+        self.column_repository = ColumnRepository()
+        self.card_repository = CardRepository()
+        self.board = None
+        self.board_name: str | None = None
+        self.column_ids: dict[str, str] = {}
+        self.pending_columns: list[dict] = []
+        self.pending_cards: list[dict] = []
+        self.card_positions: set[tuple[str, int]] = set()
+        self.column_count = 0
+        self.card_count = 0
+        self.line_number = 0
+
+    def add_line(self, line: bytes) -> bool:
+        self.line_number += 1
+        if not line.strip():
+            return False
+        try:
+            record = record_adapter.validate_json(line)
+        except ValidationError as e:
+            raise InvalidImport(self.line_number, e.errors()[0]["msg"]) from e
+
+        if isinstance(record, BoardRecord):
+            if self.board_name is not None:
+                raise InvalidImport(self.line_number, "Only one board record is allowed")
+            self.board_name = record.name
+            return False
+        if self.board_name is None:
+            raise InvalidImport(self.line_number, "The first record must be the board")
+
+        if isinstance(record, ColumnRecord):
+            if record.id in self.column_ids:
+                raise InvalidImport(self.line_number, f"Duplicate column {record.id!r}")
+            column_id = str(uuid.uuid4())
+            self.column_ids[record.id] = column_id
+            self.pending_columns.append({"id": column_id, "name": record.name, "position": record.position})
+        else:
+            column_id = self.column_ids.get(record.column_id)
+            if column_id is None:
+                raise InvalidImport(self.line_number, f"Unknown column {record.column_id!r}")
+            if (column_id, record.position) in self.card_positions:
+                raise InvalidImport(
+                    self.line_number, f"Duplicate position {record.position} in column {record.column_id!r}"
+                )
+            self.card_positions.add((column_id, record.position))
+            self.pending_cards.append({
+                "id": str(uuid.uuid4()),
+                "column_id": column_id,
+                "title": record.title,
+                "description": record.description,
+                "position": record.position,
+            })
+        return len(self.pending_columns) + len(self.pending_cards) >= self.chunk_size
+
+    def flush(self, db: Session) -> None:
+        if self.board is None:
+            self.board = self.board_repository.insert(db, self.board_name)
+        self.column_repository.insert_many(
+            db, [{**column, "board_id": self.board.id} for column in self.pending_columns]
+        )
+        self.card_repository.insert_many(db, self.pending_cards)
+        self.column_count += len(self.pending_columns)
+        self.card_count += len(self.pending_cards)
+        self.pending_columns = []
+        self.pending_cards = []
+
+    def finish(self, db: Session) -> BoardImportResponse:
+        if self.board_name is None:
+            raise InvalidImport(self.line_number, "Missing board record")
+        self.flush(db)
+        db.commit()
+        return BoardImportResponse(
+            id=self.board.id,
+            name=self.board.name,
+            column_count=self.column_count,
+            card_count=self.card_count,
+        )
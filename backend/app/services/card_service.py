@@ -1,52 +1,213 @@
 from __future__ import annotations
+import uuid
+
 from sqlalchemy.orm import Session
 
-from app.repositories.card_repository import CardRepository
+from app.repositories.card_repository import CardRepository, POSITION_GAP
 from app.repositories.column_repository import ColumnRepository
-from app.schemas.card import CardCreate, CardUpdate, CardResponse, CardMove
+from app.schemas.card import (
+    CardCreate, CardUpdate, CardResponse, CardMove,
+    CardBatchRequest, CardBatchResponse, CardOperationResult,
+)
+from app.services.base import BoardWriteService, VersionConflict
+from app.services.board_service import InvalidCursor, decode_cursor, encode_cursor
 
 
-class CardService:
-    def __init__(self, db: Session):
-        self.db = db
+class CardService(BoardWriteService):
+    def __init__(self, db: Session, **kwargs):
+        super().__init__(db, **kwargs)
         self.card_repository = CardRepository()
         self.column_repository = ColumnRepository()
 
     def create_card(self, column_id: str, data: CardCreate) -> CardResponse | None:
-        card = self.card_repository.create(self.db, column_id, data.title, data.description)
+        card = self._retry_positions(
+            lambda: self.card_repository.create(self.db, column_id, data.title, data.description)
+        )
         if not card:
             return None
-        return CardResponse.model_validate(card)
+        response = CardResponse.model_validate(card)
+        self._publish_changes("card.created", {"card": response.model_dump()})
+        return response
 
-    def update_card(self, card_id: str, data: CardUpdate) -> CardResponse | None:
-        card = self.card_repository.get_by_id(self.db, card_id)
-        if not card:
+    def list_column_cards(
+        self, column_id: str, limit: int, cursor: str | None = None
+    ) -> tuple[list[dict], str | None] | None:
+        after = None
+        if cursor:
+            position, card_id = decode_cursor(cursor)
+            try:
+                after = (int(position), card_id)
+            except ValueError as e:
+                raise InvalidCursor("Invalid cursor") from e
+        rows = self.card_repository.get_page_for_column(self.db, column_id, limit + 1, after)
+        if not rows and not self.column_repository.get_by_id(self.db, column_id):
+            return None
+        page = rows[:limit]
+        next_cursor = encode_cursor(str(page[-1].position), page[-1].id) if len(rows) > limit else None
+        return [row._asdict() for row in page], next_cursor
+
+    def search_cards(
+        self, query: str, board_id: str | None, limit: int, offset: int = 0
+    ) -> tuple[list[dict], int | None] | None:
+        rows = self.card_repository.search(self.db, query, board_id, limit + 1, offset)
+        if not rows and board_id is not None and self.board_repository.get_version(self.db, board_id) is None:
             return None
+        next_offset = offset + limit if len(rows) > limit else None
+        return [row._asdict() for row in rows[:limit]], next_offset
+
+    def update_card(
+        self, card_id: str, data: CardUpdate, expected_version: int | None = None
+    ) -> CardResponse | None:
         updated = self.card_repository.update(
-            self.db, card,
+            self.db, card_id,
             title=data.title,
-            description=data.description
+            description=data.description,
+            expected_version=expected_version,
         )
-        return CardResponse.model_validate(updated)
+        if not updated:
+            self._check_version(card_id, expected_version)
+            return None
+        response = CardResponse.model_validate(updated)
+        self._publish_changes("card.updated", {"card": response.model_dump()})
+        return response
 
-    def delete_card(self, card_id: str) -> bool:
-        card = self.card_repository.get_by_id(self.db, card_id)
-        if not card:
+    def delete_card(self, card_id: str, expected_version: int | None = None) -> bool:
+        if not self.card_repository.delete(self.db, card_id, expected_version):
+            self._check_version(card_id, expected_version)
             return False
-        self.card_repository.delete(self.db, card)
+        self._publish_changes("card.deleted", {"card_id": card_id})
         return True
 
-    def move_card(self, card_id: str, data: CardMove) -> CardResponse | None:
-        card = self.card_repository.get_by_id(self.db, card_id)
-        if not card:
+    def move_card(
+        self, card_id: str, data: CardMove, expected_version: int | None = None
+    ) -> CardResponse | None:
+        moved = self._retry_positions(lambda: self.card_repository.move(
+            self.db, card_id, data.new_column_id,
+            after_card_id=data.after_card_id,
+            before_card_id=data.before_card_id,
+            expected_version=expected_version,
+        ))
+        if not moved:
+            self._check_version(card_id, expected_version)
             return None
+        response = CardResponse.model_validate(moved)
+        self._publish_changes("card.moved", {"card": response.model_dump()})
+        return response
 
-        new_column = self.column_repository.get_by_id(self.db, data.new_column_id)
-        if not new_column:
-            return None
+    def _check_version(self, card_id: str, expected_version: int | None) -> None:
+        if expected_version is None:
+            return
+        current = self.card_repository.get_version(self.db, card_id)
+        if current is not None and current != expected_version:
+            raise VersionConflict("Card", card_id, current)
+
+    def apply_batch(self, board_id: str, data: CardBatchRequest) -> CardBatchResponse | None:
+        return self._retry_positions(lambda: self._apply_batch(board_id, data))
 
-        if new_column.board_id != card.column.board_id:
+    def _apply_batch(self, board_id: str, data: CardBatchRequest) -> CardBatchResponse | None:
+        if self.board_repository.get_version(self.db, board_id) is None:
             return None
 
-        moved = self.card_repository.move(self.db, card, data.new_column_id)
-        return CardResponse.model_validate(moved)
+        column_ids = self.column_repository.get_ids_for_board(self.db, board_id)
+        card_ids = {op.card_id for op in data.operations if op.op != "create"}
+        cards = {
+            row.id: row._asdict()
+            for row in self.card_repository.get_many_in_board(self.db, board_id, card_ids)
+        }
+        read_versions = {card_id: card["version"] for card_id, card in cards.items()}
+        target_column_ids = {
+            op.column_id if op.op == "create" else op.new_column_id
+            for op in data.operations
+            if op.op in ("create", "move")
+        }
+        target_column_ids &= column_ids
+        last_positions = self.card_repository.last_positions(self.db, target_column_ids)
+
+        def next_position(column_id: str) -> int:
+            last = last_positions.get(column_id)
+            position = 0 if last is None else last + POSITION_GAP
+            last_positions[column_id] = position
+            return position
+
+        created, changed, deleted = set(), set(), set()
+        results = []
+        for index, op in enumerate(data.operations):
+            card, error = None, None
+            if op.op == "create":
+                if op.column_id not in column_ids:
+                    error = "Column not found"
+                else:
+                    card = {
+                        "id": str(uuid.uuid4()),
+                        "title": op.title,
+                        "description": op.description,
+                        "column_id": op.column_id,
+                        "position": next_position(op.column_id),
+                        "version": 0,
+                    }
+                    cards[card["id"]] = card
+                    created.add(card["id"])
+            else:
+                card = cards.get(op.card_id)
+                if card is None or op.card_id in deleted:
+                    card, error = None, "Card not found"
+                elif op.expected_version is not None and op.expected_version != card["version"]:
+                    card, error = None, "Version conflict"
+                elif op.op == "update":
+                    if op.title is not None:
+                        card["title"] = op.title
+                    if op.description is not None:
+                        card["description"] = op.description
+                    card["version"] += 1
+                    changed.add(op.card_id)
+                elif op.op == "move":
+                    if op.new_column_id not in column_ids:
+                        card, error = None, "Column not found"
+                    else:
+                        card["column_id"] = op.new_column_id
+                        card["position"] = next_position(op.new_column_id)
+                        card["version"] += 1
+                        changed.add(op.card_id)
+                else:
+                    deleted.add(op.card_id)
+                    card = None
+
+            results.append(CardOperationResult(
+                index=index,
+                op=op.op,
+                status="error" if error else "ok",
+                card=CardResponse.model_validate(card) if card else None,
+                error=error,
+            ))
+
+        if any(result.error for result in results):
+            self.db.rollback()
+            return self._reject_batch(results)
+
+        conflicts = self.card_repository.bulk_write(
+            self.db,
+            board_id,
+            inserts=[cards[card_id] for card_id in created - deleted],
+            updates=[cards[card_id] for card_id in changed - created - deleted],
+            delete_ids=deleted - created,
+            read_versions=read_versions,
+        )
+        if conflicts:
+            for op, result in zip(data.operations, results):
+                if op.op != "create" and op.card_id in conflicts:
+                    result.status, result.card, result.error = "error", None, "Version conflict"
+            return self._reject_batch(results)
+        self._publish_changes("cards.batch", {
+            "operations": [
+                {"op": op.op, "card_id": op.card_id} if op.op == "delete"
+                else {"op": op.op, "card": result.card.model_dump()}
+                for op, result in zip(data.operations, results)
+            ],
+        })
+        return CardBatchResponse(applied=True, results=results)
+
+    def _reject_batch(self, results: list[CardOperationResult]) -> CardBatchResponse:
+        for result in results:
+            if not result.error:
+                result.status, result.card = "skipped", None
+        return CardBatchResponse(applied=False, results=results)
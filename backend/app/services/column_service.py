@@ -1,17 +1,36 @@
 from __future__ import annotations
 from sqlalchemy.orm import Session
 
+from app.repositories.card_repository import CardRepository
 from app.repositories.column_repository import ColumnRepository
 from app.schemas.column import ColumnCreate, ColumnResponse
+from app.services.base import BoardWriteService
 
 
-class ColumnService:
-    def __init__(self, db: Session):
-        self.db = db
+class ColumnService(BoardWriteService):
+    def __init__(self, db: Session, **kwargs):
+        super().__init__(db, **kwargs)
         self.repository = ColumnRepository()
+        self.card_repository = CardRepository()
 
     def create_column(self, board_id: str, data: ColumnCreate) -> ColumnResponse | None:
         column = self.repository.create(self.db, board_id, data.name)
         if not column:
             return None
-        return ColumnResponse.model_validate(column)
+        response = ColumnResponse.model_validate(column)
+        self._publish_changes("column.created", {"column": response.model_dump()})
+        return response
+
+    def column_exists(self, board_id: str, column_id: str) -> bool:
+        return self.repository.exists(self.db, board_id, column_id)
+
+    def delete_column(self, board_id: str, column_id: str) -> bool:
+        if not self.repository.delete(self.db, board_id, column_id):
+            return False
+        self._publish_changes("column.deleted", {"column_id": column_id})
+        return True
+
+    def purge_column(self, board_id: str, column_id: str, chunk_size: int) -> bool:
+        while self.card_repository.delete_chunk_for_column(self.db, board_id, column_id, chunk_size):
+            self._invalidate_changes()
+        return self.delete_column(board_id, column_id)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    def __init__(self, phases: dict[str, float] | None = None, clock=time.perf_counter):
+        self.phases = dict(phases or {})
+        self.clock = clock
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.clock() - start
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    def as_dict(self) -> dict:
+        return {
+            "phases_ms": {name: round(seconds * 1000, 3) for name, seconds in self.phases.items()},
+            "total_ms": round(self.total * 1000, 3),
+        }
+
+    def log(self) -> None:
+        phases = ", ".join(f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.phases.items())
+        logger.info("Worker ready in %.1f ms (%s)", self.total * 1000, phases)
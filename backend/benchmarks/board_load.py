@@ -0,0 +1,115 @@
+"""Compare the board detail read paths.
+
+    python -m benchmarks.board_load --cards 10 1000 50000
+"""
+from __future__ import annotations
+import argparse
+import json
+import statistics
+import time
+import uuid
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Board, Column, Card
+from app.repositories.board_repository import BoardRepository
+from app.schemas.board import BoardDetailResponse
+
+
+def seed_board(db: Session, columns: int, cards: int, description_size: int) -> str:
+    board_id = str(uuid.uuid4())
+    column_ids = [str(uuid.uuid4()) for _ in range(columns)]
+    db.execute(insert(Board), [{"id": board_id, "name": "Benchmark", "version": 0}])
+    db.execute(insert(Column), [
+        {"id": column_id, "board_id": board_id, "name": f"Column {i}", "position": i}
+        for i, column_id in enumerate(column_ids)
+    ])
+    description = "x" * description_size
+    db.execute(insert(Card), [
+        {
+            "id": str(uuid.uuid4()),
+            "column_id": column_ids[i % columns],
+            "title": f"Card {i}",
+            "description": description,
+            "position": i // columns,
+        }
+        for i in range(cards)
+    ])
+    db.commit()
+    return board_id
+
+
+def joinedload_path(db: Session, board_id: str) -> bytes:
+    board = (
+        db.query(Board)
+        .options(joinedload(Board.columns).joinedload(Column.cards))
+        .filter(Board.id == board_id)
+        .first()
+    )
+    return BoardDetailResponse.model_validate(board).model_dump_json().encode()
+
+
+def selectinload_path(db: Session, board_id: str) -> bytes:
+    board = BoardRepository().get_by_id_with_columns_and_cards(db, board_id)
+    return BoardDetailResponse.model_validate(board).model_dump_json().encode()
+
+
+def lean_path(db: Session, board_id: str) -> bytes:
+    board = BoardRepository().get_detail(db, board_id)
+    return json.dumps(board, separators=(",", ":")).encode()
+
+
+PATHS = {
+    "joinedload": joinedload_path,
+    "selectinload": selectinload_path,
+    "lean": lean_path,
+}
+
+
+def measure(engine, board_id: str, path, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        with Session(engine) as db:
+            start = time.perf_counter()
+            path(db, board_id)
+            timings.append(time.perf_counter() - start)
+    return {
+        "min_ms": round(min(timings) * 1000, 3),
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+    }
+
+
+def run_paths(description: str, paths: dict, default_cards: list[int], argv: list[str] | None = None) -> list[dict]:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--cards", type=int, nargs="+", default=default_cards)
+    parser.add_argument("--columns", type=int, default=5)
+    parser.add_argument("--description-size", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    engine_options = {"poolclass": StaticPool} if args.database_url == "sqlite://" else {}
+    engine = create_engine(args.database_url, **engine_options)
+    Base.metadata.create_all(bind=engine)
+
+    results = []
+    for cards in args.cards:
+        with Session(engine) as db:
+            board_id = seed_board(db, args.columns, cards, args.description_size)
+        row = {"cards": cards}
+        for name, path in paths.items():
+            row[name] = measure(engine, board_id, path, args.repeat)
+        results.append(row)
+        print(json.dumps(row))
+    return results
+
+
+def main() -> None:
+    run_paths(__doc__, PATHS, default_cards=[10, 1000, 50000])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Load-test the API in-process over ASGI against a seeded board.
+
+    python -m benchmarks.load --columns 5 --cards 1000 --requests 200 --output results.json
+    python -m benchmarks.load --baseline results.json --tolerance 0.25
+
+Exits with status 1 when a scenario regresses past the tolerance of the baseline.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+REQUEST_SCENARIOS = ("get_board", "get_board_cold", "list_boards", "create_card", "update_card", "move_card")
+LATENCY_KEYS = ("p50_ms", "p99_ms")
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    ordered = sorted(latencies)
+    to_ms = lambda seconds: round(seconds * 1000, 3)  # noqa: E731
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": to_ms(sum(ordered) / len(ordered)) if ordered else 0.0,
+        "p50_ms": to_ms(percentile(ordered, 0.50)),
+        "p95_ms": to_ms(percentile(ordered, 0.95)),
+        "p99_ms": to_ms(percentile(ordered, 0.99)),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    failures = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if not previous:
+            continue
+        if current["errors"] > previous["errors"]:
+            failures.append(f"{name}: {current['errors']} errors (baseline {previous['errors']})")
+        for key in LATENCY_KEYS:
+            limit = previous[key] * (1 + tolerance)
+            if current[key] > limit:
+                failures.append(f"{name}: {key} {current[key]} > {round(limit, 3)} (baseline {previous[key]})")
+        floor = previous["throughput_rps"] * (1 - tolerance)
+        if current["throughput_rps"] < floor:
+            failures.append(
+                f"{name}: throughput_rps {current['throughput_rps']} < {round(floor, 2)} "
+                f"(baseline {previous['throughput_rps']})"
+            )
+    return failures
+
+
+def request_factories(shape: dict, description: str) -> dict[str, Callable[[int], tuple]]:
+    board_id = shape["board_id"]
+    column_ids = shape["column_ids"]
+    card_ids = shape["card_ids"]
+    return {
+        "get_board": lambda i: ("GET", f"/boards/{board_id}", None),
+        "get_board_cold": lambda i: ("GET", f"/boards/{board_id}", None),
+        "list_boards": lambda i: ("GET", "/boards?limit=50&include_counts=true", None),
+        "create_card": lambda i: (
+            "POST",
+            f"/columns/{column_ids[i % len(column_ids)]}/cards",
+            {"title": f"Bench {i}", "description": description},
+        ),
+        "update_card": lambda i: ("PUT", f"/cards/{card_ids[i % len(card_ids)]}", {"title": f"Updated {i}"}),
+        "move_card": lambda i: (
+            "PATCH",
+            f"/cards/{card_ids[i % len(card_ids)]}/move",
+            {"newColumnId": column_ids[(i + 1) % len(column_ids)]},
+        ),
+    }
+
+
+async def run_scenario(client, factory: Callable[[int], tuple], requests: int, concurrency: int,
+                       before_request: Callable[[], None] | None = None, warmup: int = 0) -> dict:
+    for i in range(warmup):
+        method, url, body = factory(requests + i)
+        await client.request(method, url, json=body)
+
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for i in counter:
+            method, url, body = factory(i)
+            if before_request:
+                before_request()
+            start = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, errors, time.perf_counter() - start)
+
+
+async def run_suite(app, shape: dict, scenarios: tuple[str, ...], requests: int, concurrency: int,
+                    description: str = "", clear_cache: Callable[[], None] | None = None,
+                    warmup: int = 0) -> dict:
+    import httpx
+
+    factories = request_factories(shape, description)
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for name in scenarios:
+            before_request = clear_cache if name == "get_board_cold" else None
+            results[name] = await run_scenario(
+                client, factories[name], requests, concurrency, before_request, warmup
+            )
+    return results
+
+
+def seed(engine, columns: int, cards: int, description_size: int, boards: int) -> dict:
+    import uuid
+
+    from sqlalchemy import insert, select
+    from sqlalchemy.orm import Session
+
+    from app.models import Board, Card, Column
+    from benchmarks.board_load import seed_board
+
+    with Session(engine) as db:
+        board_id = seed_board(db, columns, cards, description_size)
+        if boards:
+            db.execute(insert(Board), [
+                {"id": str(uuid.uuid4()), "name": f"Board {i:06d}", "version": 0} for i in range(boards)
+            ])
+            db.commit()
+        column_ids = db.scalars(
+            select(Column.id).where(Column.board_id == board_id).order_by(Column.position)
+        ).all()
+        card_ids = db.scalars(
+            select(Card.id).where(Card.column_id.in_(column_ids)).order_by(Card.position).limit(1000)
+        ).all()
+    return {"board_id": board_id, "column_ids": list(column_ids), "card_ids": list(card_ids)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="defaults to a temporary SQLite file")
+    parser.add_argument("--async-db", action="store_true", help="serve requests with AsyncSession")
+    parser.add_argument("--columns", type=int, default=5)
+    parser.add_argument("--cards", type=int, default=1000)
+    parser.add_argument("--description-size", type=int, default=200)
+    parser.add_argument("--boards", type=int, default=200, help="extra boards for list_boards")
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=10, help="unmeasured requests per scenario")
+    parser.add_argument("--scenarios", nargs="+", choices=REQUEST_SCENARIOS, default=list(REQUEST_SCENARIOS))
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="fail when results regress against this file")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if database_url is None:
+        database_url = f"sqlite:///{Path(tempfile.mkdtemp()) / 'benchmark.db'}"
+    # Settings are read when app.config is imported.
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["DATABASE_ASYNC"] = "true" if args.async_db else "false"
+
+    from app.cache import board_cache
+    from app.database import engine
+    from app.main import app
+    from app.migrations import upgrade_database
+
+    upgrade_database(engine)
+    shape = seed(engine, args.columns, args.cards, args.description_size, args.boards)
+    scenarios = asyncio.run(run_suite(
+        app, shape, tuple(args.scenarios), args.requests, args.concurrency,
+        description="x" * args.description_size, clear_cache=board_cache.clear, warmup=args.warmup,
+    ))
+    results = {
+        "meta": {
+            "dialect": engine.dialect.name,
+            "async_db": args.async_db,
+            "columns": args.columns,
+            "cards": args.cards,
+            "description_size": args.description_size,
+            "boards": args.boards,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "python": platform.python_version(),
+        },
+        "scenarios": scenarios,
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+
+    if args.baseline:
+        failures = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare the board detail response serialization paths.
+
+    python -m benchmarks.serialization --cards 1000 50000
+"""
+from __future__ import annotations
+import json
+
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from app.repositories.board_repository import BoardRepository
+from app.responses import dump_json
+from app.schemas.board import BoardDetailResponse
+from benchmarks.board_load import run_paths
+
+response_adapter = TypeAdapter(BoardDetailResponse)
+
+
+def pydantic_path(db: Session, board_id: str) -> bytes:
+    # model_validate in the service, then FastAPI validates again against response_model.
+    board = BoardRepository().get_by_id_with_columns_and_cards(db, board_id)
+    model = BoardDetailResponse.model_validate(board)
+    return response_adapter.dump_json(response_adapter.validate_python(model))
+
+
+def lean_json_path(db: Session, board_id: str) -> bytes:
+    board = BoardRepository().get_detail(db, board_id)
+    return json.dumps(board, separators=(",", ":")).encode()
+
+
+def lean_orjson_path(db: Session, board_id: str) -> bytes:
+    return dump_json(BoardRepository().get_detail(db, board_id))
+
+
+PATHS = {
+    "pydantic": pydantic_path,
+    "lean_json": lean_json_path,
+    "lean_orjson": lean_orjson_path,
+}
+
+
+def main() -> None:
+    run_paths(__doc__, PATHS, default_cards=[1000, 50000])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,30 @@
+import atexit
 import os
+import shutil
+import tempfile
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from fastapi.testclient import TestClient
 
-os.environ["DATABASE_URL"] = "sqlite:///./test.db"
+TEST_DB_DIR = tempfile.mkdtemp(prefix="kanban-tests-")
+TEST_DB_PATH = os.path.join(TEST_DB_DIR, "test.db")
+atexit.register(shutil.rmtree, TEST_DB_DIR, ignore_errors=True)
+os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB_PATH}"
 
-from app.database import Base, get_db
+from app.cache import board_cache
+from app.database import get_db
 from app.main import app
+from app.migrations import create_schema, drop_schema
 
-engine = create_engine("sqlite:///./test.db", connect_args={"check_same_thread": False})
+engine = create_engine(f"sqlite:///{TEST_DB_PATH}", connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DB_PATH}", poolclass=NullPool)
+AsyncTestingSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 
 def override_get_db():
     db = TestingSessionLocal()
@@ -21,20 +34,26 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
+
 @pytest.fixture(scope="function")
 def db():
-    Base.metadata.create_all(bind=engine)
+    create_schema(engine)
     db = TestingSessionLocal()
     try:
         yield db
     finally:
         db.close()
-    Base.metadata.drop_all(bind=engine)
+    drop_schema(engine)
 
 
-@pytest.fixture
-def client(db):
-    app.dependency_overrides[get_db] = override_get_db
+@pytest.fixture(params=["sync", "async"])
+def client(db, request):
+    app.dependency_overrides[get_db] = override_get_db if request.param == "sync" else override_get_async_db
+    board_cache.clear()
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
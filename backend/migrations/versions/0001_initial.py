@@ -0,0 +1,42 @@
+"""initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "boards",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+    )
+    op.create_table(
+        "columns",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("position", sa.Integer, nullable=False),
+        sa.Column("board_id", sa.String(36), sa.ForeignKey("boards.id", ondelete="CASCADE"), nullable=False),
+    )
+    op.create_table(
+        "cards",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text, nullable=True),
+        sa.Column("position", sa.Integer, nullable=False),
+        sa.Column("column_id", sa.String(36), sa.ForeignKey("columns.id", ondelete="CASCADE"), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("cards")
+    op.drop_table("columns")
+    op.drop_table("boards")
@@ -0,0 +1,32 @@
+"""board version and lookup indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    if "version" not in {c["name"] for c in inspector.get_columns("boards")}:
+        op.add_column("boards", sa.Column("version", sa.Integer, nullable=False, server_default="0"))
+
+    if "ix_columns_board_id_position" not in {i["name"] for i in inspector.get_indexes("columns")}:
+        op.create_index("ix_columns_board_id_position", "columns", ["board_id", "position"])
+    if "ix_cards_column_id_position" not in {i["name"] for i in inspector.get_indexes("cards")}:
+        op.create_index("ix_cards_column_id_position", "cards", ["column_id", "position"])
+
+
+def downgrade():
+    op.drop_index("ix_cards_column_id_position", table_name="cards")
+    op.drop_index("ix_columns_board_id_position", table_name="columns")
+    with op.batch_alter_table("boards") as batch_op:
+        batch_op.drop_column("version")
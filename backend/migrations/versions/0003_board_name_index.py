@@ -0,0 +1,20 @@
+"""board name keyset index
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_boards_name_id", "boards", ["name", "id"])
+
+
+def downgrade():
+    op.drop_index("ix_boards_name_id", table_name="boards")
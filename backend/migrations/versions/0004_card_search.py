@@ -0,0 +1,46 @@
+"""card full-text search index
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+SEARCH_VECTOR = "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))"
+FTS_ROW_FOR = "cards_fts MATCH 'card_id:\"' || replace({card}.id, '\"', '\"\"') || '\"' AND card_id = {card}.id"
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute(f"CREATE INDEX IF NOT EXISTS ix_cards_search ON cards USING gin ({SEARCH_VECTOR})")
+    elif dialect == "sqlite":
+        op.execute("CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(card_id, title, description)")
+        op.execute("DELETE FROM cards_fts")
+        op.execute("INSERT INTO cards_fts (card_id, title, description) SELECT id, title, description FROM cards")
+        op.execute("""CREATE TRIGGER IF NOT EXISTS cards_fts_insert AFTER INSERT ON cards BEGIN
+            INSERT INTO cards_fts (card_id, title, description) VALUES (new.id, new.title, new.description);
+        END""")
+        # The rowid of cards is not stable across VACUUM, so rows are found by card_id.
+        op.execute(f"""CREATE TRIGGER IF NOT EXISTS cards_fts_delete AFTER DELETE ON cards BEGIN
+            DELETE FROM cards_fts WHERE {FTS_ROW_FOR.format(card="old")};
+        END""")
+        op.execute(f"""CREATE TRIGGER IF NOT EXISTS cards_fts_update AFTER UPDATE OF title, description ON cards BEGIN
+            UPDATE cards_fts SET title = new.title, description = new.description
+            WHERE {FTS_ROW_FOR.format(card="new")};
+        END""")
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_cards_search")
+    elif dialect == "sqlite":
+        for trigger in ("cards_fts_insert", "cards_fts_delete", "cards_fts_update"):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS cards_fts")
@@ -0,0 +1,25 @@
+"""card and column versions for optimistic concurrency
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("cards", sa.Column("version", sa.Integer, nullable=False, server_default="0"))
+    op.add_column("columns", sa.Column("version", sa.Integer, nullable=False, server_default="0"))
+
+
+def downgrade():
+    with op.batch_alter_table("columns") as batch_op:
+        batch_op.drop_column("version")
+    with op.batch_alter_table("cards") as batch_op:
+        batch_op.drop_column("version")
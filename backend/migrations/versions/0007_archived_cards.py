@@ -0,0 +1,43 @@
+"""card archive table and card updated_at
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # SQLite cannot add a column with a non-constant default, so existing rows are backfilled instead.
+    op.add_column("cards", sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE cards SET updated_at = CURRENT_TIMESTAMP")
+    op.create_table(
+        "archived_cards",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("board_id", sa.String(36), sa.ForeignKey("boards.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("column_id", sa.String(36), sa.ForeignKey("columns.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("title", sa.String(255), nullable=False),
+        sa.Column("description", sa.Text, nullable=True),
+        sa.Column("position", sa.Integer, nullable=False),
+        sa.Column("version", sa.Integer, nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("archived_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index(
+        "ix_archived_cards_board_id_archived_at", "archived_cards", ["board_id", "archived_at", "id"]
+    )
+    op.create_index("ix_archived_cards_column_id", "archived_cards", ["column_id"])
+
+
+def downgrade():
+    op.drop_index("ix_archived_cards_column_id", table_name="archived_cards")
+    op.drop_index("ix_archived_cards_board_id_archived_at", table_name="archived_cards")
+    op.drop_table("archived_cards")
+    with op.batch_alter_table("cards") as batch_op:
+        batch_op.drop_column("updated_at")
@@ -0,0 +1,49 @@
+"""unique card positions per column
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+POSITION_GAP = 1024
+
+
+def upgrade():
+    connection = op.get_bind()
+    cards = sa.table("cards", sa.column("id"), sa.column("column_id"), sa.column("position"))
+    # Positions assigned before this revision could collide; renumber those columns in their current order.
+    duplicated = (
+        sa.select(cards.c.column_id)
+        .group_by(cards.c.column_id, cards.c.position)
+        .having(sa.func.count() > 1)
+    )
+    rows = connection.execute(
+        sa.select(cards.c.id, cards.c.column_id)
+        .where(cards.c.column_id.in_(duplicated))
+        .order_by(cards.c.column_id, cards.c.position, cards.c.id)
+    ).all()
+    updates, index, previous = [], 0, None
+    for row in rows:
+        index = index + 1 if row.column_id == previous else 0
+        previous = row.column_id
+        updates.append({"card_id": row.id, "new_position": index * POSITION_GAP})
+    if updates:
+        connection.execute(
+            cards.update().where(cards.c.id == sa.bindparam("card_id")).values(position=sa.bindparam("new_position")),
+            updates,
+        )
+
+    op.drop_index("ix_cards_column_id_position", table_name="cards")
+    op.create_index("ix_cards_column_id_position", "cards", ["column_id", "position"], unique=True)
+
+
+def downgrade():
+    op.drop_index("ix_cards_column_id_position", table_name="cards")
+    op.create_index("ix_cards_column_id_position", "cards", ["column_id", "position"])
@@ -0,0 +1,22 @@
+"""drop unused column version
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Plain DROP COLUMN: batch mode would rebuild "columns", and dropping the old table cascades to cards.
+    op.drop_column("columns", "version")
+
+
+def downgrade():
+    op.add_column("columns", sa.Column("version", sa.Integer, nullable=False, server_default="0"))
@@ -0,0 +1,30 @@
+"""Archive cards that have sat in the last column of their board for too long. Meant to run from cron.
+
+    python scripts/archive_cards.py --older-than-days 30
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--older-than-days", type=int, required=True)
+    parser.add_argument("--chunk-size", type=int, help="defaults to DELETE_CHUNK_SIZE")
+    args = parser.parse_args()
+
+    from app.config import settings
+    from app.database import run_in_new_session
+    from app.services.archive_service import ArchiveService
+
+    chunk_size = args.chunk_size or settings.delete_chunk_size
+    archived = run_in_new_session(
+        lambda session: ArchiveService(session).archive_stale(args.older_than_days, chunk_size)
+    )
+    print(f"Archived {archived} cards")
+
+
+if __name__ == "__main__":
+    main()
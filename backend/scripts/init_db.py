@@ -0,0 +1,28 @@
+"""Create or upgrade the database schema. Run once per deploy, before starting the API workers.
+
+    python scripts/init_db.py
+    python scripts/init_db.py --revision 0004
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--revision", default="head", help="alembic revision to upgrade to")
+    args = parser.parse_args()
+
+    from app.database import engine
+    from app.migrations import upgrade_database
+
+    start = time.perf_counter()
+    upgrade_database(engine, args.revision)
+    print(f"Database upgraded to {args.revision} in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import IntegrityError
+
+from app.models import Board
+from app.repositories.card_repository import CardRepository
 
 
 def test_create_and_list_boards(client: TestClient):
@@ -201,3 +205,450 @@ def test_move_card_invalid_column(client: TestClient):
         json={"new_column_id": "non-existent-column"}
     )
     assert response.status_code == 404
+
+
+def test_get_board_returns_etag_and_not_modified(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+
+    response = client.get(f"/boards/{board_id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.json()["version"] == 0
+
+    response = client.get(f"/boards/{board_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_board_version_bumped_by_column_and_card_writes(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+
+    def current_etag():
+        return client.get(f"/boards/{board_id}").headers["etag"]
+
+    seen = [current_etag()]
+    col1_id = client.post(f"/boards/{board_id}/columns", json={"name": "A"}).json()["id"]
+    seen.append(current_etag())
+    col2_id = client.post(f"/boards/{board_id}/columns", json={"name": "B"}).json()["id"]
+    seen.append(current_etag())
+    card_id = client.post(f"/columns/{col1_id}/cards", json={"title": "Card"}).json()["id"]
+    seen.append(current_etag())
+    client.put(f"/cards/{card_id}", json={"title": "Renamed"})
+    seen.append(current_etag())
+    client.patch(f"/cards/{card_id}/move", json={"newColumnId": col2_id})
+    seen.append(current_etag())
+    client.delete(f"/cards/{card_id}")
+    seen.append(current_etag())
+
+    assert len(set(seen)) == len(seen)
+    assert client.get(f"/boards/{board_id}").json()["version"] == len(seen) - 1
+
+    response = client.get(f"/boards/{board_id}", headers={"If-None-Match": seen[0]})
+    assert response.status_code == 200
+    assert response.headers["etag"] == seen[-1]
+
+
+def test_get_board_if_none_match_not_found(client: TestClient):
+    response = client.get("/boards/non-existent-id", headers={"If-None-Match": 'W/"0"'})
+    assert response.status_code == 404
+
+
+def test_move_card_to_position(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    col1_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    col2_id = client.post(f"/boards/{board_id}/columns", json={"name": "Done"}).json()["id"]
+    card_ids = [
+        client.post(f"/columns/{col1_id}/cards", json={"title": title}).json()["id"]
+        for title in ("One", "Two", "Three")
+    ]
+    done_id = client.post(f"/columns/{col2_id}/cards", json={"title": "Done"}).json()["id"]
+
+    response = client.patch(
+        f"/cards/{card_ids[2]}/move",
+        json={"newColumnId": col1_id, "beforeCardId": card_ids[0]},
+    )
+    assert response.status_code == 200
+
+    response = client.patch(
+        f"/cards/{card_ids[1]}/move",
+        json={"newColumnId": col2_id, "afterCardId": done_id},
+    )
+    assert response.status_code == 200
+
+    response = client.patch(
+        f"/cards/{card_ids[0]}/move",
+        json={"newColumnId": col2_id, "afterCardId": done_id},
+    )
+    assert response.status_code == 200
+
+    cols = {c["id"]: c for c in client.get(f"/boards/{board_id}").json()["columns"]}
+    assert [c["title"] for c in cols[col1_id]["cards"]] == ["Three"]
+    assert [c["title"] for c in cols[col2_id]["cards"]] == ["Done", "One", "Two"]
+
+
+def test_move_card_anchor_must_be_in_target_column(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    col1_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    col2_id = client.post(f"/boards/{board_id}/columns", json={"name": "Done"}).json()["id"]
+    card_id = client.post(f"/columns/{col1_id}/cards", json={"title": "Card"}).json()["id"]
+    other_id = client.post(f"/columns/{col1_id}/cards", json={"title": "Other"}).json()["id"]
+
+    response = client.patch(
+        f"/cards/{card_id}/move",
+        json={"newColumnId": col2_id, "afterCardId": other_id},
+    )
+    assert response.status_code == 404
+
+    response = client.patch(
+        f"/cards/{card_id}/move",
+        json={"newColumnId": col2_id, "afterCardId": other_id, "beforeCardId": other_id},
+    )
+    assert response.status_code == 422
+
+
+def test_batch_card_operations(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    col1_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    col2_id = client.post(f"/boards/{board_id}/columns", json={"name": "Done"}).json()["id"]
+    keep_id = client.post(f"/columns/{col1_id}/cards", json={"title": "Keep"}).json()["id"]
+    drop_id = client.post(f"/columns/{col1_id}/cards", json={"title": "Drop"}).json()["id"]
+
+    response = client.post(f"/boards/{board_id}/cards:batch", json={"operations": [
+        {"op": "create", "columnId": col1_id, "title": "New 1"},
+        {"op": "create", "columnId": col2_id, "title": "New 2", "description": "Desc"},
+        {"op": "update", "cardId": keep_id, "title": "Kept"},
+        {"op": "move", "cardId": keep_id, "newColumnId": col2_id},
+        {"op": "delete", "cardId": drop_id},
+    ]})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["applied"] is True
+    assert [r["status"] for r in body["results"]] == ["ok"] * 5
+    assert body["results"][3]["card"]["column_id"] == col2_id
+    assert body["results"][4]["card"] is None
+
+    cols = {c["id"]: c for c in client.get(f"/boards/{board_id}").json()["columns"]}
+    assert [c["title"] for c in cols[col1_id]["cards"]] == ["New 1"]
+    assert [c["title"] for c in cols[col2_id]["cards"]] == ["New 2", "Kept"]
+
+
+def test_batch_card_operations_are_atomic(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    other_board_id = client.post("/boards", json={"name": "Other"}).json()["id"]
+    col_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    other_col_id = client.post(f"/boards/{other_board_id}/columns", json={"name": "To Do"}).json()["id"]
+    card_id = client.post(f"/columns/{col_id}/cards", json={"title": "Card"}).json()["id"]
+    etag = client.get(f"/boards/{board_id}").headers["etag"]
+
+    response = client.post(f"/boards/{board_id}/cards:batch", json={"operations": [
+        {"op": "create", "columnId": col_id, "title": "New"},
+        {"op": "move", "cardId": card_id, "newColumnId": other_col_id},
+        {"op": "delete", "cardId": card_id},
+        {"op": "update", "cardId": card_id, "title": "Gone"},
+    ]})
+    assert response.status_code == 422
+    body = response.json()
+    assert body["applied"] is False
+    assert [r["status"] for r in body["results"]] == ["skipped", "error", "skipped", "error"]
+
+    response = client.get(f"/boards/{board_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_batch_card_operations_board_not_found(client: TestClient):
+    response = client.post("/boards/missing/cards:batch", json={"operations": [
+        {"op": "delete", "cardId": "x"},
+    ]})
+    assert response.status_code == 404
+
+
+def test_card_writes_with_if_match(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    col_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    card = client.post(f"/columns/{col_id}/cards", json={"title": "Card"}).json()
+    assert card["version"] == 0
+
+    response = client.put(f"/cards/{card['id']}", json={"title": "First"}, headers={"If-Match": 'W/"0"'})
+    assert response.status_code == 200
+    assert response.json()["version"] == 1
+    assert response.headers["etag"] == 'W/"1"'
+
+    response = client.put(f"/cards/{card['id']}", json={"title": "Stale"}, headers={"If-Match": 'W/"0"'})
+    assert response.status_code == 409
+    assert response.json()["current_version"] == 1
+
+    response = client.patch(
+        f"/cards/{card['id']}/move", json={"newColumnId": col_id}, headers={"If-Match": "0"}
+    )
+    assert response.status_code == 409
+
+    response = client.delete(f"/cards/{card['id']}", headers={"If-Match": '"0"'})
+    assert response.status_code == 409
+
+    response = client.patch(
+        f"/cards/{card['id']}/move", json={"newColumnId": col_id}, headers={"If-Match": '"1"'}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] == 'W/"2"'
+
+    assert client.put(f"/cards/{card['id']}", json={"title": "Any"}, headers={"If-Match": "*"}).status_code == 200
+    assert client.put(f"/cards/{card['id']}", json={"title": "Bad"}, headers={"If-Match": "abc"}).status_code == 400
+    assert client.delete(f"/cards/{card['id']}", headers={"If-Match": "3"}).status_code == 204
+    assert client.delete(f"/cards/{card['id']}", headers={"If-Match": "3"}).status_code == 404
+
+
+def test_board_detail_includes_versions(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    col_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    card_id = client.post(f"/columns/{col_id}/cards", json={"title": "Card"}).json()["id"]
+    client.put(f"/cards/{card_id}", json={"title": "Renamed"})
+
+    column = client.get(f"/boards/{board_id}").json()["columns"][0]
+    assert "version" not in column
+    assert column["cards"][0]["version"] == 1
+
+
+def test_batch_card_operations_check_expected_version(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    col_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    card_id = client.post(f"/columns/{col_id}/cards", json={"title": "Card"}).json()["id"]
+
+    response = client.post(f"/boards/{board_id}/cards:batch", json={"operations": [
+        {"op": "update", "cardId": card_id, "title": "Stale", "expectedVersion": 3},
+    ]})
+    assert response.status_code == 422
+    assert response.json()["results"][0]["error"] == "Version conflict"
+
+    response = client.post(f"/boards/{board_id}/cards:batch", json={"operations": [
+        {"op": "update", "cardId": card_id, "title": "Fresh", "expectedVersion": 0},
+        {"op": "delete", "cardId": card_id, "expectedVersion": 1},
+    ]})
+    assert response.status_code == 200
+
+
+def test_batch_card_operations_conflict_with_concurrent_writes(client: TestClient, monkeypatch):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    col_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    card_id = client.post(f"/columns/{col_id}/cards", json={"title": "Card"}).json()["id"]
+    read = CardRepository.get_many_in_board
+
+    def read_then_write_concurrently(self, db, board_id, card_ids):
+        rows = read(self, db, board_id, card_ids)
+        self.update(db, card_id, title="Concurrent")
+        db.commit()
+        return rows
+
+    monkeypatch.setattr(CardRepository, "get_many_in_board", read_then_write_concurrently)
+    response = client.post(f"/boards/{board_id}/cards:batch", json={"operations": [
+        {"op": "create", "columnId": col_id, "title": "New"},
+        {"op": "update", "cardId": card_id, "title": "Batch"},
+    ]})
+    monkeypatch.undo()
+
+    assert response.status_code == 422
+    assert [(r["status"], r["error"]) for r in response.json()["results"]] == [
+        ("skipped", None), ("error", "Version conflict"),
+    ]
+    cards = client.get(f"/boards/{board_id}").json()["columns"][0]["cards"]
+    assert [(c["title"], c["version"]) for c in cards] == [("Concurrent", 1)]
+
+
+@pytest.mark.parametrize("lost_races, status_code", [(2, 200), (3, 409)])
+def test_card_create_retries_when_a_position_is_taken_concurrently(
+    client: TestClient, monkeypatch, lost_races, status_code
+):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    col_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    create = CardRepository.create
+    attempts = []
+
+    def create_losing_races(self, db, *args):
+        attempts.append(args)
+        if len(attempts) <= lost_races:
+            raise IntegrityError(
+                "INSERT INTO cards", {}, Exception("UNIQUE constraint failed: cards.column_id, cards.position")
+            )
+        return create(self, db, *args)
+
+    monkeypatch.setattr(CardRepository, "create", create_losing_races)
+    response = client.post(f"/columns/{col_id}/cards", json={"title": "Card"})
+    monkeypatch.undo()
+
+    assert response.status_code == status_code
+    assert len(attempts) == 3
+    cards = client.get(f"/boards/{board_id}").json()["columns"][0]["cards"]
+    assert len(cards) == (1 if status_code == 200 else 0)
+
+
+def test_delete_board_and_column(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    todo_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    done_id = client.post(f"/boards/{board_id}/columns", json={"name": "Done"}).json()["id"]
+    client.post(f"/columns/{todo_id}/cards", json={"title": "Card"})
+    etag = client.get(f"/boards/{board_id}").headers["etag"]
+
+    assert client.delete(f"/boards/{board_id}/columns/{todo_id}").status_code == 204
+    assert client.delete(f"/boards/{board_id}/columns/{todo_id}").status_code == 404
+    response = client.get(f"/boards/{board_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()["columns"]] == [done_id]
+
+    assert client.delete(f"/boards/missing/columns/{done_id}").status_code == 404
+    assert client.delete(f"/boards/{board_id}").status_code == 204
+    assert client.get(f"/boards/{board_id}").status_code == 404
+    assert client.delete(f"/boards/{board_id}").status_code == 404
+
+
+def test_delete_board_and_column_in_background(client: TestClient, monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "delete_chunk_size", 2)
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    todo_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    done_id = client.post(f"/boards/{board_id}/columns", json={"name": "Done"}).json()["id"]
+    for i in range(5):
+        client.post(f"/columns/{todo_id}/cards", json={"title": f"Todo {i}"})
+        client.post(f"/columns/{done_id}/cards", json={"title": f"Done {i}"})
+
+    assert client.delete(f"/boards/{board_id}/columns/missing?background=true").status_code == 404
+    assert client.delete(f"/boards/{board_id}/columns/{todo_id}?background=true").status_code == 202
+    assert [c["id"] for c in client.get(f"/boards/{board_id}").json()["columns"]] == [done_id]
+
+    assert client.delete("/boards/missing?background=true").status_code == 404
+    assert client.delete(f"/boards/{board_id}?background=true").status_code == 202
+    assert client.get(f"/boards/{board_id}").status_code == 404
+
+
+def test_list_boards_cursor_pagination(client: TestClient):
+    names = ["Delta", "Alpha", "Charlie", "Bravo", "Echo"]
+    for name in names:
+        client.post("/boards", json={"name": name})
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/boards", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page) <= 2
+        seen.extend(b["name"] for b in page)
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert seen == sorted(names)
+
+
+def test_list_boards_name_prefix_and_counts(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Sprint 1"}).json()["id"]
+    client.post("/boards", json={"name": "Sprint 2"})
+    client.post("/boards", json={"name": "Backlog"})
+    col1_id = client.post(f"/boards/{board_id}/columns", json={"name": "A"}).json()["id"]
+    col2_id = client.post(f"/boards/{board_id}/columns", json={"name": "B"}).json()["id"]
+    for column_id in (col1_id, col1_id, col2_id):
+        client.post(f"/columns/{column_id}/cards", json={"title": "Card"})
+
+    response = client.get("/boards", params={"name_prefix": "Sprint"})
+    assert [b["name"] for b in response.json()] == ["Sprint 1", "Sprint 2"]
+    assert "card_count" not in response.json()[0]
+
+    response = client.get("/boards", params={"name_prefix": "Sprint", "include_counts": True})
+    assert response.json() == [
+        {"id": board_id, "name": "Sprint 1", "column_count": 2, "card_count": 3},
+        {"id": response.json()[1]["id"], "name": "Sprint 2", "column_count": 0, "card_count": 0},
+    ]
+
+
+def test_list_boards_pages_by_default(client: TestClient, db):
+    db.add_all([Board(name=f"Board {i:02}") for i in range(51)])
+    db.commit()
+
+    response = client.get("/boards", params={"include_counts": True})
+    assert len(response.json()) == 50
+    cursor = response.headers["x-next-cursor"]
+
+    response = client.get("/boards", params={"cursor": cursor})
+    assert [b["name"] for b in response.json()] == ["Board 50"]
+    assert "x-next-cursor" not in response.headers
+
+
+def test_list_boards_name_prefix_edge_characters(client: TestClient):
+    top = chr(0x10FFFF)
+    for name in (f"a{top}", f"a{top}b", "b", "\ud7ffx", "\ue000"):
+        client.post("/boards", json={"name": name})
+
+    assert [b["name"] for b in client.get("/boards", params={"name_prefix": f"a{top}"}).json()] == [
+        f"a{top}", f"a{top}b",
+    ]
+    assert client.get("/boards", params={"name_prefix": top}).json() == []
+    assert [b["name"] for b in client.get("/boards", params={"name_prefix": "\ud7ff"}).json()] == ["\ud7ffx"]
+
+
+def test_list_boards_invalid_cursor_and_limit(client: TestClient):
+    assert client.get("/boards", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/boards", params={"limit": 1000}).status_code == 422
+
+
+def test_get_board_limits_cards_per_column(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Big"}).json()["id"]
+    column_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    done_id = client.post(f"/boards/{board_id}/columns", json={"name": "Done"}).json()["id"]
+    for i in range(5):
+        client.post(f"/columns/{column_id}/cards", json={"title": f"Card {i}"})
+    for i in range(3):
+        client.post(f"/columns/{done_id}/cards", json={"title": f"Done {i}"})
+
+    full = client.get(f"/boards/{board_id}").json()
+    assert len(full["columns"][0]["cards"]) == 5
+    assert "card_count" not in full["columns"][0]
+
+    limited = client.get(f"/boards/{board_id}", params={"cards_limit": 2}).json()
+    assert [c["title"] for c in limited["columns"][0]["cards"]] == ["Card 0", "Card 1"]
+    assert limited["columns"][0]["card_count"] == 5
+    assert [c["title"] for c in limited["columns"][1]["cards"]] == ["Done 0", "Done 1"]
+    assert limited["columns"][1]["card_count"] == 3
+
+    client.post(f"/columns/{column_id}/cards", json={"title": "Card 5"})
+    limited = client.get(f"/boards/{board_id}", params={"cards_limit": 2}).json()
+    assert limited["columns"][0]["card_count"] == 6
+
+
+def test_list_column_cards_pagination(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Big"}).json()["id"]
+    column_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    for i in range(5):
+        client.post(f"/columns/{column_id}/cards", json={"title": f"Card {i}"})
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get(f"/columns/{column_id}/cards", params=params)
+        assert response.status_code == 200
+        seen.extend(c["title"] for c in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+        params["cursor"] = cursor
+
+    assert seen == [f"Card {i}" for i in range(5)]
+    assert client.get(f"/columns/{column_id}/cards", params={"cursor": "bogus"}).status_code == 400
+
+
+def test_list_column_cards_not_found(client: TestClient):
+    assert client.get("/columns/missing/cards").status_code == 404
+    board_id = client.post("/boards", json={"name": "Empty"}).json()["id"]
+    column_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    response = client.get(f"/columns/{column_id}/cards")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_cors_exposes_paging_and_etag_headers(client: TestClient):
+    response = client.get("/boards", headers={"Origin": "http://localhost:5173"})
+
+    exposed = {h.strip().lower() for h in response.headers["access-control-expose-headers"].split(",")}
+    assert {"x-next-cursor", "x-next-offset", "etag"} <= exposed
@@ -0,0 +1,135 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+
+from app.models import Card
+from app.repositories.archive_repository import ArchiveRepository
+from app.services.archive_service import ArchiveService
+
+
+def create_board(client: TestClient, columns: dict[str, int]) -> tuple[str, dict[str, str], dict[str, list[str]]]:
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    column_ids, card_ids = {}, {}
+    for name, count in columns.items():
+        column_ids[name] = client.post(f"/boards/{board_id}/columns", json={"name": name}).json()["id"]
+        card_ids[name] = [
+            client.post(f"/columns/{column_ids[name]}/cards", json={"title": f"{name} {i}"}).json()["id"]
+            for i in range(count)
+        ]
+    return board_id, column_ids, card_ids
+
+
+def test_archive_card_moves_it_out_of_the_board(client: TestClient):
+    board_id, _, card_ids = create_board(client, {"Done": 2})
+    card_id = card_ids["Done"][0]
+    etag = client.get(f"/boards/{board_id}").headers["etag"]
+
+    assert client.post(f"/cards/{card_id}/archive", headers={"If-Match": "5"}).status_code == 409
+    assert client.post(f"/cards/{card_id}/archive").status_code == 204
+    assert client.post(f"/cards/{card_id}/archive").status_code == 404
+
+    response = client.get(f"/boards/{board_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()["columns"][0]["cards"]] == [card_ids["Done"][1]]
+
+    archived = client.get(f"/boards/{board_id}/archive").json()
+    assert [(c["id"], c["title"], c["board_id"]) for c in archived] == [(card_id, "Done 0", board_id)]
+    assert archived[0]["archived_at"]
+    changes = client.get(f"/boards/{board_id}/changes", params={"since": 3}).json()["changes"]
+    assert changes == [{"type": "cards.archived", "version": 4, "card_ids": [card_id]}]
+
+
+def test_archive_column_in_chunks_and_paginate(client: TestClient, monkeypatch):
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "delete_chunk_size", 2)
+    board_id, column_ids, card_ids = create_board(client, {"To Do": 1, "Done": 5})
+
+    response = client.post(f"/boards/{board_id}/columns/{column_ids['Done']}/archive")
+    assert response.json() == {"archived": 5}
+    columns = client.get(f"/boards/{board_id}").json()["columns"]
+    assert [len(c["cards"]) for c in columns] == [1, 0]
+
+    seen, cursor = [], None
+    while True:
+        response = client.get(f"/boards/{board_id}/archive", params={"limit": 2, "cursor": cursor})
+        seen += [c["id"] for c in response.json()]
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    assert sorted(seen) == sorted(card_ids["Done"])
+
+    assert client.get(f"/boards/{board_id}/archive", params={"cursor": "bad"}).status_code == 400
+    assert client.get("/boards/missing/archive").status_code == 404
+    assert client.post(f"/boards/missing/columns/{column_ids['To Do']}/archive").status_code == 404
+
+
+def test_archive_column_older_than(client: TestClient, db):
+    board_id, column_ids, card_ids = create_board(client, {"Done": 2})
+    old_id, recent_id = card_ids["Done"]
+    db.execute(update(Card).where(Card.id == old_id).values(updated_at=datetime.now(timezone.utc) - timedelta(days=40)))
+    db.commit()
+
+    response = client.post(
+        f"/boards/{board_id}/columns/{column_ids['Done']}/archive", params={"older_than_days": 30}
+    )
+    assert response.json() == {"archived": 1}
+    assert [c["id"] for c in client.get(f"/boards/{board_id}/archive").json()] == [old_id]
+
+
+def test_archive_stale_only_touches_last_columns(client: TestClient, db):
+    board_id, _, card_ids = create_board(client, {"To Do": 1, "Done": 2})
+    long_ago = datetime.now(timezone.utc) - timedelta(days=40)
+    db.execute(update(Card).values(updated_at=long_ago))
+    db.commit()
+
+    assert ArchiveService(db).archive_stale(older_than_days=30, chunk_size=100) == 2
+    assert ArchiveService(db).archive_stale(older_than_days=30, chunk_size=100) == 0
+    columns = client.get(f"/boards/{board_id}").json()["columns"]
+    assert [[c["id"] for c in column["cards"]] for column in columns] == [card_ids["To Do"], []]
+
+
+def test_archived_cards_are_removed_with_their_board(client: TestClient):
+    board_id, _, card_ids = create_board(client, {"Done": 1})
+    client.post(f"/cards/{card_ids['Done'][0]}/archive")
+    assert client.delete(f"/boards/{board_id}").status_code == 204
+    assert client.get(f"/boards/{board_id}/archive").status_code == 404
+
+
+@contextmanager
+def update_before_archiving(engine, card_id: str, **values):
+    pending = [card_id]
+
+    def update_concurrently(conn, cursor, statement, parameters, context, executemany):
+        if pending and statement.startswith("INSERT INTO archived_cards"):
+            with engine.begin() as other:
+                other.execute(update(Card).where(Card.id == pending.pop()).values(**values))
+
+    event.listen(engine, "before_cursor_execute", update_concurrently)
+    try:
+        yield
+    finally:
+        event.remove(engine, "before_cursor_execute", update_concurrently)
+
+
+def test_archive_rechecks_criteria_when_writing(client: TestClient, db):
+    board_id, column_ids, card_ids = create_board(client, {"Done": 3})
+    first_id, touched_id, stale_id = card_ids["Done"]
+    repository = ArchiveRepository()
+
+    with update_before_archiving(db.get_bind(), first_id, version=Card.version + 1):
+        assert repository.archive_card(db, first_id, expected_version=0) is None
+
+    old = datetime.now(timezone.utc) - timedelta(days=10)
+    db.execute(update(Card).where(Card.id != first_id).values(updated_at=old))
+    db.commit()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=5)
+    with update_before_archiving(db.get_bind(), touched_id, updated_at=datetime.now(timezone.utc)):
+        assert repository.archive_column_chunk(db, board_id, column_ids["Done"], cutoff, 10) == [stale_id]
+    db.commit()
+
+    live = client.get(f"/boards/{board_id}").json()["columns"][0]["cards"]
+    assert [(c["id"], c["version"]) for c in live] == [(first_id, 1), (touched_id, 0)]
+    assert [c["id"] for c in client.get(f"/boards/{board_id}/archive").json()] == [stale_id]
@@ -0,0 +1,47 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from benchmarks.board_load import run_paths
+from benchmarks.load import REQUEST_SCENARIOS, compare, percentile, run_suite, seed
+from benchmarks.serialization import PATHS as SERIALIZATION_PATHS
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_compare_flags_latency_throughput_and_errors():
+    baseline = {"scenarios": {"get_board": {"errors": 0, "p50_ms": 10.0, "p99_ms": 20.0, "throughput_rps": 100.0}}}
+    ok = {"scenarios": {"get_board": {"errors": 0, "p50_ms": 11.0, "p99_ms": 24.0, "throughput_rps": 80.0}}}
+    slow = {"scenarios": {"get_board": {"errors": 1, "p50_ms": 13.0, "p99_ms": 20.0, "throughput_rps": 70.0}}}
+
+    assert compare(ok, baseline, tolerance=0.25) == []
+    failures = compare(slow, baseline, tolerance=0.25)
+    assert len(failures) == 3
+    assert failures[1] == "get_board: p50_ms 13.0 > 12.5 (baseline 10.0)"
+
+
+def test_run_suite_smoke(client: TestClient, db):
+    shape = seed(db.get_bind(), columns=2, cards=6, description_size=10, boards=3)
+
+    results = asyncio.run(run_suite(app, shape, REQUEST_SCENARIOS, requests=4, concurrency=2))
+
+    assert set(results) == set(REQUEST_SCENARIOS)
+    for name, summary in results.items():
+        assert summary["requests"] == 4, name
+        assert summary["errors"] == 0, name
+
+
+def test_run_paths_measures_every_path_per_board_size(capsys):
+    results = run_paths("", SERIALIZATION_PATHS, default_cards=[4], argv=["--cards", "4", "12", "--repeat", "1"])
+
+    assert [row["cards"] for row in results] == [4, 12]
+    for row in results:
+        assert set(row) == {"cards", *SERIALIZATION_PATHS}
+        assert all(timing["min_ms"] >= 0 for name, timing in row.items() if name != "cards")
+    assert len(capsys.readouterr().out.splitlines()) == 2
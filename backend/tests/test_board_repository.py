@@ -0,0 +1,79 @@
+from sqlalchemy import event, func, select
+
+from app.models import Board, Column, Card
+from app.repositories.board_repository import BoardRepository
+from app.schemas.board import BoardDetailResponse
+
+
+def test_get_detail_matches_orm_board_response(db):
+    board = Board(name="Board")
+    todo = Column(board=board, name="To Do", position=0)
+    done = Column(board=board, name="Done", position=1)
+    db.add_all([
+        board,
+        todo,
+        done,
+        Card(column=todo, title="Second", position=1),
+        Card(column=todo, title="First", description="Desc", position=0),
+        Card(column=done, title="Shipped", position=0),
+    ])
+    db.commit()
+
+    repository = BoardRepository()
+    detail = repository.get_detail(db, board.id)
+    db.expunge_all()
+    orm_board = repository.get_by_id_with_columns_and_cards(db, board.id)
+
+    expected = BoardDetailResponse.model_validate(orm_board).model_dump(
+        exclude={"columns": {"__all__": {"card_count"}}}
+    )
+    assert detail == expected
+    assert [c["title"] for c in detail["columns"][0]["cards"]] == ["First", "Second"]
+
+
+def test_get_detail_limits_cards_per_column(db):
+    board = Board(name="Board")
+    todo = Column(board=board, name="To Do", position=0)
+    done = Column(board=board, name="Done", position=1)
+    empty = Column(board=board, name="Empty", position=2)
+    db.add_all([board, todo, done, empty])
+    db.add_all([Card(column=todo, title=f"Todo {i}", position=i) for i in range(5)])
+    db.add(Card(column=done, title="Shipped", position=0))
+    db.commit()
+
+    detail = BoardRepository().get_detail(db, board.id, cards_limit=2)
+
+    columns = detail["columns"]
+    assert [c["title"] for c in columns[0]["cards"]] == ["Todo 0", "Todo 1"]
+    assert [c["card_count"] for c in columns] == [5, 1, 0]
+    assert [c["title"] for c in columns[1]["cards"]] == ["Shipped"]
+    assert columns[2]["cards"] == []
+
+
+def test_get_detail_missing_board(db):
+    assert BoardRepository().get_detail(db, "missing") is None
+
+
+def test_delete_board_is_one_statement_and_cascades(db):
+    board = Board(name="Board")
+    column = Column(board=board, name="To Do", position=0)
+    db.add_all([board, column, *(Card(column=column, title=f"Card {i}", position=i) for i in range(3))])
+    other = Board(name="Other")
+    db.add_all([other, Column(board=other, name="Keep", position=0)])
+    db.commit()
+    board_id = board.id
+    db.expunge_all()
+
+    statements = []
+    engine = db.get_bind()
+    record = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        assert BoardRepository().delete(db, board_id) is True
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [s.split()[0] for s in statements] == ["DELETE"]
+    assert db.scalar(select(func.count()).select_from(Card)) == 0
+    assert db.scalar(select(func.count()).select_from(Column)) == 1
+    assert BoardRepository().delete(db, board_id) is False
@@ -0,0 +1,82 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.cache import BoardCache, CachedBoard, LRUBoardCache, board_cache
+
+
+def test_cache_backends_must_implement_the_whole_interface():
+    class PartialCache(BoardCache):
+        def get(self, board_id, version, variant=""):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialCache()
+
+
+def test_lru_cache_hit_miss_and_eviction():
+    cache = LRUBoardCache(max_entries=2)
+    cache.set("a", CachedBoard(version=1, body=b"a"))
+    cache.set("b", CachedBoard(version=1, body=b"b"))
+
+    assert cache.get("a", 1).body == b"a"
+    cache.set("c", CachedBoard(version=1, body=b"c"))
+
+    assert cache.get("b", 1) is None
+    assert cache.get("a", 1) is not None
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+
+
+def test_lru_cache_drops_stale_versions_and_expired_entries():
+    now = [0.0]
+    cache = LRUBoardCache(max_entries=10, ttl_seconds=5, clock=lambda: now[0])
+    cache.set("a", CachedBoard(version=1, body=b"a"))
+    assert cache.get("a", 2) is None
+    assert cache.stats()["entries"] == 0
+
+    cache.set("a", CachedBoard(version=2, body=b"a"))
+    now[0] = 10.0
+    assert cache.get("a", 2) is None
+
+
+def test_lru_cache_invalidates_every_variant_of_a_board():
+    cache = LRUBoardCache(max_entries=10)
+    cache.set("a", CachedBoard(version=1, body=b"full"))
+    cache.set("a", CachedBoard(version=1, body=b"limited"), "cards_limit=2")
+    cache.set("b", CachedBoard(version=1, body=b"b"))
+
+    assert cache.get("a", 1, "cards_limit=2").body == b"limited"
+    cache.invalidate("a")
+
+    assert cache.get("a", 1) is None
+    assert cache.get("a", 1, "cards_limit=2") is None
+    assert cache.get("b", 1) is not None
+    assert cache.stats()["boards"] == 1
+
+
+def test_board_reads_served_from_cache_until_write(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    column_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+
+    before = board_cache.stats()
+    first = client.get(f"/boards/{board_id}")
+    second = client.get(f"/boards/{board_id}")
+    assert first.content == second.content
+    stats = board_cache.stats()
+    assert stats["misses"] == before["misses"] + 1
+    assert stats["hits"] == before["hits"] + 1
+
+    client.post(f"/columns/{column_id}/cards", json={"title": "New"})
+    assert board_cache.stats()["invalidations"] == stats["invalidations"] + 1
+
+    response = client.get(f"/boards/{board_id}")
+    assert response.json()["columns"][0]["cards"][0]["title"] == "New"
+
+
+def test_debug_cache_endpoint(client: TestClient):
+    response = client.get("/debug/cache")
+    assert response.status_code == 200
+    assert {"hits", "misses", "evictions"} <= response.json().keys()
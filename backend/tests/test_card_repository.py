@@ -0,0 +1,208 @@
+import uuid
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.exc import IntegrityError
+
+from app.models import Board, Column, Card
+from app.repositories.card_repository import CardRepository, POSITION_GAP
+from app.services.base import POSITION_RETRIES, PositionConflict
+from app.services.card_service import CardService
+
+
+def make_column(db, positions):
+    board = Board(name="Board")
+    column = Column(board=board, name="To Do", position=0)
+    cards = [Card(column=column, title=f"Card {p}", position=p) for p in positions]
+    db.add_all([board, column, *cards])
+    db.commit()
+    return column, cards
+
+
+def test_column_page_cursor_breaks_position_ties_by_id(db):
+    # Ties can only come from data written before positions were made unique.
+    db.execute(text("DROP INDEX ix_cards_column_id_position"))
+    column, cards = make_column(db, [0, 0, 0, 1])
+    page_ids = []
+    after = None
+    while page := CardRepository().get_page_for_column(db, column.id, 2, after):
+        page_ids.extend(row.id for row in page)
+        after = (page[-1].position, page[-1].id)
+
+    assert page_ids == [card.id for card in sorted(cards, key=lambda card: (card.position, card.id))]
+
+
+def test_move_between_adjacent_positions_rebalances_column(db):
+    column, (first, second, moving) = make_column(db, [0, 1, 2])
+    repository = CardRepository()
+
+    moved = repository.move(db, moving.id, column.id, after_card_id=first.id)
+
+    ordered = db.query(Card).filter(Card.column_id == column.id).order_by(Card.position).all()
+    assert [card.id for card in ordered] == [first.id, moving.id, second.id]
+    assert moved.position - first.position > 1
+    assert second.position - moved.position > 1
+
+
+def count_statements(db, fn):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        result = fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return result, statements
+
+
+def test_create_card_inserts_without_locking_the_column(db):
+    column, _ = make_column(db, [0])
+    column_id = column.id
+
+    card, statements = count_statements(db, lambda: CardRepository().create(db, column_id, "New"))
+
+    assert (card.position, card.version) == (POSITION_GAP, 0)
+    assert [s.split()[0] for s in statements] == ["INSERT", "UPDATE"]
+
+
+def test_move_card_updates_once_without_locking_columns(db):
+    column, (card,) = make_column(db, [0])
+    target = Column(board_id=column.board_id, name="Done", position=1)
+    db.add(target)
+    db.commit()
+    card_id, target_id = card.id, target.id
+
+    moved, statements = count_statements(db, lambda: CardRepository().move(db, card_id, target_id))
+
+    assert (moved.column_id, moved.position, moved.version) == (target_id, 0, 1)
+    assert [s.split()[0] for s in statements] == ["UPDATE", "UPDATE"]
+
+
+def test_positions_are_unique_per_column(db):
+    column, _ = make_column(db, [0])
+    db.add(Card(column_id=column.id, title="Duplicate", position=0))
+    with pytest.raises(IntegrityError):
+        db.commit()
+
+
+def test_rebalance_keeps_positions_unique_with_negative_positions(db):
+    column, (first, second, third) = make_column(db, [-2048, -2047, 0])
+    CardRepository().rebalance_column(db, column.id)
+    db.commit()
+
+    db.expire_all()
+    assert [db.get(Card, card.id).position for card in (first, second, third)] == [0, POSITION_GAP, 2 * POSITION_GAP]
+
+
+def test_move_card_to_other_board_or_missing_column_writes_nothing(db):
+    column, (card,) = make_column(db, [0])
+    other_column, _ = make_column(db, [])
+    card_id, other_id = card.id, other_column.id
+    repository = CardRepository()
+
+    assert repository.move(db, card_id, other_id) is None
+    assert repository.move(db, card_id, "missing") is None
+    assert repository.move(db, "missing", column.id) is None
+    db.expire_all()
+    assert db.get(Card, card_id).column_id == column.id
+
+
+def test_create_card_missing_column_writes_nothing(db):
+    assert CardRepository().create(db, "missing", "New") is None
+
+
+def test_writes_with_stale_version_are_rejected(db):
+    column, (card,) = make_column(db, [0])
+    card_id, column_id = card.id, column.id
+    repository = CardRepository()
+
+    assert repository.update(db, card_id, title="Stale", expected_version=1) is None
+    assert repository.move(db, card_id, column_id, expected_version=1) is None
+    assert repository.delete(db, card_id, expected_version=1) is False
+    assert repository.update(db, card_id, title="Fresh", expected_version=0).version == 1
+    assert repository.get_version(db, card_id) == 1
+    assert repository.delete(db, card_id, expected_version=1) is True
+    assert repository.get_version(db, card_id) is None
+
+
+def test_bulk_write_rejects_cards_changed_since_read(db, monkeypatch):
+    column, (kept, moved, removed) = make_column(db, [0, 1, 2])
+    board_id = column.board_id
+    read_versions = {kept.id: 0, moved.id: 0, removed.id: 0}
+    updates = [
+        {"id": kept.id, "title": "Batch", "description": None, "column_id": column.id, "position": 0, "version": 1},
+        {"id": moved.id, "title": "Batch", "description": None, "column_id": column.id, "position": 3, "version": 1},
+    ]
+    repository = CardRepository()
+    repository.update(db, moved.id, title="Concurrent")
+    db.commit()
+
+    for multi_rowcount in (True, False):
+        monkeypatch.setattr(db.get_bind().dialect, "supports_sane_multi_rowcount", multi_rowcount)
+        conflicts = repository.bulk_write(db, board_id, [], updates, {removed.id}, read_versions)
+        assert conflicts == {moved.id}
+        db.expire_all()
+        assert [(card.title, card.version) for card in db.query(Card).order_by(Card.position)] == [
+            ("Card 0", 0), ("Concurrent", 1), ("Card 2", 0),
+        ]
+
+    read_versions[moved.id] = 1
+    updates[1]["version"] = 2
+    assert repository.bulk_write(db, board_id, [], updates, {removed.id}, read_versions) == set()
+    db.expire_all()
+    assert [(card.title, card.version) for card in db.query(Card).order_by(Card.position)] == [
+        ("Batch", 1), ("Batch", 2),
+    ]
+
+
+def test_writes_without_returning_support(db, monkeypatch):
+    column, (card,) = make_column(db, [0])
+    dialect = db.get_bind().dialect
+    for flag in ("insert_returning", "update_returning", "delete_returning"):
+        monkeypatch.setattr(dialect, flag, False)
+    repository = CardRepository()
+
+    created = repository.create(db, column.id, "New")
+    assert created.title == "New"
+    assert repository.update(db, card.id, title="Renamed").title == "Renamed"
+    assert repository.update(db, "missing", title="Renamed") is None
+    assert repository.delete(db, created.id) is True
+    assert repository.delete(db, created.id) is False
+
+
+def test_delete_chunks_for_board_bump_version_per_chunk(db):
+    column, _ = make_column(db, [0, 1, 2, 3, 4])
+    board_id = column.board_id
+    repository = CardRepository()
+
+    deleted = []
+    while count := repository.delete_chunk_for_board(db, board_id, 2):
+        deleted.append(count)
+
+    assert deleted == [2, 2, 1]
+    assert db.query(Card).count() == 0
+    assert db.get(Board, board_id).version == 3
+
+
+def test_only_position_index_violations_are_retried(db):
+    column, _ = make_column(db, [0])
+    column_id = column.id
+    service = CardService(db)
+    attempts = []
+
+    def insert_card(column_id, position):
+        attempts.append(column_id)
+        db.execute(insert(Card).values(id=str(uuid.uuid4()), column_id=column_id, title="Card", position=position))
+
+    with pytest.raises(PositionConflict):
+        service._retry_positions(lambda: insert_card(column_id, 0))
+    assert len(attempts) == POSITION_RETRIES
+
+    attempts.clear()
+    with pytest.raises(IntegrityError):
+        service._retry_positions(lambda: insert_card("missing", 0))
+    assert len(attempts) == 1
@@ -0,0 +1,89 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.models import Board, BoardChange
+from app.repositories.board_change_repository import PRUNE_INTERVAL, BoardChangeRepository
+
+
+def create_board_with_column(client: TestClient) -> tuple[str, str]:
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    column_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    return board_id, column_id
+
+
+def test_changes_since_version(client: TestClient):
+    board_id, column_id = create_board_with_column(client)
+    card_id = client.post(f"/columns/{column_id}/cards", json={"title": "Card"}).json()["id"]
+    client.put(f"/cards/{card_id}", json={"title": "Renamed"})
+    client.delete(f"/cards/{card_id}")
+
+    body = client.get(f"/boards/{board_id}/changes", params={"since": 1}).json()
+    assert (body["version"], body["reset"], body["has_more"]) == (4, False, False)
+    assert [(c["version"], c["type"]) for c in body["changes"]] == [
+        (2, "card.created"), (3, "card.updated"), (4, "card.deleted"),
+    ]
+    assert body["changes"][1]["card"]["title"] == "Renamed"
+
+    body = client.get(f"/boards/{board_id}/changes", params={"since": 4}).json()
+    assert (body["version"], body["reset"], body["changes"]) == (4, False, [])
+
+
+def test_change_log_is_written_in_the_same_transaction(client: TestClient, monkeypatch):
+    board_id, column_id = create_board_with_column(client)
+
+    def fail_append(self, db, board_id, version, event):
+        raise RuntimeError("log unavailable")
+
+    monkeypatch.setattr(BoardChangeRepository, "append", fail_append)
+    with pytest.raises(RuntimeError):
+        client.post(f"/columns/{column_id}/cards", json={"title": "Card"})
+    monkeypatch.undo()
+
+    board = client.get(f"/boards/{board_id}").json()
+    assert (board["version"], board["columns"][0]["cards"]) == (1, [])
+    body = client.get(f"/boards/{board_id}/changes", params={"since": 0}).json()
+    assert (body["version"], body["reset"]) == (1, False)
+
+
+def test_changes_are_paginated(client: TestClient):
+    board_id, column_id = create_board_with_column(client)
+    for i in range(3):
+        client.post(f"/columns/{column_id}/cards", json={"title": f"Card {i}"})
+
+    body = client.get(f"/boards/{board_id}/changes", params={"since": 0, "limit": 2}).json()
+    assert (body["version"], body["has_more"]) == (2, True)
+    body = client.get(f"/boards/{board_id}/changes", params={"since": body["version"], "limit": 2}).json()
+    assert (body["version"], body["has_more"]) == (4, False)
+    assert [c["version"] for c in body["changes"]] == [3, 4]
+
+
+def test_changes_require_reset_when_log_has_gaps(client: TestClient, db):
+    board_id, column_id = create_board_with_column(client)
+    client.post(f"/columns/{column_id}/cards", json={"title": "Card"})
+    db.query(BoardChange).filter(BoardChange.version == 1).delete()
+    db.commit()
+
+    body = client.get(f"/boards/{board_id}/changes", params={"since": 0}).json()
+    assert (body["version"], body["reset"], body["changes"]) == (2, True, [])
+    assert client.get(f"/boards/{board_id}/changes", params={"since": 9}).json()["reset"] is True
+
+
+def test_changes_validation_and_missing_board(client: TestClient):
+    assert client.get("/boards/missing/changes", params={"since": 0}).status_code == 404
+    board_id, _ = create_board_with_column(client)
+    assert client.get(f"/boards/{board_id}/changes").status_code == 422
+    assert client.get(f"/boards/{board_id}/changes", params={"since": -1}).status_code == 422
+
+
+def test_change_log_is_pruned_past_retention(db):
+    board = Board(name="Board", version=0)
+    db.add(board)
+    db.commit()
+    repository = BoardChangeRepository(retention=10)
+
+    for version in range(1, PRUNE_INTERVAL + 1):
+        repository.append(db, board.id, version, "{}")
+    db.commit()
+
+    versions = [row.version for row in repository.get_since(db, board.id, 0, 1000)]
+    assert versions == list(range(PRUNE_INTERVAL - 9, PRUNE_INTERVAL + 1))
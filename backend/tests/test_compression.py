@@ -0,0 +1,78 @@
+import gzip
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import compression
+from app.cache import board_cache
+from app.compression import choose_encoding, compress
+
+
+def create_large_board(client: TestClient) -> str:
+    board_id = client.post("/boards", json={"name": "Large"}).json()["id"]
+    column_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    for i in range(20):
+        client.post(f"/columns/{column_id}/cards", json={"title": f"Card {i}", "description": "x" * 200})
+    return board_id
+
+
+def test_choose_encoding():
+    assert choose_encoding(None) is None
+    assert choose_encoding("identity") is None
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0") is None
+    assert choose_encoding("*") in ("br", "gzip")
+    assert choose_encoding("gzip;q=0.5, identity") is None
+
+
+def test_choose_encoding_prefers_highest_quality(monkeypatch):
+    monkeypatch.setattr(compression, "supported_encodings", lambda: ("br", "gzip"))
+    assert choose_encoding("gzip, br") == "br"
+    assert choose_encoding("br;q=0.5, gzip;q=0.8") == "gzip"
+    assert choose_encoding("br;q=0, gzip;q=0.1") == "gzip"
+    assert choose_encoding("*;q=0.5, gzip") == "gzip"
+    assert choose_encoding("br;level=1;q=0.2, gzip;q=0.1") == "br"
+    assert choose_encoding("br;q=0, gzip;q=0") is None
+
+
+def test_board_detail_served_compressed_from_cache(client: TestClient):
+    board_id = create_large_board(client)
+
+    first = client.get(f"/boards/{board_id}", headers={"Accept-Encoding": "gzip"})
+    second = client.get(f"/boards/{board_id}", headers={"Accept-Encoding": "gzip"})
+
+    assert first.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in first.headers["vary"]
+    assert len(first.json()["columns"][0]["cards"]) == 20
+    assert second.content == first.content
+    assert board_cache.stats()["encoded_bytes"] > 0
+
+
+def test_board_detail_uncompressed_without_accept_encoding(client: TestClient):
+    board_id = create_large_board(client)
+
+    response = client.get(f"/boards/{board_id}", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert len(response.json()["columns"][0]["cards"]) == 20
+
+
+def test_middleware_compresses_large_responses_only(client: TestClient):
+    board_id = create_large_board(client)
+
+    small = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    column_id = client.get(f"/boards/{board_id}").json()["columns"][0]["id"]
+    cards = client.get(f"/columns/{column_id}/cards", headers={"Accept-Encoding": "gzip"})
+    assert cards.headers["content-encoding"] == "gzip"
+    assert len(cards.json()) == 20
+
+
+def test_compress_gzip_round_trip():
+    assert gzip.decompress(compress(b"payload" * 100, "gzip")) == b"payload" * 100
+
+
+def test_compress_brotli_round_trip():
+    brotli = pytest.importorskip("brotli")
+    assert brotli.decompress(compress(b"payload" * 100, "br")) == b"payload" * 100
@@ -0,0 +1,120 @@
+import time
+
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import app.database
+from app.config import settings
+from app.database import TimedQueuePool, async_database_url, begin_snapshot, engine_options, pool_status
+from app.migrations import create_schema
+from app.models import Board
+from app.replicas import PRIMARY_COOKIE, ReadYourWritesMiddleware, ReplicaSet, replica_urls
+
+
+def test_engine_options_apply_pool_settings_and_statement_timeout(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_size", 12)
+    monkeypatch.setattr(settings, "db_statement_timeout_ms", 5000)
+
+    options = engine_options("postgresql+psycopg2://u:p@db/kanban")
+    assert options["pool_size"] == 12
+    assert options["pool_pre_ping"] is settings.db_pool_pre_ping
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+    async_options = engine_options("postgresql+asyncpg://u:p@db/kanban", use_async=True)
+    assert async_options["connect_args"] == {"server_settings": {"statement_timeout": "5000"}}
+
+
+def test_engine_options_leave_in_memory_sqlite_alone():
+    assert engine_options("sqlite://") == {}
+
+
+def test_async_database_url():
+    assert async_database_url("postgresql://u:p@db/kanban") == "postgresql+asyncpg://u:p@db/kanban"
+    assert async_database_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+
+def test_pool_status_reports_checkouts(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=2)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        status = pool_status(engine)
+        assert status["checked_out"] == 1
+    status = pool_status(engine)
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 1
+    assert status["timeouts"] == 0
+
+
+def test_debug_pool_endpoint(client: TestClient):
+    response = client.get("/debug/pool")
+    assert response.status_code == 200
+    assert "status" in response.json()["sync"]
+
+
+def test_replica_urls_and_round_robin():
+    assert replica_urls("") == []
+    assert replica_urls(" sqlite:///a.db, ,sqlite:///b.db") == ["sqlite:///a.db", "sqlite:///b.db"]
+    replicas = ReplicaSet(["a", "b"])
+    assert [replicas.next_factory() for _ in range(3)] == ["a", "b", "a"]
+    assert not ReplicaSet()
+
+
+def test_reads_go_to_replica_unless_client_wrote_recently(client: TestClient, tmp_path, monkeypatch):
+    replica_engine = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    create_schema(replica_engine)
+    ReplicaSession = sessionmaker(autoflush=False, bind=replica_engine)
+    with ReplicaSession() as session:
+        session.add(Board(name="Replica", version=0))
+        session.commit()
+    monkeypatch.setattr(app.database, "read_replicas", ReplicaSet([ReplicaSession]))
+
+    primary_id = client.post("/boards", json={"name": "Primary"}).json()["id"]
+    assert [b["name"] for b in client.get("/boards").json()] == ["Replica"]
+    assert client.get(f"/boards/{primary_id}/changes", params={"since": 0}).status_code == 200
+
+    client.cookies.set(PRIMARY_COOKIE, str(time.time() + 60))
+    assert [b["name"] for b in client.get("/boards").json()] == ["Primary"]
+    client.cookies.set(PRIMARY_COOKIE, str(time.time() - 1))
+    assert [b["name"] for b in client.get("/boards").json()] == ["Replica"]
+
+
+def test_read_your_writes_middleware_sets_cookie_after_successful_writes():
+    api = FastAPI()
+    api.add_middleware(ReadYourWritesMiddleware, window_seconds=5)
+
+    @api.post("/ok")
+    def ok():
+        return {}
+
+    @api.post("/fail")
+    def fail():
+        raise HTTPException(status_code=409)
+
+    @api.get("/read")
+    def read():
+        return {}
+
+    with TestClient(api) as test_client:
+        assert PRIMARY_COOKIE not in test_client.get("/read").cookies
+        assert PRIMARY_COOKIE not in test_client.post("/fail").cookies
+        until = float(test_client.post("/ok").cookies[PRIMARY_COOKIE])
+    assert time.time() < until <= time.time() + 5
+
+
+def test_snapshot_reads_ignore_later_commits(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'snapshot.db'}")
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+    create_schema(engine)
+    Session = sessionmaker(autoflush=False, bind=engine)
+
+    with Session() as reader, Session() as writer:
+        begin_snapshot(reader)
+        assert reader.query(Board).count() == 0
+        writer.add(Board(name="Later", version=0))
+        writer.commit()
+        assert reader.query(Board).count() == 0
+        reader.rollback()
+        assert reader.query(Board).count() == 1
@@ -0,0 +1,131 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.events import board_event_stream, board_events
+from app.events import EventBroker, InProcessEventBroker, event_broker, format_sse
+from app.models import Board
+
+
+class FakeRequest:
+    def __init__(self):
+        self.disconnected = False
+
+    async def is_disconnected(self):
+        return self.disconnected
+
+
+def parse_sse(chunk: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in chunk.strip().splitlines())
+    return {"id": fields.get("id"), "event": fields["event"], "data": json.loads(fields["data"])}
+
+
+def test_broker_fans_out_per_board():
+    async def scenario():
+        broker = InProcessEventBroker()
+        first = broker.subscribe("a")
+        second = broker.subscribe("a")
+        other = broker.subscribe("b")
+
+        broker.publish("a", {"type": "card.created", "version": 1})
+        await asyncio.sleep(0)
+
+        assert first.queue.get_nowait()["version"] == 1
+        assert second.queue.get_nowait()["version"] == 1
+        assert other.queue.empty()
+
+        broker.unsubscribe(first)
+        broker.unsubscribe(second)
+        assert broker.subscriber_count("a") == 0
+
+    asyncio.run(scenario())
+
+
+def test_broker_replaces_backlog_with_resync_when_full():
+    async def scenario():
+        broker = InProcessEventBroker(queue_size=2)
+        subscription = broker.subscribe("a")
+        for version in range(3):
+            broker.publish("a", {"type": "card.updated", "version": version})
+        await asyncio.sleep(0)
+        assert subscription.queue.get_nowait() == {"type": "resync"}
+        assert subscription.queue.empty()
+
+    asyncio.run(scenario())
+
+
+def test_event_stream_yields_ready_events_and_keepalives():
+    async def scenario():
+        broker = InProcessEventBroker()
+        request = FakeRequest()
+        subscription = broker.subscribe("a")
+        stream = board_event_stream(request, broker, subscription, {"type": "ready", "version": 3}, heartbeat=0.01)
+
+        assert parse_sse(await stream.__anext__())["data"] == {"type": "ready", "version": 3}
+        assert await stream.__anext__() == ": keepalive\n\n"
+
+        broker.publish("a", {"type": "card.deleted", "version": 4, "card_id": "c"})
+        chunk = parse_sse(await stream.__anext__())
+        assert chunk["id"] == "4"
+        assert chunk["event"] == "card.deleted"
+
+        request.disconnected = True
+        await stream.aclose()
+        assert broker.subscriber_count("a") == 0
+
+    asyncio.run(scenario())
+
+
+def test_services_publish_card_and_column_events(client: TestClient, monkeypatch):
+    published = []
+    monkeypatch.setattr(event_broker, "publish", lambda board_id, event: published.append((board_id, event)))
+
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    column_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    card_id = client.post(f"/columns/{column_id}/cards", json={"title": "Card"}).json()["id"]
+    client.put(f"/cards/{card_id}", json={"title": "Renamed"})
+    client.patch(f"/cards/{card_id}/move", json={"newColumnId": column_id})
+    client.delete(f"/cards/{card_id}")
+    client.delete(f"/boards/{board_id}/columns/{column_id}")
+    client.delete(f"/boards/{board_id}")
+
+    assert {b for b, _ in published} == {board_id}
+    assert [e["type"] for _, e in published] == [
+        "column.created", "card.created", "card.updated", "card.moved", "card.deleted", "column.deleted",
+        "board.deleted",
+    ]
+    assert [e.get("version") for _, e in published] == [1, 2, 3, 4, 5, 6, None]
+    assert published[2][1]["card"]["title"] == "Renamed"
+
+
+def test_board_events_not_found(client: TestClient):
+    assert client.get("/boards/missing/events").status_code == 404
+    assert format_sse({"type": "resync"}) == 'event: resync\ndata: {"type":"resync"}\n\n'
+
+
+def test_board_events_release_the_session_before_streaming(db, monkeypatch):
+    board = Board(name="Board", version=0)
+    db.add(board)
+    db.commit()
+    board_id = board.id
+    db.close()
+    monkeypatch.setattr("app.api.events.event_broker", InProcessEventBroker())
+
+    async def scenario():
+        response = await board_events(board_id, FakeRequest(), db)
+        assert response.media_type == "text/event-stream"
+        assert not db.in_transaction()
+        assert db.get_bind().pool.checkedout() == 0
+
+    asyncio.run(scenario())
+
+
+def test_event_brokers_must_implement_the_whole_interface():
+    class PublishOnlyBroker(EventBroker):
+        def publish(self, board_id, event):
+            pass
+
+    with pytest.raises(TypeError):
+        PublishOnlyBroker()
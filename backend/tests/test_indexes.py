@@ -0,0 +1,46 @@
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import sqlite
+
+from app.models import Card, Column
+
+
+def query_plan(db, statement) -> str:
+    compiled = statement.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True})
+    rows = db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return "\n".join(row.detail for row in rows)
+
+
+def test_board_load_uses_lookup_indexes(db):
+    columns_plan = query_plan(
+        db,
+        select(Column.id).where(Column.board_id == "board-id").order_by(Column.position),
+    )
+    cards_plan = query_plan(
+        db,
+        select(Card.id)
+        .join(Column, Card.column_id == Column.id)
+        .where(Column.board_id == "board-id")
+        .order_by(Card.position),
+    )
+
+    assert "ix_columns_board_id_position" in columns_plan
+    assert "ix_cards_column_id_position" in cards_plan
+
+
+def test_next_position_uses_column_position_index(db):
+    plan = query_plan(db, select(func.max(Card.position)).where(Card.column_id == "column-id"))
+    assert "ix_cards_column_id_position" in plan
+
+
+def test_board_listing_uses_name_keyset_index(db):
+    from app.models import Board
+
+    plan = query_plan(
+        db,
+        select(Board.id, Board.name)
+        .where(Board.name >= "Sprint", Board.name < "Sprinu")
+        .order_by(Board.name, Board.id)
+        .limit(50),
+    )
+    assert "ix_boards_name_id" in plan
+    assert "TEMP B-TREE" not in plan
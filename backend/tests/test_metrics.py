@@ -0,0 +1,105 @@
+import asyncio
+import logging
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+
+from app.metrics import Histogram, MetricsMiddleware, RequestMetrics, RequestStats, current_request, request_metrics
+from app.models import Board
+
+
+def test_histogram_renders_prometheus_buckets():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), (0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+
+    assert histogram.render() == [
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{route="/a",le="0.1"} 1',
+        'latency_seconds_bucket{route="/a",le="1.0"} 2',
+        'latency_seconds_bucket{route="/a",le="+Inf"} 2',
+        'latency_seconds_sum{route="/a"} 0.55',
+        'latency_seconds_count{route="/a"} 2',
+    ]
+
+
+def test_metrics_endpoint_reports_routes_and_queries(client: TestClient):
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    client.get(f"/boards/{board_id}")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/boards/{board_id}",status="200"}' in body
+    assert 'http_request_duration_seconds_count{method="POST",route="/boards",status="200"}' in body
+    query_counts = [
+        line for line in body.splitlines()
+        if line.startswith('db_queries_per_request_count{method="GET",route="/boards/{board_id}"}')
+    ]
+    assert query_counts
+    assert 'db_queries_per_request_bucket{method="GET",route="/boards/{board_id}",le="0"}' in body
+
+
+def test_request_query_count(client: TestClient, monkeypatch):
+    recorded = []
+    monkeypatch.setattr(request_metrics, "record", lambda method, route, status, seconds, stats: recorded.append(
+        (method, route, stats.queries)
+    ))
+
+    board_id = client.post("/boards", json={"name": "Board"}).json()["id"]
+    client.get(f"/boards/{board_id}")
+
+    assert recorded[0][:2] == ("POST", "/boards")
+    assert recorded[0][2] >= 1
+    assert recorded[1][:2] == ("GET", "/boards/{board_id}")
+    assert recorded[1][2] >= 2
+
+
+def test_query_budget_warning(caplog):
+    metrics = RequestMetrics(query_budget=2)
+
+    with caplog.at_level(logging.WARNING, logger="app.metrics"):
+        metrics.record("GET", "/boards/{board_id}", 200, 0.01, RequestStats(queries=2))
+        metrics.record("PATCH", "/cards/{card_id}/move", 200, 0.01, RequestStats(queries=5))
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "PATCH /cards/{card_id}/move ran 5 SQL statements (budget 2)"
+    ]
+    assert 'db_query_budget_exceeded_total{method="PATCH",route="/cards/{card_id}/move"} 1' in metrics.render()
+
+
+def test_select_rows_are_counted_as_fetched(db):
+    db.add_all([Board(name=f"Board {i}") for i in range(3)])
+    db.commit()
+    stats = RequestStats()
+    token = current_request.set(stats)
+    try:
+        assert len(db.scalars(select(Board)).all()) == 3
+        db.execute(update(Board).values(name="Renamed"))
+    finally:
+        current_request.reset(token)
+
+    assert stats.queries == 2
+    assert stats.rows == 6
+
+
+def test_streaming_latency_stops_at_response_headers():
+    recorded = []
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await asyncio.sleep(0.3)
+        await send({"type": "http.response.body", "body": b"done"})
+
+    async def send(message):
+        pass
+
+    metrics = RequestMetrics()
+    metrics.record = lambda method, route, status, seconds, stats: recorded.append((status, seconds))
+    asyncio.run(MetricsMiddleware(streaming_app, metrics)({"type": "http", "method": "GET"}, None, send))
+
+    assert recorded[0][0] == 200
+    assert recorded[0][1] < 0.3
@@ -0,0 +1,53 @@
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+import app.models  # noqa: F401
+from app.database import Base
+from app.migrations import include_name, upgrade_database
+
+
+def test_migrations_match_models(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    upgrade_database(engine)
+
+    with engine.connect() as connection:
+        diff = compare_metadata(
+            MigrationContext.configure(connection, opts={"include_name": include_name}), Base.metadata
+        )
+    assert diff == []
+
+
+def test_upgrade_existing_create_all_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE boards (id VARCHAR(36) PRIMARY KEY, name VARCHAR(255) NOT NULL)"))
+        connection.execute(text(
+            "CREATE TABLE columns (id VARCHAR(36) PRIMARY KEY, name VARCHAR(255) NOT NULL, "
+            "position INTEGER NOT NULL, board_id VARCHAR(36) NOT NULL REFERENCES boards (id) ON DELETE CASCADE)"
+        ))
+        connection.execute(text(
+            "CREATE TABLE cards (id VARCHAR(36) PRIMARY KEY, title VARCHAR(255) NOT NULL, description TEXT, "
+            "position INTEGER NOT NULL, column_id VARCHAR(36) NOT NULL REFERENCES columns (id) ON DELETE CASCADE)"
+        ))
+        connection.execute(text("INSERT INTO boards (id, name) VALUES ('b1', 'Legacy')"))
+        connection.execute(text("INSERT INTO columns (id, name, position, board_id) VALUES ('c1', 'To Do', 0, 'b1')"))
+        connection.execute(text(
+            "INSERT INTO cards (id, title, description, position, column_id) "
+            "VALUES ('k1', 'Legacy card', 'needs indexing', 0, 'c1'), ('k0', 'Same slot', NULL, 0, 'c1'), "
+            "('k2', 'Last', NULL, 1, 'c1')"
+        ))
+
+    upgrade_database(engine)
+
+    inspector = inspect(engine)
+    assert "ix_cards_column_id_position" in {i["name"] for i in inspector.get_indexes("cards")}
+    assert "ix_columns_board_id_position" in {i["name"] for i in inspector.get_indexes("columns")}
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT version FROM boards WHERE id = 'b1'")).scalar() == 0
+        assert connection.execute(text("SELECT id, position FROM cards ORDER BY position")).all() == [
+            ("k0", 0), ("k1", 1024), ("k2", 2048),
+        ]
+        assert connection.execute(
+            text("SELECT card_id FROM cards_fts WHERE cards_fts MATCH 'indexing'")
+        ).scalar() == "k1"
@@ -0,0 +1,106 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.repositories.card_repository import CardRepository
+
+
+def create_board_with_cards(client: TestClient, name: str, cards: list[tuple[str, str | None]]) -> tuple[str, str]:
+    board_id = client.post("/boards", json={"name": name}).json()["id"]
+    column_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    for title, description in cards:
+        client.post(f"/columns/{column_id}/cards", json={"title": title, "description": description})
+    return board_id, column_id
+
+
+def test_search_board_cards_ranked(client: TestClient):
+    board_id, _ = create_board_with_cards(client, "Sprint", [
+        ("Fix login", "login page throws on empty password"),
+        ("Write docs", None),
+        ("Login audit", "review login, login history and login alerts"),
+    ])
+    create_board_with_cards(client, "Other", [("Login elsewhere", None)])
+
+    response = client.get(f"/boards/{board_id}/cards/search", params={"q": "login"})
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["title"] for r in results] == ["Login audit", "Fix login"]
+    assert all(r["board_id"] == board_id for r in results)
+    assert results[0]["rank"] >= results[1]["rank"]
+
+
+def test_search_all_boards_and_pagination(client: TestClient):
+    create_board_with_cards(client, "A", [("Deploy api", None), ("Deploy web", None)])
+    create_board_with_cards(client, "B", [("Deploy worker", None)])
+
+    seen = []
+    params = {"q": "deploy", "limit": 2}
+    while True:
+        response = client.get("/cards/search", params=params)
+        assert response.status_code == 200
+        seen.extend(r["title"] for r in response.json())
+        next_offset = response.headers.get("x-next-offset")
+        if not next_offset:
+            break
+        params["offset"] = next_offset
+
+    assert sorted(seen) == ["Deploy api", "Deploy web", "Deploy worker"]
+
+
+def test_search_index_follows_updates_and_deletes(client: TestClient):
+    board_id, column_id = create_board_with_cards(client, "Board", [("Original title", None)])
+    card_id = client.get(f"/boards/{board_id}").json()["columns"][0]["cards"][0]["id"]
+
+    client.put(f"/cards/{card_id}", json={"title": "Renamed", "description": "now searchable"})
+    assert client.get("/cards/search", params={"q": "original"}).json() == []
+    assert [r["id"] for r in client.get("/cards/search", params={"q": "searchable"}).json()] == [card_id]
+
+    client.delete(f"/cards/{card_id}")
+    assert client.get("/cards/search", params={"q": "searchable"}).json() == []
+
+
+def test_search_index_follows_cascading_board_delete(client: TestClient):
+    board_id, _ = create_board_with_cards(client, "Board", [("Cascaded card", None)])
+    assert len(client.get("/cards/search", params={"q": "cascaded"}).json()) == 1
+
+    client.delete(f"/boards/{board_id}")
+    assert client.get("/cards/search", params={"q": "cascaded"}).json() == []
+
+
+def test_search_validation_and_missing_board(client: TestClient):
+    assert client.get("/boards/missing/cards/search", params={"q": "x"}).status_code == 404
+    assert client.get("/cards/search").status_code == 422
+    response = client.get("/cards/search", params={"q": '"* OR ('})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_search_index_survives_rowid_renumbering(client: TestClient, db):
+    board_id, _ = create_board_with_cards(client, "Board", [("First", None), ("Second", None), ("Third", None)])
+    first_id, second_id, _ = [c["id"] for c in client.get(f"/boards/{board_id}").json()["columns"][0]["cards"]]
+    client.delete(f"/cards/{first_id}")
+    # Table rebuilds (batch migrations, dump and restore, VACUUM) may renumber the rowids of cards.
+    db.execute(text("UPDATE cards SET rowid = rowid - 1"))
+    db.commit()
+
+    client.put(f"/cards/{second_id}", json={"title": "Renamed"})
+
+    assert [r["id"] for r in client.get("/cards/search", params={"q": "renamed"}).json()] == [second_id]
+    assert client.get("/cards/search", params={"q": "second"}).json() == []
+    assert client.get("/cards/search", params={"q": first_id.split("-")[0]}).json() == []
+
+
+def test_search_falls_back_to_substring_match(client: TestClient, db):
+    board_id, _ = create_board_with_cards(client, "Board", [("Deploy api", "50%_off"), ("Write docs", None)])
+    repository = CardRepository()
+    dialect = db.get_bind().dialect
+    original_name = dialect.name
+    dialect.name = "mysql"
+    try:
+        results = repository.search(db, "DEPLOY", board_id, 10)
+        assert [row.title for row in results] == ["Deploy api"]
+        assert repository.search(db, "deploy off", None, 10)[0].title == "Deploy api"
+        assert repository.search(db, "0_", None, 10) == []
+        assert repository.search(db, "!!", None, 10) == []
+    finally:
+        dialect.name = original_name
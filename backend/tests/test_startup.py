@@ -0,0 +1,29 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import engine
+from app.main import create_app
+from app.startup import StartupReport
+
+
+def test_serving_app_runs_no_sql_on_startup(db):
+    statements = []
+    record = lambda conn, cursor, statement, *args: statements.append(statement)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with TestClient(create_app(migrate_on_startup=False)) as client:
+            report = client.get("/debug/startup").json()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert statements == []
+    assert set(report["phases_ms"]) == {"imports", "app", "db_connect"}
+    assert report["total_ms"] >= report["phases_ms"]["app"]
+
+
+def test_startup_report_phases():
+    ticks = iter([1.0, 1.25])
+    report = StartupReport({"imports": 0.5}, clock=lambda: next(ticks))
+    with report.phase("app"):
+        pass
+    assert report.as_dict() == {"phases_ms": {"imports": 500.0, "app": 250.0}, "total_ms": 750.0}
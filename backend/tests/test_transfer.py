@@ -0,0 +1,114 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.services import board_transfer_service
+
+
+def parse_ndjson(body: bytes) -> list[dict]:
+    return [json.loads(line) for line in body.splitlines() if line]
+
+
+def seed_board(client: TestClient) -> str:
+    board_id = client.post("/boards", json={"name": "Source"}).json()["id"]
+    todo_id = client.post(f"/boards/{board_id}/columns", json={"name": "To Do"}).json()["id"]
+    done_id = client.post(f"/boards/{board_id}/columns", json={"name": "Done"}).json()["id"]
+    for i in range(3):
+        client.post(f"/columns/{todo_id}/cards", json={"title": f"Todo {i}", "description": f"D{i}"})
+    client.post(f"/columns/{done_id}/cards", json={"title": "Shipped"})
+    return board_id
+
+
+def board_shape(board: dict) -> list:
+    return [
+        (column["name"], [(card["title"], card["description"], card["position"]) for card in column["cards"]])
+        for column in board["columns"]
+    ]
+
+
+def test_export_streams_board_columns_and_cards(client: TestClient, monkeypatch):
+    monkeypatch.setattr(board_transfer_service, "EXPORT_CHUNK_SIZE", 2)
+    board_id = seed_board(client)
+
+    response = client.get(f"/boards/{board_id}/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = parse_ndjson(response.content)
+    assert [r["type"] for r in records] == ["board", "column", "column"] + ["card"] * 4
+    assert records[0] == {"type": "board", "id": board_id, "name": "Source"}
+    column_ids = {r["id"] for r in records if r["type"] == "column"}
+    assert all(r["column_id"] in column_ids for r in records if r["type"] == "card")
+
+
+def test_export_board_not_found(client: TestClient):
+    assert client.get("/boards/missing/export").status_code == 404
+
+
+def test_import_round_trips_export(client: TestClient, monkeypatch):
+    monkeypatch.setattr(board_transfer_service, "IMPORT_CHUNK_SIZE", 2)
+    board_id = seed_board(client)
+    exported = client.get(f"/boards/{board_id}/export").content
+
+    response = client.post(
+        "/boards/import", content=exported, headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["id"] != board_id
+    assert result["name"] == "Source"
+    assert (result["column_count"], result["card_count"]) == (2, 4)
+    original = client.get(f"/boards/{board_id}").json()
+    imported = client.get(f"/boards/{result['id']}").json()
+    assert board_shape(imported) == board_shape(original)
+
+
+def test_import_rejects_invalid_records_atomically(client: TestClient, monkeypatch):
+    monkeypatch.setattr(board_transfer_service, "IMPORT_CHUNK_SIZE", 1)
+    lines = [
+        {"type": "board", "name": "Broken"},
+        {"type": "column", "id": "c1", "name": "To Do", "position": 0},
+        {"type": "card", "column_id": "c1", "title": "Ok", "position": 0},
+        {"type": "card", "column_id": "c2", "title": "Orphan", "position": 0},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines).encode()
+
+    response = client.post("/boards/import", content=body)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Line 4: Unknown column 'c2'"
+    assert client.get("/boards", params={"name_prefix": "Broken"}).json() == []
+
+
+def test_import_rejects_duplicate_card_positions(client: TestClient):
+    lines = [
+        {"type": "board", "name": "Duplicates"},
+        {"type": "column", "id": "c1", "name": "To Do", "position": 0},
+        {"type": "card", "column_id": "c1", "title": "First", "position": 0},
+        {"type": "card", "column_id": "c1", "title": "Second", "position": 0},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines).encode()
+
+    response = client.post("/boards/import", content=body)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Line 4: Duplicate position 0 in column 'c1'"
+
+
+def test_import_rejects_oversized_lines(client: TestClient, monkeypatch):
+    monkeypatch.setattr(board_transfer_service, "IMPORT_MAX_LINE_BYTES", 64)
+    board = json.dumps({"type": "board", "name": "Big"}).encode()
+
+    response = client.post("/boards/import", content=board + b"\n" + b"x" * 200)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Line 2: Line exceeds 64 bytes"
+    assert client.get("/boards", params={"name_prefix": "Big"}).json() == []
+
+
+def test_import_requires_board_record_first(client: TestClient):
+    body = b'{"type": "column", "id": "c1", "name": "To Do", "position": 0}\n'
+    assert client.post("/boards/import", content=body).status_code == 400
+    assert client.post("/boards/import", content=b"").status_code == 400
+    assert client.post("/boards/import", content=b"not json\n").status_code == 400
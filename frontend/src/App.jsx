@@ -3,8 +3,11 @@ import { api } from './api'
 import BoardList from './components/BoardList'
 import KanbanBoard from './components/KanbanBoard'
 
+const BOARD_PAGE_SIZE = 50
+
 export default function App() {
   const [boards, setBoards] = useState([])
+  const [nextCursor, setNextCursor] = useState(null)
   const [selectedBoard, setSelectedBoard] = useState(null)
   const [boardDetail, setBoardDetail] = useState(null)
   const [loading, setLoading] = useState(true)
@@ -12,8 +15,9 @@ export default function App() {
 
   const loadBoards = async () => {
     try {
-      const data = await api.boards.list()
-      setBoards(data)
+      const page = await api.boards.list({ limit: BOARD_PAGE_SIZE })
+      setBoards(page.boards)
+      setNextCursor(page.nextCursor)
     } catch (e) {
       setError(e.message)
     } finally {
@@ -21,6 +25,16 @@ export default function App() {
     }
   }
 
+  const loadMoreBoards = async () => {
+    try {
+      const page = await api.boards.list({ cursor: nextCursor, limit: BOARD_PAGE_SIZE })
+      setBoards((current) => [...current, ...page.boards])
+      setNextCursor(page.nextCursor)
+    } catch (e) {
+      setError(e.message)
+    }
+  }
+
   const selectBoard = async (board) => {
     setSelectedBoard(board)
     setError(null)
@@ -62,6 +76,7 @@ export default function App() {
         boards={boards}
         onSelect={selectBoard}
         onRefresh={loadBoards}
+        onLoadMore={nextCursor ? loadMoreBoards : null}
         error={error}
       />
     )
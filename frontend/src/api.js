@@ -1,6 +1,8 @@
+import { BOARD_EVENT_TYPES } from './boardEvents';
+
 const API_URL = import.meta.env.VITE_API_URL || '/api';
 
-async function fetchApi(path, options = {}) {
+async function request(path, options = {}) {
   const url = `${API_URL}${path}`;
   const res = await fetch(url, {
     ...options,
@@ -15,38 +17,102 @@ async function fetchApi(path, options = {}) {
     const msg = Array.isArray(d) ? d[0]?.msg : d;
     throw new Error(msg || res.statusText);
   }
+  return res;
+}
+
+async function fetchApi(path, options = {}) {
+  const res = await request(path, options);
   if (res.status === 204) return null;
   return res.json();
 }
 
+function ifMatch(version) {
+  return version == null ? {} : { 'If-Match': `W/"${version}"` };
+}
+
 export const api = {
   boards: {
-    list: () => fetchApi('/boards'),
-    get: (id) => fetchApi(`/boards/${id}`),
+    list: async ({ cursor, namePrefix, limit } = {}) => {
+      const params = new URLSearchParams();
+      if (cursor) params.set('cursor', cursor);
+      if (namePrefix) params.set('name_prefix', namePrefix);
+      if (limit) params.set('limit', limit);
+      const query = params.toString();
+      const res = await request(`/boards${query ? `?${query}` : ''}`);
+      return { boards: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') };
+    },
+    get: (id, { cardsLimit } = {}) => fetchApi(
+      `/boards/${id}${cardsLimit != null ? `?cards_limit=${cardsLimit}` : ''}`
+    ),
+    changes: (id, since, { limit } = {}) => fetchApi(
+      `/boards/${id}/changes?since=${since}${limit ? `&limit=${limit}` : ''}`
+    ),
+    subscribe: (id, onEvent) => {
+      const source = new EventSource(`${API_URL}/boards/${id}/events`);
+      BOARD_EVENT_TYPES.forEach((type) => {
+        source.addEventListener(type, (e) => onEvent(JSON.parse(e.data)));
+      });
+      return () => source.close();
+    },
     create: (name) => fetchApi('/boards', {
       method: 'POST',
       body: JSON.stringify({ name }),
     }),
+    delete: (id) => fetchApi(`/boards/${id}`, { method: 'DELETE' }),
+    archived: async (id, { cursor, limit } = {}) => {
+      const params = new URLSearchParams();
+      if (cursor) params.set('cursor', cursor);
+      if (limit) params.set('limit', limit);
+      const query = params.toString();
+      const res = await request(`/boards/${id}/archive${query ? `?${query}` : ''}`);
+      return { cards: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') };
+    },
   },
   columns: {
     create: (boardId, name) => fetchApi(`/boards/${boardId}/columns`, {
       method: 'POST',
       body: JSON.stringify({ name }),
     }),
+    delete: (boardId, columnId) => fetchApi(`/boards/${boardId}/columns/${columnId}`, { method: 'DELETE' }),
+    archive: (boardId, columnId, { olderThanDays } = {}) => fetchApi(
+      `/boards/${boardId}/columns/${columnId}/archive${olderThanDays != null ? `?older_than_days=${olderThanDays}` : ''}`,
+      { method: 'POST' }
+    ),
   },
   cards: {
+    listByColumn: async (columnId, { cursor, limit } = {}) => {
+      const params = new URLSearchParams();
+      if (cursor) params.set('cursor', cursor);
+      if (limit) params.set('limit', limit);
+      const query = params.toString();
+      const res = await request(`/columns/${columnId}/cards${query ? `?${query}` : ''}`);
+      return { cards: await res.json(), nextCursor: res.headers.get('X-Next-Cursor') };
+    },
     create: (columnId, { title, description }) => fetchApi(`/columns/${columnId}/cards`, {
       method: 'POST',
       body: JSON.stringify({ title, description: description || null }),
     }),
-    update: (cardId, { title, description }) => fetchApi(`/cards/${cardId}`, {
+    update: (cardId, { title, description }, { version } = {}) => fetchApi(`/cards/${cardId}`, {
       method: 'PUT',
+      headers: ifMatch(version),
       body: JSON.stringify({ title, description: description ?? undefined }),
     }),
-    delete: (cardId) => fetchApi(`/cards/${cardId}`, { method: 'DELETE' }),
-    move: (cardId, newColumnId) => fetchApi(`/cards/${cardId}/move`, {
+    delete: (cardId, { version } = {}) => fetchApi(`/cards/${cardId}`, {
+      method: 'DELETE',
+      headers: ifMatch(version),
+    }),
+    archive: (cardId, { version } = {}) => fetchApi(`/cards/${cardId}/archive`, {
+      method: 'POST',
+      headers: ifMatch(version),
+    }),
+    batch: (boardId, operations) => fetchApi(`/boards/${boardId}/cards:batch`, {
+      method: 'POST',
+      body: JSON.stringify({ operations }),
+    }),
+    move: (cardId, newColumnId, { afterCardId, beforeCardId, version } = {}) => fetchApi(`/cards/${cardId}/move`, {
       method: 'PATCH',
-      body: JSON.stringify({ newColumnId }),
+      headers: ifMatch(version),
+      body: JSON.stringify({ newColumnId, afterCardId, beforeCardId }),
     }),
   },
 };
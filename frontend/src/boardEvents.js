@@ -0,0 +1,55 @@
+export const BOARD_EVENT_TYPES = [
+  'ready',
+  'resync',
+  'column.created',
+  'column.deleted',
+  'card.created',
+  'card.updated',
+  'card.moved',
+  'card.deleted',
+  'cards.batch',
+  'cards.archived',
+]
+
+function removeCard(columns, cardId) {
+  return columns.map((col) => ({
+    ...col,
+    cards: (col.cards || []).filter((c) => c.id !== cardId),
+  }))
+}
+
+function upsertCard(columns, card) {
+  // A delayed event must not roll back a newer copy already applied from a write response.
+  const current = columns.flatMap((col) => col.cards || []).find((c) => c.id === card.id)
+  if (current && current.version > card.version) return columns
+  return removeCard(columns, card.id).map((col) => (
+    col.id !== card.column_id
+      ? col
+      : { ...col, cards: [...col.cards, card].sort((a, b) => a.position - b.position) }
+  ))
+}
+
+export function applyBoardEvent(columns, event) {
+  switch (event.type) {
+    case 'column.created':
+      if (columns.some((col) => col.id === event.column.id)) return columns
+      return [...columns, { ...event.column, cards: [] }]
+    case 'column.deleted':
+      return columns.filter((col) => col.id !== event.column_id)
+    case 'card.created':
+    case 'card.updated':
+    case 'card.moved':
+      return upsertCard(columns, event.card)
+    case 'card.deleted':
+      return removeCard(columns, event.card_id)
+    case 'cards.archived':
+      return event.card_ids.reduce(removeCard, columns)
+    case 'cards.batch':
+      return event.operations.reduce(
+        (cols, op) => (op.op === 'delete' ? removeCard(cols, op.card_id) : upsertCard(cols, op.card)),
+        columns
+      )
+    default:
+      return columns
+  }
+}
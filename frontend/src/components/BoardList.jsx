@@ -1,7 +1,7 @@
 import { useState } from 'react'
 import { api } from '../api'
 
-export default function BoardList({ boards, onSelect, onRefresh, error }) {
+export default function BoardList({ boards, onSelect, onRefresh, onLoadMore, error }) {
   const [name, setName] = useState('')
   const [creating, setCreating] = useState(false)
 
@@ -54,6 +54,11 @@ export default function BoardList({ boards, onSelect, onRefresh, error }) {
             </button>
           ))
         )}
+        {onLoadMore && (
+          <button onClick={onLoadMore} style={styles.loadMore} className="add-btn">
+            Carregar mais
+          </button>
+        )}
       </div>
     </div>
   )
@@ -125,6 +130,16 @@ const styles = {
     cursor: 'pointer',
     transition: 'all 0.2s',
   },
+  loadMore: {
+    padding: 14,
+    borderRadius: 12,
+    border: '1px dashed #334155',
+    background: 'transparent',
+    color: '#94a3b8',
+    fontSize: 14,
+    cursor: 'pointer',
+    transition: 'all 0.2s',
+  },
   empty: {
     color: '#94a3b8',
     textAlign: 'center',
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import {
   DndContext,
   DragOverlay,
@@ -8,6 +8,7 @@ import {
   useSensors,
 } from '@dnd-kit/core'
 import { api } from '../api'
+import { applyBoardEvent } from '../boardEvents'
 import KanbanColumn from './KanbanColumn'
 import Card from './Card'
 
@@ -16,10 +17,53 @@ export default function KanbanBoard({ board, onBack, onRefresh, error }) {
   const [activeCard, setActiveCard] = useState(null)
   const [moveColumnId, setMoveColumnId] = useState(null)
 
+  const versionRef = useRef(board?.version ?? 0)
+
   useEffect(() => {
     setColumns(board?.columns || [])
+    versionRef.current = board?.version ?? 0
   }, [board])
 
+  useEffect(() => {
+    if (!board?.id) return undefined
+    let catchingUp = false
+
+    const catchUp = async () => {
+      if (catchingUp) return
+      catchingUp = true
+      try {
+        let page
+        do {
+          page = await api.boards.changes(board.id, versionRef.current)
+          if (page.reset) {
+            onRefresh()
+            return
+          }
+          versionRef.current = page.version
+          setColumns((cols) => page.changes.reduce(applyBoardEvent, cols))
+        } while (page.has_more)
+      } catch {
+        onRefresh()
+      } finally {
+        catchingUp = false
+      }
+    }
+
+    return api.boards.subscribe(board.id, (event) => {
+      if (event.type === 'resync') {
+        catchUp()
+        return
+      }
+      if (event.version === undefined || event.version <= versionRef.current) return
+      if (event.type === 'ready' || event.version > versionRef.current + 1) {
+        catchUp()
+        return
+      }
+      versionRef.current = event.version
+      setColumns((cols) => applyBoardEvent(cols, event))
+    })
+  }, [board?.id])
+
   const sensors = useSensors(
     useSensor(PointerSensor, { activationConstraint: { distance: 8 } }),
     useSensor(TouchSensor, { activationConstraint: { delay: 200, tolerance: 5 } })
@@ -44,7 +88,7 @@ export default function KanbanBoard({ board, onBack, onRefresh, error }) {
     if (overId.startsWith('column-')) {
       const colId = overId.replace('column-', '')
       if (colId !== card.column_id) {
-        await moveCard(card.id, colId)
+        await moveCard(card, colId)
       }
     }
   }
@@ -71,19 +115,22 @@ export default function KanbanBoard({ board, onBack, onRefresh, error }) {
     return null
   }
 
-  const moveCard = async (cardId, newColumnId) => {
+  // Writes show up right away from the response; the SSE event for the same version is a no-op afterwards.
+  const applyLocally = (event) => setColumns((cols) => applyBoardEvent(cols, event))
+
+  const moveCard = async (card, newColumnId) => {
+    applyLocally({ type: 'card.moved', card: { ...card, column_id: newColumnId, position: Infinity } })
     try {
-      await api.cards.move(cardId, newColumnId)
-      onRefresh()
+      applyLocally({ type: 'card.moved', card: await api.cards.move(card.id, newColumnId) })
     } catch (e) {
       alert(e.message)
+      onRefresh()
     }
   }
 
   const handleAddCard = async (columnId, title, description) => {
     try {
-      await api.cards.create(columnId, { title, description })
-      onRefresh()
+      applyLocally({ type: 'card.created', card: await api.cards.create(columnId, { title, description }) })
     } catch (e) {
       alert(e.message)
     }
@@ -92,25 +139,25 @@ export default function KanbanBoard({ board, onBack, onRefresh, error }) {
   const handleDeleteCard = async (cardId) => {
     try {
       await api.cards.delete(cardId)
-      onRefresh()
+      applyLocally({ type: 'card.deleted', card_id: cardId })
     } catch (e) {
       alert(e.message)
+      onRefresh()
     }
   }
 
   const handleUpdateCard = async (cardId, { title, description }) => {
     try {
-      await api.cards.update(cardId, { title, description })
-      onRefresh()
+      applyLocally({ type: 'card.updated', card: await api.cards.update(cardId, { title, description }) })
     } catch (e) {
       alert(e.message)
+      onRefresh()
     }
   }
 
   const handleAddColumn = async (name) => {
     try {
-      await api.columns.create(board.id, name)
-      onRefresh()
+      applyLocally({ type: 'column.created', column: await api.columns.create(board.id, name) })
     } catch (e) {
       alert(e.message)
     }